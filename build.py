@@ -314,6 +314,7 @@ class %(name)s(%(extends)s):
     """%(doc)s"""
     __uuid__ = '%(uuid)s'
     __wsmap__ = '%(wsmap)s'
+    __slots__ = ()
     %(event_id)s'''
 
 
@@ -625,7 +626,10 @@ def process_interface_method(node):
         out_p.insert(0, (name, atype, array))
 
     if inparams_raw:
-        in_p = ",\n%sin_p=[%s]" % (" " * 21, inparams_raw)
+        # _call only iterates in_p, a tuple is cheaper to build than a list.
+        if "," not in inparams_raw:
+            inparams_raw += ","
+        in_p = ",\n%sin_p=(%s)" % (" " * 21, inparams_raw)
     else:
         in_p = ""
 
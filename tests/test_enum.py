@@ -8,3 +8,12 @@ class TestEnumeration(unittest.TestCase):
         self.assertEqual(int(library.MachineState.paused), 6)
         self.assertEqual(str(library.MachineState.paused), "Paused")
         self.assertEqual(repr(library.MachineState.paused), "MachineState(6)")
+
+    def test_interned(self):
+        self.assertTrue(library.MachineState(6) is library.MachineState.paused)
+        self.assertRaises(ValueError, library.MachineState, 1000)
+
+    def test_hash(self):
+        states = {library.MachineState.paused: "paused"}
+        self.assertEqual(states[library.MachineState(6)], "paused")
+        self.assertEqual(states[6], "paused")
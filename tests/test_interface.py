@@ -0,0 +1,414 @@
+import unittest
+import weakref
+
+from virtualbox import library
+from virtualbox.library_ext import host as host_ext
+from virtualbox.library_base import cached_property
+from virtualbox.library_base import check_uuid
+from virtualbox.library_base import InterfaceList
+
+
+class FakeCOM(object):
+    def __init__(self, **attrs):
+        self.gets = 0
+        self.__dict__.update(attrs)
+
+
+class TestInterface(unittest.TestCase):
+    def test_slots(self):
+        machine = library.IMachine()
+        self.assertFalse(hasattr(machine, "__dict__"))
+        self.assertTrue(weakref.ref(machine)() is machine)
+
+    def test_extension_slots(self):
+        for interface in (
+            library.IConsole,
+            library.IVRDEServerInfo,
+            library.IHostNetworkInterface,
+            library.IGuestProcess,
+            library.IGuestFile,
+        ):
+            self.assertFalse(hasattr(interface(), "__dict__"))
+
+    def test_cached_property(self):
+        class Machine(library.IMachine):
+            __slots__ = ()
+
+            @cached_property
+            def name(self):
+                self._i.gets += 1
+                return self._get_attr("name")
+
+        com = FakeCOM(name="vm")
+        machine = Machine(com)
+        self.assertEqual(machine.name, "vm")
+        self.assertEqual(machine.name, "vm")
+        self.assertEqual(com.gets, 1)
+
+    def test_cached_process_attrs(self):
+        com = FakeCOM(executablePath="/bin/ls", PID=0)
+        process = library.IGuestProcess(com)
+        self.assertEqual(process.executable_path, "/bin/ls")
+        self.assertEqual(process.pid, 0)
+        com.executablePath = "/bin/sh"
+        com.PID = 42
+        self.assertEqual(process.executable_path, "/bin/ls")
+        self.assertEqual(process.pid, 42)
+
+    def test_interface_list(self):
+        raw = [FakeCOM(), FakeCOM(), FakeCOM()]
+        devices = InterfaceList(raw, library.IUSBDevice)
+        self.assertEqual(len(devices), 3)
+        self.assertTrue(devices[0] is devices[0])
+        self.assertTrue(devices[-1]._i is raw[2])
+        self.assertEqual([d._i for d in devices], raw)
+        self.assertRaises(IndexError, devices.__getitem__, 3)
+        self.assertRaises(IndexError, devices.__getitem__, -4)
+        self.assertEqual(devices, list(devices))
+        self.assertEqual(InterfaceList([], library.IUSBDevice), [])
+        self.assertEqual(devices + [None], list(devices) + [None])
+        self.assertEqual([None] + devices, [None] + list(devices))
+        self.assertEqual(len(devices + devices), 6)
+
+    def test_check_uuid(self):
+        check_uuid("0c8d3d2f-1f61-4e60-9b41-1c0f1d1f6f2a")
+        check_uuid("{0C8D3D2F-1F61-4E60-9B41-1C0F1D1F6F2A}")
+        for value in ("vm", "{0c8d3d2f-1f61-4e60-9b41-1c0f1d1f6f2a"):
+            self.assertRaises(library.OleErrorInvalidarg, check_uuid, value)
+
+    def test_guest_fs_query_cache(self):
+        class GuestSession(FakeCOM):
+            def fileExists(self, path, follow_symlinks):
+                self.gets += 1
+                return True
+
+            def fsObjRemove(self, path):
+                pass
+
+        com = GuestSession()
+        session = library.IGuestSession(com)
+        self.assertTrue(session.file_exists("/tmp/a"))
+        self.assertTrue(session.file_exists("/tmp/a"))
+        self.assertEqual(com.gets, 1)
+        session.fs_obj_remove("/tmp/a")
+        session.file_exists("/tmp/a")
+        self.assertEqual(com.gets, 2)
+
+    def test_usb_miss_cache(self):
+        class Console(FakeCOM):
+            def findUSBDeviceByAddress(self, name):
+                self.gets += 1
+                exc = Exception("not found")
+                exc.errno = library.VBoxErrorObjectNotFound.value
+                raise exc
+
+        com = Console()
+        console = library.IConsole(com)
+        errors = []
+        for _ in range(2):
+            try:
+                console.find_usb_device_by_address("usb1")
+            except library.VBoxErrorObjectNotFound as exc:
+                errors.append(exc)
+        self.assertEqual(len(errors), 2)
+        self.assertFalse(errors[0] is errors[1])
+        self.assertEqual(errors[1].value, errors[0].value)
+        self.assertEqual(com.gets, 1)
+        with self.assertRaises(TypeError) as cm:
+            console.find_usb_device_by_address(["usb1"])
+        self.assertIn("basestring", str(cm.exception))
+
+    def test_find_network_interface(self):
+        class Host(FakeCOM):
+            networkInterfaces = [FakeCOM(name="eth0"), FakeCOM(name="eth1")]
+
+            def findHostNetworkInterfaceByName(self, name):
+                self.gets += 1
+                return FakeCOM(name=name)
+
+        com = Host()
+        host = library.IHost(com)
+        self.assertEqual(host.find_host_network_interface_by_name("eth1").name, "eth1")
+        self.assertEqual(com.gets, 1)
+        interfaces = host.network_interfaces
+        host.find_host_network_interface_by_name("eth1")
+        self.assertEqual(com.gets, 2)
+        self.assertEqual([i.name for i in interfaces], ["eth0", "eth1"])
+        found = host.find_host_network_interface_by_name("eth1")
+        self.assertTrue(found is interfaces[1])
+        self.assertEqual(com.gets, 2)
+
+    def test_delete_snapshots_stops_on_failure(self):
+        class Progress(FakeCOM):
+            def waitForCompletion(self, timeout):
+                pass
+
+        class Machine(FakeCOM):
+            def deleteSnapshot(self, id_p):
+                self.gets += 1
+                return Progress(completed=True, resultCode=self.gets - 1)
+
+        com = Machine()
+        machine = library.IMachine(com)
+        ids = ["0c8d3d2f-1f61-4e60-9b41-1c0f1d1f6f2%d" % i for i in range(3)]
+        progresses = machine.delete_snapshots(ids)
+        self.assertEqual(len(progresses), 2)
+        self.assertEqual(progresses[-1].result_code, 1)
+        self.assertEqual(com.gets, 2)
+
+    def test_storage_bus_cache(self):
+        class SystemProperties(FakeCOM):
+            def getMaxPortCountForStorageBus(self, bus):
+                self.gets += 1
+                return 30
+
+        com = SystemProperties()
+        properties = library.ISystemProperties(com)
+        self.assertEqual(
+            properties.get_max_port_count_for_storage_bus(library.StorageBus.sata), 30
+        )
+        self.assertEqual(properties.get_max_port_count_for_storage_bus(2), 30)
+        self.assertEqual(com.gets, 1)
+        self.assertRaises(
+            TypeError, properties.get_max_port_count_for_storage_bus, "sata"
+        )
+        with self.assertRaises(TypeError) as cm:
+            properties.get_max_port_count_for_storage_bus([2])
+        self.assertIn("StorageBus", str(cm.exception))
+
+    def test_storage_bus_capabilities(self):
+        class SystemProperties(FakeCOM):
+            supportedStorageBuses = [1, 2]
+            supportedChipsetTypes = [1]
+
+            def __getattr__(self, name):
+                if not name.startswith(("getM", "getDeviceTypes")):
+                    raise AttributeError(name)
+
+                def method(*args):
+                    self.calls.append(name)
+                    return args[-1]
+
+                return method
+
+        com = SystemProperties(calls=[])
+        properties = library.ISystemProperties(com)
+        capabilities = properties.get_storage_bus_capabilities()
+        self.assertEqual(
+            capabilities,
+            {
+                (library.ChipsetType.piix3, library.StorageBus.ide): (1, 1, 1, 1),
+                (library.ChipsetType.piix3, library.StorageBus.sata): (2, 2, 2, 2),
+            },
+        )
+        self.assertEqual(len(com.calls), 8)
+        self.assertNotIn("getDeviceTypesForStorageBus", com.calls)
+        properties.get_storage_bus_capabilities()
+        self.assertEqual(len(com.calls), 8)
+
+    def test_network_interfaces_not_cached_while_changing(self):
+        class Progress(FakeCOM):
+            def waitForCompletion(self, timeout):
+                self.completed = True
+
+        class Host(FakeCOM):
+            @property
+            def networkInterfaces(self):
+                self.gets += 1
+                return [FakeCOM(name="eth0")]
+
+            def createHostOnlyNetworkInterface(self):
+                return self.progress, FakeCOM(name="vboxnet0")
+
+        com = Host(progress=Progress(completed=False))
+        host = library.IHost(com)
+        host.network_interfaces
+        host.network_interfaces
+        self.assertEqual(com.gets, 1)
+        host_interface, progress = host.create_host_only_network_interface()
+        host.network_interfaces
+        host.network_interfaces
+        self.assertEqual(com.gets, 3)
+        progress.wait_for_completion()
+        host.network_interfaces
+        host.network_interfaces
+        self.assertEqual(com.gets, 4)
+
+    def test_processor_value_type_check(self):
+        host = library.IHost(FakeCOM())
+        with self.assertRaises(TypeError) as cm:
+            host.get_processor_speed([1])
+        self.assertIn("baseinteger", str(cm.exception))
+
+    def test_host_find_cache(self):
+        class Host(FakeCOM):
+            def findHostDVDDrive(self, name):
+                self.gets += 1
+                return FakeCOM(name=name)
+
+            def insertUSBDeviceFilter(self, position, filter_p):
+                pass
+
+        now = [100.0]
+        monotonic = host_ext._monotonic
+        host_ext._monotonic = lambda: now[0]
+        self.addCleanup(setattr, host_ext, "_monotonic", monotonic)
+        com = Host()
+        host = library.IHost(com)
+        drive = host.find_host_dvd_drive("sr0")
+        self.assertTrue(host.find_host_dvd_drive("sr0") is drive)
+        self.assertEqual(com.gets, 1)
+        now[0] += host.find_ttl
+        host.find_host_dvd_drive("sr0")
+        self.assertEqual(com.gets, 2)
+        usb_filter = library.IHostUSBDeviceFilter(FakeCOM())
+        host.insert_usb_device_filter(0, usb_filter)
+        host.find_host_dvd_drive("sr0")
+        self.assertEqual(com.gets, 3)
+        self.assertRaises(TypeError, host.find_host_dvd_drive, ["sr0"])
+
+    def test_get_device_activity(self):
+        class Console(FakeCOM):
+            def getDeviceActivity(self, type_p):
+                self.type_p = type_p
+                return [1] * len(type_p)
+
+        com = Console()
+        console = library.IConsole(com)
+        activity = console.get_device_activity([3, library.DeviceType.network])
+        self.assertEqual(com.type_p, [3, 4])
+        self.assertEqual([type(a) for a in com.type_p], [int, int])
+        self.assertEqual(activity, [library.DeviceActivity.idle] * 2)
+        self.assertRaises(TypeError, console.get_device_activity, [True])
+        self.assertRaises(TypeError, console.get_device_activity, ["3"])
+
+    def test_environment_set_many(self):
+        com = FakeCOM(environmentChanges=["A=1", "B=2", "C"])
+        session = library.IGuestSession(com)
+        session.environment_set_many([("A", "3"), ("D", "4")])
+        self.assertEqual(com.environmentChanges, ["B=2", "C", "A=3", "D=4"])
+        session.environment_unset_many(["B"])
+        self.assertEqual(com.environmentChanges, ["C", "A=3", "D=4", "B"])
+        session.environment_set_many({"C": "5"})
+        self.assertEqual(com.environmentChanges, ["A=3", "D=4", "B", "C=5"])
+
+    def test_stat_many(self):
+        def vbox_exception(error):
+            exc = Exception(error.__name__)
+            exc.errno = error.value
+            return exc
+
+        class GuestSession(FakeCOM):
+            def fsObjQueryInfo(self, path, follow_symlinks):
+                if path == "/missing":
+                    raise vbox_exception(library.VBoxErrorObjectNotFound)
+                if path == "/bad":
+                    raise vbox_exception(library.OleErrorInvalidarg)
+                return FakeCOM(name=path)
+
+            def fsObjExists(self, path, follow_symlinks):
+                self.gets += 1
+                return path != "/missing"
+
+        com = GuestSession()
+        session = library.IGuestSession(com)
+        infos = session.stat_many(["/tmp", "/missing"])
+        self.assertEqual(infos[0].name, "/tmp")
+        self.assertTrue(infos[1] is None)
+        self.assertRaises(
+            library.OleErrorInvalidarg, session.stat_many, ["/tmp", "/bad"]
+        )
+        self.assertTrue(session.path_exists("/tmp"))
+        self.assertFalse(session.path_exists("/missing"))
+        self.assertEqual(com.gets, 2)
+
+    def test_copy_from_bytes(self):
+        class GuestFile(FakeCOM):
+            def read(self, to_read, timeout_ms):
+                self.reads.append(to_read)
+                if self.fail and len(self.reads) > 1:
+                    exc = Exception("read failed")
+                    exc.errno = library.VBoxErrorIprtError.value
+                    raise exc
+                chunk = self.data[:to_read]
+                self.data = self.data[to_read:]
+                return chunk
+
+            def close(self):
+                self.closed = True
+
+        class GuestSession(FakeCOM):
+            def fileOpen(self, path, access_mode, open_action, creation_mode):
+                return self.guest_file
+
+        guest_file = GuestFile(data=b"abcdefg", reads=[], fail=False, closed=False)
+        session = library.IGuestSession(GuestSession(guest_file=guest_file))
+        self.assertEqual(session.copy_from_bytes("/tmp/a", chunk_size=3), b"abcdefg")
+        self.assertEqual(guest_file.reads, [3, 3, 3, 3])
+        self.assertTrue(guest_file.closed)
+
+        guest_file = GuestFile(data=b"abcdefg", reads=[], fail=True, closed=False)
+        session = library.IGuestSession(GuestSession(guest_file=guest_file))
+        self.assertRaises(
+            library.VBoxErrorIprtError, session.copy_from_bytes, "/tmp/a", chunk_size=3
+        )
+        self.assertTrue(guest_file.closed)
+
+    def test_directory_create_parents(self):
+        class GuestSession(FakeCOM):
+            def directoryCreate(self, path, mode, flags):
+                self.created.append((path, mode, flags))
+
+        com = GuestSession(created=[])
+        session = library.IGuestSession(com)
+        parents = int(library.DirectoryCreateFlag.parents)
+        session.directory_create("/a", 0o755, [])
+        session.directory_create("/a/b/c", 0o755, [], parents=True)
+        session.directory_create("/a/b/d", 0o755, [library.DirectoryCreateFlag.parents])
+        session.makedirs("/x/y")
+        self.assertEqual(
+            com.created,
+            [
+                ("/a", 0o755, []),
+                ("/a/b/c", 0o755, [parents]),
+                ("/a/b/d", 0o755, [parents]),
+                ("/x/y", 0x777, [parents]),
+            ],
+        )
+
+    def test_host_processor_cache(self):
+        class Host(FakeCOM):
+            @property
+            def processorCount(self):
+                self.calls.append("processorCount")
+                return 2
+
+            @property
+            def memorySize(self):
+                self.calls.append("memorySize")
+                return 4096
+
+            def getProcessorSpeed(self, cpu_id):
+                self.calls.append("getProcessorSpeed")
+                return 2000 + cpu_id
+
+            def getProcessorDescription(self, cpu_id):
+                self.calls.append("getProcessorDescription")
+                return "cpu%d" % cpu_id
+
+            def getProcessorCPUIDLeaf(self, cpu_id, leaf, sub_leaf):
+                self.calls.append("getProcessorCPUIDLeaf")
+                return (leaf, sub_leaf, 0, 0)
+
+        com = Host(calls=[])
+        host = library.IHost(com)
+        for _ in range(2):
+            self.assertEqual(host.processor_info, [(2000, "cpu0"), (2001, "cpu1")])
+            self.assertEqual(
+                host.get_processor_cpuid_leaves(0, [(0, 0), (1, 0)]),
+                {(0, 0): (0, 0, 0, 0), (1, 0): (1, 0, 0, 0)},
+            )
+            self.assertEqual(host.memory_size, 4096)
+        self.assertEqual(len(com.calls), 8)
+        self.assertEqual(com.calls.count("processorCount"), 1)
+        self.assertEqual(com.calls.count("getProcessorCPUIDLeaf"), 2)
@@ -0,0 +1,34 @@
+import unittest
+
+from virtualbox import library
+
+
+class FakeProgress(object):
+    def __init__(self, polls):
+        self.polls = polls
+
+    @property
+    def completed(self):
+        self.polls -= 1
+        return self.polls <= 0
+
+
+class TestProgress(unittest.TestCase):
+    def test_wait_for_all(self):
+        progresses = [library.IProgress(FakeProgress(n)) for n in (1, 3)]
+        self.assertEqual(library.IProgress.wait_for_all(progresses, interval=0), [])
+
+    def test_wait_for_all_timeout(self):
+        progress = library.IProgress(FakeProgress(1000))
+        pending = library.IProgress.wait_for_all([progress], timeout=0, interval=0)
+        self.assertEqual(pending, [progress])
+
+    def test_poll_cache(self):
+        fake = FakeProgress(1000)
+        progress = library.IProgress(fake)
+        self.assertFalse(progress.completed)
+        self.assertFalse(progress.completed)
+        self.assertEqual(fake.polls, 999)
+        progress._forget_polled()
+        self.assertFalse(progress.completed)
+        self.assertEqual(fake.polls, 998)
@@ -8974,6 +8974,7 @@ class IVirtualBoxErrorInfo(Interface):
 
     __uuid__ = "c1bcc6d5-7966-481d-ab0b-d0ed73e28135"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def result_code(self):
@@ -9058,6 +9059,7 @@ class INATNetwork(Interface):
 
     __uuid__ = "4fdebbf0-be30-49c0-b315-e9749e1bded1"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def network_name(self):
@@ -9204,7 +9206,7 @@ class INATNetwork(Interface):
             raise TypeError("hostid can only be an instance of type basestring")
         if not isinstance(offset, baseinteger):
             raise TypeError("offset can only be an instance of type baseinteger")
-        self._call("addLocalMapping", in_p=[hostid, offset])
+        self._call("addLocalMapping", in_p=(hostid, offset))
 
     @property
     def loopback_ip6(self):
@@ -9273,7 +9275,7 @@ class INATNetwork(Interface):
             raise TypeError("guest_port can only be an instance of type baseinteger")
         self._call(
             "addPortForwardRule",
-            in_p=[is_ipv6, rule_name, proto, host_ip, host_port, guest_ip, guest_port],
+            in_p=(is_ipv6, rule_name, proto, host_ip, host_port, guest_ip, guest_port),
         )
 
     def remove_port_forward_rule(self, i_sipv6, rule_name):
@@ -9288,7 +9290,7 @@ class INATNetwork(Interface):
             raise TypeError("i_sipv6 can only be an instance of type bool")
         if not isinstance(rule_name, basestring):
             raise TypeError("rule_name can only be an instance of type basestring")
-        self._call("removePortForwardRule", in_p=[i_sipv6, rule_name])
+        self._call("removePortForwardRule", in_p=(i_sipv6, rule_name))
 
     def start(self):
         """"""
@@ -9307,6 +9309,7 @@ class ICloudNetwork(Interface):
 
     __uuid__ = "d8e3496e-735f-4fde-8a54-427d49409b5f"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def network_name(self):
@@ -9388,6 +9391,7 @@ class IDHCPServer(Interface):
 
     __uuid__ = "cadef0a2-a1a9-4ac2-8e80-c049af69dac8"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def event_source(self):
@@ -9506,7 +9510,7 @@ class IDHCPServer(Interface):
             raise TypeError("to_ip_address can only be an instance of type basestring")
         self._call(
             "setConfiguration",
-            in_p=[ip_address, network_mask, from_ip_address, to_ip_address],
+            in_p=(ip_address, network_mask, from_ip_address, to_ip_address),
         )
 
     def start(self, trunk_name, trunk_type):
@@ -9526,7 +9530,7 @@ class IDHCPServer(Interface):
             raise TypeError("trunk_name can only be an instance of type basestring")
         if not isinstance(trunk_type, basestring):
             raise TypeError("trunk_type can only be an instance of type basestring")
-        self._call("start", in_p=[trunk_name, trunk_type])
+        self._call("start", in_p=(trunk_name, trunk_type))
 
     def stop(self):
         """Stops DHCP server process.
@@ -9582,7 +9586,7 @@ class IDHCPServer(Interface):
         if not isinstance(type_p, baseinteger):
             raise TypeError("type_p can only be an instance of type baseinteger")
         (address, state, issued, expire) = self._call(
-            "findLeaseByMAC", in_p=[mac, type_p]
+            "findLeaseByMAC", in_p=(mac, type_p)
         )
         return (address, state, issued, expire)
 
@@ -9619,7 +9623,7 @@ class IDHCPServer(Interface):
             raise TypeError("slot can only be an instance of type baseinteger")
         if not isinstance(may_add, bool):
             raise TypeError("may_add can only be an instance of type bool")
-        config = self._call("getConfig", in_p=[scope, name, slot, may_add])
+        config = self._call("getConfig", in_p=(scope, name, slot, may_add))
         config = IDHCPConfig(config)
         return config
 
@@ -9633,6 +9637,7 @@ class IDHCPConfig(Interface):
 
     __uuid__ = "00f4a8dc-0002-4b81-0077-1dcb004571ba"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def scope(self):
@@ -9739,7 +9744,7 @@ class IDHCPConfig(Interface):
             )
         if not isinstance(value, basestring):
             raise TypeError("value can only be an instance of type basestring")
-        self._call("setOption", in_p=[option, encoding, value])
+        self._call("setOption", in_p=(option, encoding, value))
 
     def remove_option(self, option):
         """Removes the given DHCP option.
@@ -9749,7 +9754,7 @@ class IDHCPConfig(Interface):
         """
         if not isinstance(option, DHCPOption):
             raise TypeError("option can only be an instance of type DHCPOption")
-        self._call("removeOption", in_p=[option])
+        self._call("removeOption", in_p=(option,))
 
     def remove_all_options(self):
         """Removes all the options.
@@ -9778,7 +9783,7 @@ class IDHCPConfig(Interface):
         """
         if not isinstance(option, DHCPOption):
             raise TypeError("option can only be an instance of type DHCPOption")
-        (value, encoding) = self._call("getOption", in_p=[option])
+        (value, encoding) = self._call("getOption", in_p=(option,))
         encoding = DHCPOptionEncoding(encoding)
         return (value, encoding)
 
@@ -9816,6 +9821,7 @@ class IDHCPGlobalConfig(IDHCPConfig):
 
     __uuid__ = "46735de7-f4c4-4020-a185-0d2881bcfa8b"
     __wsmap__ = "managed"
+    __slots__ = ()
 
 
 class IDHCPGroupCondition(Interface):
@@ -9825,6 +9831,7 @@ class IDHCPGroupCondition(Interface):
 
     __uuid__ = "5ca9e537-5a1d-43f1-6f27-6a0db298a9a8"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def inclusive(self):
@@ -9880,6 +9887,7 @@ class IDHCPGroupConfig(IDHCPConfig):
 
     __uuid__ = "537707f7-ebf9-4d5c-7aea-877bfc4256ba"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def name(self):
@@ -9926,7 +9934,7 @@ class IDHCPGroupConfig(IDHCPConfig):
             )
         if not isinstance(value, basestring):
             raise TypeError("value can only be an instance of type basestring")
-        condition = self._call("addCondition", in_p=[inclusive, type_p, value])
+        condition = self._call("addCondition", in_p=(inclusive, type_p, value))
         condition = IDHCPGroupCondition(condition)
         return condition
 
@@ -9943,6 +9951,7 @@ class IDHCPIndividualConfig(IDHCPConfig):
 
     __uuid__ = "c40c2b86-73a5-46cc-8227-93fe57d006a6"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def mac_address(self):
@@ -10009,6 +10018,7 @@ class IVirtualBox(Interface):
 
     __uuid__ = "d0a0163f-e254-4e5b-a1f2-011cf991c38d"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def version(self):
@@ -10343,7 +10353,7 @@ class IVirtualBox(Interface):
         if not isinstance(base_folder, basestring):
             raise TypeError("base_folder can only be an instance of type basestring")
         file_p = self._call(
-            "composeMachineFilename", in_p=[name, group, create_flags, base_folder]
+            "composeMachineFilename", in_p=(name, group, create_flags, base_folder)
         )
         return file_p
 
@@ -10460,7 +10470,7 @@ class IVirtualBox(Interface):
         if not isinstance(flags, basestring):
             raise TypeError("flags can only be an instance of type basestring")
         machine = self._call(
-            "createMachine", in_p=[settings_file, name, groups, os_type_id, flags]
+            "createMachine", in_p=(settings_file, name, groups, os_type_id, flags)
         )
         machine = IMachine(machine)
         return machine
@@ -10491,7 +10501,7 @@ class IVirtualBox(Interface):
         """
         if not isinstance(settings_file, basestring):
             raise TypeError("settings_file can only be an instance of type basestring")
-        machine = self._call("openMachine", in_p=[settings_file])
+        machine = self._call("openMachine", in_p=(settings_file,))
         machine = IMachine(machine)
         return machine
 
@@ -10517,7 +10527,7 @@ class IVirtualBox(Interface):
         """
         if not isinstance(machine, IMachine):
             raise TypeError("machine can only be an instance of type IMachine")
-        self._call("registerMachine", in_p=[machine])
+        self._call("registerMachine", in_p=(machine,))
 
     def find_machine(self, name_or_id):
         """Attempts to find a virtual machine given its name or UUID.
@@ -10537,7 +10547,7 @@ class IVirtualBox(Interface):
         """
         if not isinstance(name_or_id, basestring):
             raise TypeError("name_or_id can only be an instance of type basestring")
-        machine = self._call("findMachine", in_p=[name_or_id])
+        machine = self._call("findMachine", in_p=(name_or_id,))
         machine = IMachine(machine)
         return machine
 
@@ -10558,7 +10568,7 @@ class IVirtualBox(Interface):
         for a in groups[:10]:
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
-        machines = self._call("getMachinesByGroups", in_p=[groups])
+        machines = self._call("getMachinesByGroups", in_p=(groups,))
         machines = [IMachine(a) for a in machines]
         return machines
 
@@ -10577,7 +10587,7 @@ class IVirtualBox(Interface):
         for a in machines[:10]:
             if not isinstance(a, IMachine):
                 raise TypeError("array can only contain objects of type IMachine")
-        states = self._call("getMachineStates", in_p=[machines])
+        states = self._call("getMachineStates", in_p=(machines,))
         states = [MachineState(a) for a in states]
         return states
 
@@ -10686,7 +10696,7 @@ class IVirtualBox(Interface):
                 "a_device_type_type can only be an instance of type DeviceType"
             )
         medium = self._call(
-            "createMedium", in_p=[format_p, location, access_mode, a_device_type_type]
+            "createMedium", in_p=(format_p, location, access_mode, a_device_type_type)
         )
         medium = IMedium(medium)
         return medium
@@ -10789,7 +10799,7 @@ class IVirtualBox(Interface):
         if not isinstance(force_new_uuid, bool):
             raise TypeError("force_new_uuid can only be an instance of type bool")
         medium = self._call(
-            "openMedium", in_p=[location, device_type, access_mode, force_new_uuid]
+            "openMedium", in_p=(location, device_type, access_mode, force_new_uuid)
         )
         medium = IMedium(medium)
         return medium
@@ -10824,7 +10834,7 @@ class IVirtualBox(Interface):
         """
         if not isinstance(id_p, basestring):
             raise TypeError("id_p can only be an instance of type basestring")
-        type_p = self._call("getGuestOSType", in_p=[id_p])
+        type_p = self._call("getGuestOSType", in_p=(id_p,))
         type_p = IGuestOSType(type_p)
         return type_p
 
@@ -10872,7 +10882,7 @@ class IVirtualBox(Interface):
             )
         self._call(
             "createSharedFolder",
-            in_p=[name, host_path, writable, automount, auto_mount_point],
+            in_p=(name, host_path, writable, automount, auto_mount_point),
         )
 
     def remove_shared_folder(self, name):
@@ -10889,7 +10899,7 @@ class IVirtualBox(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        self._call("removeSharedFolder", in_p=[name])
+        self._call("removeSharedFolder", in_p=(name,))
 
     def get_extra_data_keys(self):
         """Returns an array representing the global extra data keys which currently
@@ -10923,7 +10933,7 @@ class IVirtualBox(Interface):
         """
         if not isinstance(key, basestring):
             raise TypeError("key can only be an instance of type basestring")
-        value = self._call("getExtraData", in_p=[key])
+        value = self._call("getExtraData", in_p=(key,))
         return value
 
     def set_extra_data(self, key, value):
@@ -10971,7 +10981,7 @@ class IVirtualBox(Interface):
             raise TypeError("key can only be an instance of type basestring")
         if not isinstance(value, basestring):
             raise TypeError("value can only be an instance of type basestring")
-        self._call("setExtraData", in_p=[key, value])
+        self._call("setExtraData", in_p=(key, value))
 
     def set_settings_secret(self, password):
         """Unlocks the secret data by passing the unlock password to the
@@ -10986,7 +10996,7 @@ class IVirtualBox(Interface):
         """
         if not isinstance(password, basestring):
             raise TypeError("password can only be an instance of type basestring")
-        self._call("setSettingsSecret", in_p=[password])
+        self._call("setSettingsSecret", in_p=(password,))
 
     def create_dhcp_server(self, name):
         """Creates a DHCP server settings to be used for the given internal network name
@@ -11003,7 +11013,7 @@ class IVirtualBox(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        server = self._call("createDHCPServer", in_p=[name])
+        server = self._call("createDHCPServer", in_p=(name,))
         server = IDHCPServer(server)
         return server
 
@@ -11022,7 +11032,7 @@ class IVirtualBox(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        server = self._call("findDHCPServerByNetworkName", in_p=[name])
+        server = self._call("findDHCPServerByNetworkName", in_p=(name,))
         server = IDHCPServer(server)
         return server
 
@@ -11038,7 +11048,7 @@ class IVirtualBox(Interface):
         """
         if not isinstance(server, IDHCPServer):
             raise TypeError("server can only be an instance of type IDHCPServer")
-        self._call("removeDHCPServer", in_p=[server])
+        self._call("removeDHCPServer", in_p=(server,))
 
     def create_nat_network(self, network_name):
         """
@@ -11050,7 +11060,7 @@ class IVirtualBox(Interface):
         """
         if not isinstance(network_name, basestring):
             raise TypeError("network_name can only be an instance of type basestring")
-        network = self._call("createNATNetwork", in_p=[network_name])
+        network = self._call("createNATNetwork", in_p=(network_name,))
         network = INATNetwork(network)
         return network
 
@@ -11064,7 +11074,7 @@ class IVirtualBox(Interface):
         """
         if not isinstance(network_name, basestring):
             raise TypeError("network_name can only be an instance of type basestring")
-        network = self._call("findNATNetworkByName", in_p=[network_name])
+        network = self._call("findNATNetworkByName", in_p=(network_name,))
         network = INATNetwork(network)
         return network
 
@@ -11076,7 +11086,7 @@ class IVirtualBox(Interface):
         """
         if not isinstance(network, INATNetwork):
             raise TypeError("network can only be an instance of type INATNetwork")
-        self._call("removeNATNetwork", in_p=[network])
+        self._call("removeNATNetwork", in_p=(network,))
 
     def create_cloud_network(self, network_name):
         """
@@ -11088,7 +11098,7 @@ class IVirtualBox(Interface):
         """
         if not isinstance(network_name, basestring):
             raise TypeError("network_name can only be an instance of type basestring")
-        network = self._call("createCloudNetwork", in_p=[network_name])
+        network = self._call("createCloudNetwork", in_p=(network_name,))
         network = ICloudNetwork(network)
         return network
 
@@ -11102,7 +11112,7 @@ class IVirtualBox(Interface):
         """
         if not isinstance(network_name, basestring):
             raise TypeError("network_name can only be an instance of type basestring")
-        network = self._call("findCloudNetworkByName", in_p=[network_name])
+        network = self._call("findCloudNetworkByName", in_p=(network_name,))
         network = ICloudNetwork(network)
         return network
 
@@ -11114,7 +11124,7 @@ class IVirtualBox(Interface):
         """
         if not isinstance(network, ICloudNetwork):
             raise TypeError("network can only be an instance of type ICloudNetwork")
-        self._call("removeCloudNetwork", in_p=[network])
+        self._call("removeCloudNetwork", in_p=(network,))
 
     def check_firmware_present(self, firmware_type, version):
         """Check if this VirtualBox installation has a firmware
@@ -11145,7 +11155,7 @@ class IVirtualBox(Interface):
         if not isinstance(version, basestring):
             raise TypeError("version can only be an instance of type basestring")
         (result, url, file_p) = self._call(
-            "checkFirmwarePresent", in_p=[firmware_type, version]
+            "checkFirmwarePresent", in_p=(firmware_type, version)
         )
         return (result, url, file_p)
 
@@ -11160,6 +11170,7 @@ class IVFSExplorer(Interface):
 
     __uuid__ = "fb220201-2fd3-47e2-a5dc-2c2431d833cc"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def path(self):
@@ -11202,7 +11213,7 @@ class IVFSExplorer(Interface):
         """
         if not isinstance(dir_p, basestring):
             raise TypeError("dir_p can only be an instance of type basestring")
-        progress = self._call("cd", in_p=[dir_p])
+        progress = self._call("cd", in_p=(dir_p,))
         progress = IProgress(progress)
         return progress
 
@@ -11253,7 +11264,7 @@ class IVFSExplorer(Interface):
         for a in names[:10]:
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
-        exists = self._call("exists", in_p=[names])
+        exists = self._call("exists", in_p=(names,))
         return exists
 
     def remove(self, names):
@@ -11271,7 +11282,7 @@ class IVFSExplorer(Interface):
         for a in names[:10]:
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
-        progress = self._call("remove", in_p=[names])
+        progress = self._call("remove", in_p=(names,))
         progress = IProgress(progress)
         return progress
 
@@ -11283,6 +11294,7 @@ class ICertificate(Interface):
 
     __uuid__ = "392f1de4-80e1-4a8a-93a1-67c5f92a838a"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def version_number(self):
@@ -11475,7 +11487,7 @@ class ICertificate(Interface):
         """
         if not isinstance(what, baseinteger):
             raise TypeError("what can only be an instance of type baseinteger")
-        result = self._call("queryInfo", in_p=[what])
+        result = self._call("queryInfo", in_p=(what,))
         return result
 
 
@@ -11556,6 +11568,7 @@ class IAppliance(Interface):
 
     __uuid__ = "86a98347-7619-41aa-aece-b21ac5c1a7e6"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def path(self):
@@ -11655,7 +11668,7 @@ class IAppliance(Interface):
         """
         if not isinstance(file_p, basestring):
             raise TypeError("file_p can only be an instance of type basestring")
-        progress = self._call("read", in_p=[file_p])
+        progress = self._call("read", in_p=(file_p,))
         progress = IProgress(progress)
         return progress
 
@@ -11704,7 +11717,7 @@ class IAppliance(Interface):
         for a in options[:10]:
             if not isinstance(a, ImportOptions):
                 raise TypeError("array can only contain objects of type ImportOptions")
-        progress = self._call("importMachines", in_p=[options])
+        progress = self._call("importMachines", in_p=(options,))
         progress = IProgress(progress)
         return progress
 
@@ -11719,7 +11732,7 @@ class IAppliance(Interface):
         """
         if not isinstance(uri, basestring):
             raise TypeError("uri can only be an instance of type basestring")
-        explorer = self._call("createVFSExplorer", in_p=[uri])
+        explorer = self._call("createVFSExplorer", in_p=(uri,))
         explorer = IVFSExplorer(explorer)
         return explorer
 
@@ -11761,7 +11774,7 @@ class IAppliance(Interface):
                 raise TypeError("array can only contain objects of type ExportOptions")
         if not isinstance(path, basestring):
             raise TypeError("path can only be an instance of type basestring")
-        progress = self._call("write", in_p=[format_p, options, path])
+        progress = self._call("write", in_p=(format_p, options, path))
         progress = IProgress(progress)
         return progress
 
@@ -11797,7 +11810,7 @@ class IAppliance(Interface):
         """
         if not isinstance(password_id, basestring):
             raise TypeError("password_id can only be an instance of type basestring")
-        identifiers = self._call("getMediumIdsForPasswordId", in_p=[password_id])
+        identifiers = self._call("getMediumIdsForPasswordId", in_p=(password_id,))
         return identifiers
 
     def add_passwords(self, identifiers, passwords):
@@ -11821,7 +11834,7 @@ class IAppliance(Interface):
         for a in passwords[:10]:
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
-        self._call("addPasswords", in_p=[identifiers, passwords])
+        self._call("addPasswords", in_p=(identifiers, passwords))
 
     def create_virtual_system_descriptions(self, requested):
         """Creates a number of :py:class:`IVirtualSystemDescription`  objects and store them
@@ -11836,7 +11849,7 @@ class IAppliance(Interface):
         """
         if not isinstance(requested, baseinteger):
             raise TypeError("requested can only be an instance of type baseinteger")
-        created = self._call("createVirtualSystemDescriptions", in_p=[requested])
+        created = self._call("createVirtualSystemDescriptions", in_p=(requested,))
         return created
 
 
@@ -11852,6 +11865,7 @@ class IVirtualSystemDescription(Interface):
 
     __uuid__ = "01510f40-c196-4d26-b8db-4c8c389f1f82"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def count(self):
@@ -12011,7 +12025,7 @@ class IVirtualSystemDescription(Interface):
                 "type_p can only be an instance of type VirtualSystemDescriptionType"
             )
         (types, refs, ovf_values, v_box_values, extra_config_values) = self._call(
-            "getDescriptionByType", in_p=[type_p]
+            "getDescriptionByType", in_p=(type_p,)
         )
         types = [VirtualSystemDescriptionType(a) for a in types]
         return (types, refs, ovf_values, v_box_values, extra_config_values)
@@ -12026,7 +12040,7 @@ class IVirtualSystemDescription(Interface):
             raise TypeError(
                 "type_p can only be an instance of type VirtualSystemDescriptionType"
             )
-        self._call("removeDescriptionByType", in_p=[type_p])
+        self._call("removeDescriptionByType", in_p=(type_p,))
 
     def get_values_by_type(self, type_p, which):
         """This is the same as :py:func:`get_description_by_type`  except that you can specify which
@@ -12048,7 +12062,7 @@ class IVirtualSystemDescription(Interface):
             raise TypeError(
                 "which can only be an instance of type VirtualSystemDescriptionValueType"
             )
-        values = self._call("getValuesByType", in_p=[type_p, which])
+        values = self._call("getValuesByType", in_p=(type_p, which))
         return values
 
     def set_final_values(self, enabled, v_box_values, extra_config_values):
@@ -12090,7 +12104,7 @@ class IVirtualSystemDescription(Interface):
         for a in extra_config_values[:10]:
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
-        self._call("setFinalValues", in_p=[enabled, v_box_values, extra_config_values])
+        self._call("setFinalValues", in_p=(enabled, v_box_values, extra_config_values))
 
     def add_description(self, type_p, v_box_value, extra_config_value):
         """This method adds an additional description entry to the stack of already
@@ -12115,7 +12129,7 @@ class IVirtualSystemDescription(Interface):
             raise TypeError(
                 "extra_config_value can only be an instance of type basestring"
             )
-        self._call("addDescription", in_p=[type_p, v_box_value, extra_config_value])
+        self._call("addDescription", in_p=(type_p, v_box_value, extra_config_value))
 
 
 class IUnattended(Interface):
@@ -12146,6 +12160,7 @@ class IUnattended(Interface):
 
     __uuid__ = "6f89464f-7193-426c-a41f-522e8f537fa0"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def iso_path(self):
@@ -12704,6 +12719,7 @@ class IInternalMachineControl(Interface):
 
     __uuid__ = "0075FD6C-00C2-4484-0077-C057003D9C90"
     __wsmap__ = "suppress"
+    __slots__ = ()
 
     def update_state(self, state):
         """Updates the VM state.
@@ -12717,7 +12733,7 @@ class IInternalMachineControl(Interface):
         """
         if not isinstance(state, MachineState):
             raise TypeError("state can only be an instance of type MachineState")
-        self._call("updateState", in_p=[state])
+        self._call("updateState", in_p=(state,))
 
     def begin_power_up(self, progress):
         """Tells VBoxSVC that :py:func:`IConsole.power_up`  is under ways and
@@ -12733,7 +12749,7 @@ class IInternalMachineControl(Interface):
         """
         if not isinstance(progress, IProgress):
             raise TypeError("progress can only be an instance of type IProgress")
-        self._call("beginPowerUp", in_p=[progress])
+        self._call("beginPowerUp", in_p=(progress,))
 
     def end_power_up(self, result):
         """Tells VBoxSVC that :py:func:`IConsole.power_up`  has completed.
@@ -12747,7 +12763,7 @@ class IInternalMachineControl(Interface):
         """
         if not isinstance(result, baseinteger):
             raise TypeError("result can only be an instance of type baseinteger")
-        self._call("endPowerUp", in_p=[result])
+        self._call("endPowerUp", in_p=(result,))
 
     def begin_powering_down(self):
         """Called by the VM process to inform the server it wants to
@@ -12784,7 +12800,7 @@ class IInternalMachineControl(Interface):
             raise TypeError("result can only be an instance of type baseinteger")
         if not isinstance(err_msg, basestring):
             raise TypeError("err_msg can only be an instance of type basestring")
-        self._call("endPoweringDown", in_p=[result, err_msg])
+        self._call("endPoweringDown", in_p=(result, err_msg))
 
     def run_usb_device_filters(self, device):
         """Asks the server to run USB devices filters of the associated
@@ -12804,7 +12820,7 @@ class IInternalMachineControl(Interface):
         """
         if not isinstance(device, IUSBDevice):
             raise TypeError("device can only be an instance of type IUSBDevice")
-        (matched, masked_interfaces) = self._call("runUSBDeviceFilters", in_p=[device])
+        (matched, masked_interfaces) = self._call("runUSBDeviceFilters", in_p=(device,))
         return (matched, masked_interfaces)
 
     def capture_usb_device(self, id_p, capture_filename):
@@ -12824,7 +12840,7 @@ class IInternalMachineControl(Interface):
             raise TypeError(
                 "capture_filename can only be an instance of type basestring"
             )
-        self._call("captureUSBDevice", in_p=[id_p, capture_filename])
+        self._call("captureUSBDevice", in_p=(id_p, capture_filename))
 
     def detach_usb_device(self, id_p, done):
         """Notification that a VM is going to detach (@a done = @c false) or has
@@ -12846,7 +12862,7 @@ class IInternalMachineControl(Interface):
             raise TypeError("id_p can only be an instance of type basestring")
         if not isinstance(done, bool):
             raise TypeError("done can only be an instance of type bool")
-        self._call("detachUSBDevice", in_p=[id_p, done])
+        self._call("detachUSBDevice", in_p=(id_p, done))
 
     def auto_capture_usb_devices(self):
         """Requests a capture all matching USB devices attached to the host.
@@ -12873,7 +12889,7 @@ class IInternalMachineControl(Interface):
         """
         if not isinstance(done, bool):
             raise TypeError("done can only be an instance of type bool")
-        self._call("detachAllUSBDevices", in_p=[done])
+        self._call("detachAllUSBDevices", in_p=(done,))
 
     def on_session_end(self, session):
         """Triggered by the given session object when the session is about
@@ -12890,7 +12906,7 @@ class IInternalMachineControl(Interface):
         """
         if not isinstance(session, ISession):
             raise TypeError("session can only be an instance of type ISession")
-        progress = self._call("onSessionEnd", in_p=[session])
+        progress = self._call("onSessionEnd", in_p=(session,))
         progress = IProgress(progress)
         return progress
 
@@ -12940,7 +12956,7 @@ class IInternalMachineControl(Interface):
         for a in parms[:10]:
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
-        id_p = self._call("clipboardAreaRegister", in_p=[parms])
+        id_p = self._call("clipboardAreaRegister", in_p=(parms,))
         return id_p
 
     def clipboard_area_unregister(self, id_p):
@@ -12952,7 +12968,7 @@ class IInternalMachineControl(Interface):
         """
         if not isinstance(id_p, baseinteger):
             raise TypeError("id_p can only be an instance of type baseinteger")
-        self._call("clipboardAreaUnregister", in_p=[id_p])
+        self._call("clipboardAreaUnregister", in_p=(id_p,))
 
     def clipboard_area_attach(self, id_p):
         """Attaches to a registered clipboard area.
@@ -12963,7 +12979,7 @@ class IInternalMachineControl(Interface):
         """
         if not isinstance(id_p, baseinteger):
             raise TypeError("id_p can only be an instance of type baseinteger")
-        self._call("clipboardAreaAttach", in_p=[id_p])
+        self._call("clipboardAreaAttach", in_p=(id_p,))
 
     def clipboard_area_detach(self, id_p):
         """Detaches from a registered clipboard area.
@@ -12974,7 +12990,7 @@ class IInternalMachineControl(Interface):
         """
         if not isinstance(id_p, baseinteger):
             raise TypeError("id_p can only be an instance of type baseinteger")
-        self._call("clipboardAreaDetach", in_p=[id_p])
+        self._call("clipboardAreaDetach", in_p=(id_p,))
 
     def clipboard_area_get_most_recent(self):
         """Returns the most recent (last registered) clipboard area.
@@ -12998,7 +13014,7 @@ class IInternalMachineControl(Interface):
         """
         if not isinstance(id_p, baseinteger):
             raise TypeError("id_p can only be an instance of type baseinteger")
-        refcount = self._call("clipboardAreaGetRefCount", in_p=[id_p])
+        refcount = self._call("clipboardAreaGetRefCount", in_p=(id_p,))
         return refcount
 
     def push_guest_property(self, name, value, timestamp, flags):
@@ -13025,7 +13041,7 @@ class IInternalMachineControl(Interface):
             raise TypeError("timestamp can only be an instance of type baseinteger")
         if not isinstance(flags, basestring):
             raise TypeError("flags can only be an instance of type basestring")
-        self._call("pushGuestProperty", in_p=[name, value, timestamp, flags])
+        self._call("pushGuestProperty", in_p=(name, value, timestamp, flags))
 
     def lock_media(self):
         """Locks all media attached to the machine for writing and parents of
@@ -13065,7 +13081,7 @@ class IInternalMachineControl(Interface):
             raise TypeError(
                 "attachment can only be an instance of type IMediumAttachment"
             )
-        new_attachment = self._call("ejectMedium", in_p=[attachment])
+        new_attachment = self._call("ejectMedium", in_p=(attachment,))
         new_attachment = IMediumAttachment(new_attachment)
         return new_attachment
 
@@ -13182,7 +13198,7 @@ class IInternalMachineControl(Interface):
             raise TypeError("vm_net_tx can only be an instance of type baseinteger")
         self._call(
             "reportVmStatistics",
-            in_p=[
+            in_p=(
                 valid_stats,
                 cpu_user,
                 cpu_kernel,
@@ -13199,7 +13215,7 @@ class IInternalMachineControl(Interface):
                 mem_shared_total,
                 vm_net_rx,
                 vm_net_tx,
-            ],
+            ),
         )
 
     def authenticate_external(self, auth_params):
@@ -13217,7 +13233,7 @@ class IInternalMachineControl(Interface):
         for a in auth_params[:10]:
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
-        result = self._call("authenticateExternal", in_p=[auth_params])
+        result = self._call("authenticateExternal", in_p=(auth_params,))
         return result
 
 
@@ -13229,6 +13245,7 @@ class IGraphicsAdapter(Interface):
 
     __uuid__ = "f692806f-febe-4049-b476-1292a8e45b09"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def graphics_controller_type(self):
@@ -13314,6 +13331,7 @@ class IBIOSSettings(Interface):
 
     __uuid__ = "73af4152-7e67-4144-bf34-41c38e8b4cc7"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def logo_fade_in(self):
@@ -13499,6 +13517,7 @@ class IRecordingScreenSettings(Interface):
 
     __uuid__ = "678fbd9a-93af-42a7-7f13-79ad6ef1a18d"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     def is_feature_enabled(self, feature):
         """Returns whether a particular recording feature is enabled for this
@@ -13513,7 +13532,7 @@ class IRecordingScreenSettings(Interface):
         """
         if not isinstance(feature, RecordingFeature):
             raise TypeError("feature can only be an instance of type RecordingFeature")
-        enabled = self._call("isFeatureEnabled", in_p=[feature])
+        enabled = self._call("isFeatureEnabled", in_p=(feature,))
         return enabled
 
     @property
@@ -13831,6 +13850,7 @@ class IRecordingSettings(Interface):
 
     __uuid__ = "D88F2A5A-47C7-4A3F-AAE1-1B516817DB41"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     def get_screen_settings(self, screen_id):
         """Returns the recording settings for a particular screen.
@@ -13844,7 +13864,7 @@ class IRecordingSettings(Interface):
         """
         if not isinstance(screen_id, baseinteger):
             raise TypeError("screen_id can only be an instance of type baseinteger")
-        record_screen_settings = self._call("getScreenSettings", in_p=[screen_id])
+        record_screen_settings = self._call("getScreenSettings", in_p=(screen_id,))
         record_screen_settings = IRecordingScreenSettings(record_screen_settings)
         return record_screen_settings
 
@@ -13880,6 +13900,7 @@ class IPCIAddress(Interface):
 
     __uuid__ = "c984d15f-e191-400b-840e-970f3dad7296"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def bus(self):
@@ -13940,7 +13961,7 @@ class IPCIAddress(Interface):
         """
         if not isinstance(number, baseinteger):
             raise TypeError("number can only be an instance of type baseinteger")
-        self._call("fromLong", in_p=[number])
+        self._call("fromLong", in_p=(number,))
 
 
 class IPCIDeviceAttachment(Interface):
@@ -13950,6 +13971,7 @@ class IPCIDeviceAttachment(Interface):
 
     __uuid__ = "91f33d6f-e621-4f70-a77e-15f0e3c714d5"
     __wsmap__ = "struct"
+    __slots__ = ()
 
     @property
     def name(self):
@@ -14023,6 +14045,7 @@ class IMachine(Interface):
 
     __uuid__ = "85632c68-b5bb-4316-a900-5eb28d3413df"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def parent(self):
@@ -15236,7 +15259,7 @@ class IMachine(Interface):
             raise TypeError("session can only be an instance of type ISession")
         if not isinstance(lock_type, LockType):
             raise TypeError("lock_type can only be an instance of type LockType")
-        self._call("lockMachine", in_p=[session, lock_type])
+        self._call("lockMachine", in_p=(session, lock_type))
 
     def launch_vm_process(self, session, name, environment_changes):
         """Spawns a new process that will execute the virtual machine and obtains a shared
@@ -15347,7 +15370,7 @@ class IMachine(Interface):
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
         progress = self._call(
-            "launchVMProcess", in_p=[session, name, environment_changes]
+            "launchVMProcess", in_p=(session, name, environment_changes)
         )
         progress = IProgress(progress)
         return progress
@@ -15380,7 +15403,7 @@ class IMachine(Interface):
             raise TypeError("position can only be an instance of type baseinteger")
         if not isinstance(device, DeviceType):
             raise TypeError("device can only be an instance of type DeviceType")
-        self._call("setBootOrder", in_p=[position, device])
+        self._call("setBootOrder", in_p=(position, device))
 
     def get_boot_order(self, position):
         """Returns the device type that occupies the specified
@@ -15410,7 +15433,7 @@ class IMachine(Interface):
         """
         if not isinstance(position, baseinteger):
             raise TypeError("position can only be an instance of type baseinteger")
-        device = self._call("getBootOrder", in_p=[position])
+        device = self._call("getBootOrder", in_p=(position,))
         device = DeviceType(device)
         return device
 
@@ -15514,7 +15537,7 @@ class IMachine(Interface):
             raise TypeError("type_p can only be an instance of type DeviceType")
         if not isinstance(medium, IMedium):
             raise TypeError("medium can only be an instance of type IMedium")
-        self._call("attachDevice", in_p=[name, controller_port, device, type_p, medium])
+        self._call("attachDevice", in_p=(name, controller_port, device, type_p, medium))
 
     def attach_device_without_medium(self, name, controller_port, device, type_p):
         """Attaches a device and optionally mounts a medium to the given storage
@@ -15608,7 +15631,7 @@ class IMachine(Interface):
         if not isinstance(type_p, DeviceType):
             raise TypeError("type_p can only be an instance of type DeviceType")
         self._call(
-            "attachDeviceWithoutMedium", in_p=[name, controller_port, device, type_p]
+            "attachDeviceWithoutMedium", in_p=(name, controller_port, device, type_p)
         )
 
     def detach_device(self, name, controller_port, device):
@@ -15659,7 +15682,7 @@ class IMachine(Interface):
             )
         if not isinstance(device, baseinteger):
             raise TypeError("device can only be an instance of type baseinteger")
-        self._call("detachDevice", in_p=[name, controller_port, device])
+        self._call("detachDevice", in_p=(name, controller_port, device))
 
     def passthrough_device(self, name, controller_port, device, passthrough):
         """Sets the passthrough mode of an existing DVD device. Changing the
@@ -15704,7 +15727,7 @@ class IMachine(Interface):
         if not isinstance(passthrough, bool):
             raise TypeError("passthrough can only be an instance of type bool")
         self._call(
-            "passthroughDevice", in_p=[name, controller_port, device, passthrough]
+            "passthroughDevice", in_p=(name, controller_port, device, passthrough)
         )
 
     def temporary_eject_device(self, name, controller_port, device, temporary_eject):
@@ -15751,7 +15774,7 @@ class IMachine(Interface):
             raise TypeError("temporary_eject can only be an instance of type bool")
         self._call(
             "temporaryEjectDevice",
-            in_p=[name, controller_port, device, temporary_eject],
+            in_p=(name, controller_port, device, temporary_eject),
         )
 
     def non_rotational_device(self, name, controller_port, device, non_rotational):
@@ -15800,7 +15823,7 @@ class IMachine(Interface):
         if not isinstance(non_rotational, bool):
             raise TypeError("non_rotational can only be an instance of type bool")
         self._call(
-            "nonRotationalDevice", in_p=[name, controller_port, device, non_rotational]
+            "nonRotationalDevice", in_p=(name, controller_port, device, non_rotational)
         )
 
     def set_auto_discard_for_device(self, name, controller_port, device, discard):
@@ -15849,7 +15872,7 @@ class IMachine(Interface):
         if not isinstance(discard, bool):
             raise TypeError("discard can only be an instance of type bool")
         self._call(
-            "setAutoDiscardForDevice", in_p=[name, controller_port, device, discard]
+            "setAutoDiscardForDevice", in_p=(name, controller_port, device, discard)
         )
 
     def set_hot_pluggable_for_device(
@@ -15902,7 +15925,7 @@ class IMachine(Interface):
             raise TypeError("hot_pluggable can only be an instance of type bool")
         self._call(
             "setHotPluggableForDevice",
-            in_p=[name, controller_port, device, hot_pluggable],
+            in_p=(name, controller_port, device, hot_pluggable),
         )
 
     def set_bandwidth_group_for_device(
@@ -15951,7 +15974,7 @@ class IMachine(Interface):
             )
         self._call(
             "setBandwidthGroupForDevice",
-            in_p=[name, controller_port, device, bandwidth_group],
+            in_p=(name, controller_port, device, bandwidth_group),
         )
 
     def set_no_bandwidth_group_for_device(self, name, controller_port, device):
@@ -15988,7 +16011,7 @@ class IMachine(Interface):
             )
         if not isinstance(device, baseinteger):
             raise TypeError("device can only be an instance of type baseinteger")
-        self._call("setNoBandwidthGroupForDevice", in_p=[name, controller_port, device])
+        self._call("setNoBandwidthGroupForDevice", in_p=(name, controller_port, device))
 
     def unmount_medium(self, name, controller_port, device, force):
         """Unmounts any currently mounted medium (:py:class:`IMedium` ,
@@ -16048,7 +16071,7 @@ class IMachine(Interface):
             raise TypeError("device can only be an instance of type baseinteger")
         if not isinstance(force, bool):
             raise TypeError("force can only be an instance of type bool")
-        self._call("unmountMedium", in_p=[name, controller_port, device, force])
+        self._call("unmountMedium", in_p=(name, controller_port, device, force))
 
     def mount_medium(self, name, controller_port, device, medium, force):
         """Mounts a medium (:py:class:`IMedium` , identified
@@ -16112,7 +16135,7 @@ class IMachine(Interface):
             raise TypeError("medium can only be an instance of type IMedium")
         if not isinstance(force, bool):
             raise TypeError("force can only be an instance of type bool")
-        self._call("mountMedium", in_p=[name, controller_port, device, medium, force])
+        self._call("mountMedium", in_p=(name, controller_port, device, medium, force))
 
     def get_medium(self, name, controller_port, device):
         """Returns the virtual medium attached to a device slot of the specified
@@ -16148,7 +16171,7 @@ class IMachine(Interface):
             )
         if not isinstance(device, baseinteger):
             raise TypeError("device can only be an instance of type baseinteger")
-        medium = self._call("getMedium", in_p=[name, controller_port, device])
+        medium = self._call("getMedium", in_p=(name, controller_port, device))
         medium = IMedium(medium)
         return medium
 
@@ -16166,7 +16189,7 @@ class IMachine(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        medium_attachments = self._call("getMediumAttachmentsOfController", in_p=[name])
+        medium_attachments = self._call("getMediumAttachmentsOfController", in_p=(name,))
         medium_attachments = [IMediumAttachment(a) for a in medium_attachments]
         return medium_attachments
 
@@ -16195,7 +16218,7 @@ class IMachine(Interface):
         if not isinstance(device, baseinteger):
             raise TypeError("device can only be an instance of type baseinteger")
         attachment = self._call(
-            "getMediumAttachment", in_p=[name, controller_port, device]
+            "getMediumAttachment", in_p=(name, controller_port, device)
         )
         attachment = IMediumAttachment(attachment)
         return attachment
@@ -16241,7 +16264,7 @@ class IMachine(Interface):
             raise TypeError("try_to_unbind can only be an instance of type bool")
         self._call(
             "attachHostPCIDevice",
-            in_p=[host_address, desired_guest_address, try_to_unbind],
+            in_p=(host_address, desired_guest_address, try_to_unbind),
         )
 
     def detach_host_pci_device(self, host_address):
@@ -16270,7 +16293,7 @@ class IMachine(Interface):
         """
         if not isinstance(host_address, baseinteger):
             raise TypeError("host_address can only be an instance of type baseinteger")
-        self._call("detachHostPCIDevice", in_p=[host_address])
+        self._call("detachHostPCIDevice", in_p=(host_address,))
 
     def get_network_adapter(self, slot):
         """Returns the network adapter associated with the given slot.
@@ -16289,7 +16312,7 @@ class IMachine(Interface):
         """
         if not isinstance(slot, baseinteger):
             raise TypeError("slot can only be an instance of type baseinteger")
-        adapter = self._call("getNetworkAdapter", in_p=[slot])
+        adapter = self._call("getNetworkAdapter", in_p=(slot,))
         adapter = INetworkAdapter(adapter)
         return adapter
 
@@ -16326,7 +16349,7 @@ class IMachine(Interface):
             raise TypeError(
                 "connection_type can only be an instance of type StorageBus"
             )
-        controller = self._call("addStorageController", in_p=[name, connection_type])
+        controller = self._call("addStorageController", in_p=(name, connection_type))
         controller = IStorageController(controller)
         return controller
 
@@ -16343,7 +16366,7 @@ class IMachine(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        storage_controller = self._call("getStorageControllerByName", in_p=[name])
+        storage_controller = self._call("getStorageControllerByName", in_p=(name,))
         storage_controller = IStorageController(storage_controller)
         return storage_controller
 
@@ -16368,7 +16391,7 @@ class IMachine(Interface):
         if not isinstance(instance, baseinteger):
             raise TypeError("instance can only be an instance of type baseinteger")
         storage_controller = self._call(
-            "getStorageControllerByInstance", in_p=[connection_type, instance]
+            "getStorageControllerByInstance", in_p=(connection_type, instance)
         )
         storage_controller = IStorageController(storage_controller)
         return storage_controller
@@ -16388,7 +16411,7 @@ class IMachine(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        self._call("removeStorageController", in_p=[name])
+        self._call("removeStorageController", in_p=(name,))
 
     def set_storage_controller_bootable(self, name, bootable):
         """Sets the bootable flag of the storage controller with the given name.
@@ -16408,7 +16431,7 @@ class IMachine(Interface):
             raise TypeError("name can only be an instance of type basestring")
         if not isinstance(bootable, bool):
             raise TypeError("bootable can only be an instance of type bool")
-        self._call("setStorageControllerBootable", in_p=[name, bootable])
+        self._call("setStorageControllerBootable", in_p=(name, bootable))
 
     def add_usb_controller(self, name, type_p):
         """Adds a new USB controller to the machine and returns it as an instance of
@@ -16431,7 +16454,7 @@ class IMachine(Interface):
             raise TypeError("name can only be an instance of type basestring")
         if not isinstance(type_p, USBControllerType):
             raise TypeError("type_p can only be an instance of type USBControllerType")
-        controller = self._call("addUSBController", in_p=[name, type_p])
+        controller = self._call("addUSBController", in_p=(name, type_p))
         controller = IUSBController(controller)
         return controller
 
@@ -16446,7 +16469,7 @@ class IMachine(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        self._call("removeUSBController", in_p=[name])
+        self._call("removeUSBController", in_p=(name,))
 
     def get_usb_controller_by_name(self, name):
         """Returns a USB controller with the given type.
@@ -16461,7 +16484,7 @@ class IMachine(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        controller = self._call("getUSBControllerByName", in_p=[name])
+        controller = self._call("getUSBControllerByName", in_p=(name,))
         controller = IUSBController(controller)
         return controller
 
@@ -16475,7 +16498,7 @@ class IMachine(Interface):
         """
         if not isinstance(type_p, USBControllerType):
             raise TypeError("type_p can only be an instance of type USBControllerType")
-        controllers = self._call("getUSBControllerCountByType", in_p=[type_p])
+        controllers = self._call("getUSBControllerCountByType", in_p=(type_p,))
         return controllers
 
     def get_serial_port(self, slot):
@@ -16495,7 +16518,7 @@ class IMachine(Interface):
         """
         if not isinstance(slot, baseinteger):
             raise TypeError("slot can only be an instance of type baseinteger")
-        port = self._call("getSerialPort", in_p=[slot])
+        port = self._call("getSerialPort", in_p=(slot,))
         port = ISerialPort(port)
         return port
 
@@ -16516,7 +16539,7 @@ class IMachine(Interface):
         """
         if not isinstance(slot, baseinteger):
             raise TypeError("slot can only be an instance of type baseinteger")
-        port = self._call("getParallelPort", in_p=[slot])
+        port = self._call("getParallelPort", in_p=(slot,))
         port = IParallelPort(port)
         return port
 
@@ -16552,7 +16575,7 @@ class IMachine(Interface):
         """
         if not isinstance(key, basestring):
             raise TypeError("key can only be an instance of type basestring")
-        value = self._call("getExtraData", in_p=[key])
+        value = self._call("getExtraData", in_p=(key,))
         return value
 
     def set_extra_data(self, key, value):
@@ -16602,7 +16625,7 @@ class IMachine(Interface):
             raise TypeError("key can only be an instance of type basestring")
         if not isinstance(value, basestring):
             raise TypeError("value can only be an instance of type basestring")
-        self._call("setExtraData", in_p=[key, value])
+        self._call("setExtraData", in_p=(key, value))
 
     def get_cpu_property(self, property_p):
         """Returns the virtual CPU boolean value of the specified property.
@@ -16621,7 +16644,7 @@ class IMachine(Interface):
             raise TypeError(
                 "property_p can only be an instance of type CPUPropertyType"
             )
-        value = self._call("getCPUProperty", in_p=[property_p])
+        value = self._call("getCPUProperty", in_p=(property_p,))
         return value
 
     def set_cpu_property(self, property_p, value):
@@ -16643,7 +16666,7 @@ class IMachine(Interface):
             )
         if not isinstance(value, bool):
             raise TypeError("value can only be an instance of type bool")
-        self._call("setCPUProperty", in_p=[property_p, value])
+        self._call("setCPUProperty", in_p=(property_p, value))
 
     def get_cpuid_leaf_by_ordinal(self, ordinal):
         """Used to enumerate CPUID information override values.
@@ -16676,7 +16699,7 @@ class IMachine(Interface):
         if not isinstance(ordinal, baseinteger):
             raise TypeError("ordinal can only be an instance of type baseinteger")
         (idx, idx_sub, val_eax, val_ebx, val_ecx, val_edx) = self._call(
-            "getCPUIDLeafByOrdinal", in_p=[ordinal]
+            "getCPUIDLeafByOrdinal", in_p=(ordinal,)
         )
         return (idx, idx_sub, val_eax, val_ebx, val_ecx, val_edx)
 
@@ -16718,7 +16741,7 @@ class IMachine(Interface):
         if not isinstance(idx_sub, baseinteger):
             raise TypeError("idx_sub can only be an instance of type baseinteger")
         (val_eax, val_ebx, val_ecx, val_edx) = self._call(
-            "getCPUIDLeaf", in_p=[idx, idx_sub]
+            "getCPUIDLeaf", in_p=(idx, idx_sub)
         )
         return (val_eax, val_ebx, val_ecx, val_edx)
 
@@ -16777,7 +16800,7 @@ class IMachine(Interface):
         if not isinstance(val_edx, baseinteger):
             raise TypeError("val_edx can only be an instance of type baseinteger")
         self._call(
-            "setCPUIDLeaf", in_p=[idx, idx_sub, val_eax, val_ebx, val_ecx, val_edx]
+            "setCPUIDLeaf", in_p=(idx, idx_sub, val_eax, val_ebx, val_ecx, val_edx)
         )
 
     def remove_cpuid_leaf(self, idx, idx_sub):
@@ -16798,7 +16821,7 @@ class IMachine(Interface):
             raise TypeError("idx can only be an instance of type baseinteger")
         if not isinstance(idx_sub, baseinteger):
             raise TypeError("idx_sub can only be an instance of type baseinteger")
-        self._call("removeCPUIDLeaf", in_p=[idx, idx_sub])
+        self._call("removeCPUIDLeaf", in_p=(idx, idx_sub))
 
     def remove_all_cpuid_leaves(self):
         """Removes all the virtual CPU cpuid leaves"""
@@ -16821,7 +16844,7 @@ class IMachine(Interface):
             raise TypeError(
                 "property_p can only be an instance of type HWVirtExPropertyType"
             )
-        value = self._call("getHWVirtExProperty", in_p=[property_p])
+        value = self._call("getHWVirtExProperty", in_p=(property_p,))
         return value
 
     def set_hw_virt_ex_property(self, property_p, value):
@@ -16843,7 +16866,7 @@ class IMachine(Interface):
             )
         if not isinstance(value, bool):
             raise TypeError("value can only be an instance of type bool")
-        self._call("setHWVirtExProperty", in_p=[property_p, value])
+        self._call("setHWVirtExProperty", in_p=(property_p, value))
 
     def set_settings_file_path(self, settings_file_path):
         """Currently, it is an error to change this property on any machine.
@@ -16873,7 +16896,7 @@ class IMachine(Interface):
             raise TypeError(
                 "settings_file_path can only be an instance of type basestring"
             )
-        progress = self._call("setSettingsFilePath", in_p=[settings_file_path])
+        progress = self._call("setSettingsFilePath", in_p=(settings_file_path,))
         progress = IProgress(progress)
         return progress
 
@@ -17006,7 +17029,7 @@ class IMachine(Interface):
         """
         if not isinstance(cleanup_mode, CleanupMode):
             raise TypeError("cleanup_mode can only be an instance of type CleanupMode")
-        media = self._call("unregister", in_p=[cleanup_mode])
+        media = self._call("unregister", in_p=(cleanup_mode,))
         media = [IMedium(a) for a in media]
         return media
 
@@ -17062,7 +17085,7 @@ class IMachine(Interface):
         for a in media[:10]:
             if not isinstance(a, IMedium):
                 raise TypeError("array can only contain objects of type IMedium")
-        progress = self._call("deleteConfig", in_p=[media])
+        progress = self._call("deleteConfig", in_p=(media,))
         progress = IProgress(progress)
         return progress
 
@@ -17084,7 +17107,7 @@ class IMachine(Interface):
             raise TypeError("appliance can only be an instance of type IAppliance")
         if not isinstance(location, basestring):
             raise TypeError("location can only be an instance of type basestring")
-        description = self._call("exportTo", in_p=[appliance, location])
+        description = self._call("exportTo", in_p=(appliance, location))
         description = IVirtualSystemDescription(description)
         return description
 
@@ -17109,7 +17132,7 @@ class IMachine(Interface):
         """
         if not isinstance(name_or_id, basestring):
             raise TypeError("name_or_id can only be an instance of type basestring")
-        snapshot = self._call("findSnapshot", in_p=[name_or_id])
+        snapshot = self._call("findSnapshot", in_p=(name_or_id,))
         snapshot = ISnapshot(snapshot)
         return snapshot
 
@@ -17160,7 +17183,7 @@ class IMachine(Interface):
             )
         self._call(
             "createSharedFolder",
-            in_p=[name, host_path, writable, automount, auto_mount_point],
+            in_p=(name, host_path, writable, automount, auto_mount_point),
         )
 
     def remove_shared_folder(self, name):
@@ -17180,7 +17203,7 @@ class IMachine(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        self._call("removeSharedFolder", in_p=[name])
+        self._call("removeSharedFolder", in_p=(name,))
 
     def can_show_console_window(self):
         """Returns @c true if the VM console process can activate the
@@ -17253,7 +17276,7 @@ class IMachine(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        (value, timestamp, flags) = self._call("getGuestProperty", in_p=[name])
+        (value, timestamp, flags) = self._call("getGuestProperty", in_p=(name,))
         return (value, timestamp, flags)
 
     def get_guest_property_value(self, property_p):
@@ -17272,7 +17295,7 @@ class IMachine(Interface):
         """
         if not isinstance(property_p, basestring):
             raise TypeError("property_p can only be an instance of type basestring")
-        value = self._call("getGuestPropertyValue", in_p=[property_p])
+        value = self._call("getGuestPropertyValue", in_p=(property_p,))
         return value
 
     def get_guest_property_timestamp(self, property_p):
@@ -17291,7 +17314,7 @@ class IMachine(Interface):
         """
         if not isinstance(property_p, basestring):
             raise TypeError("property_p can only be an instance of type basestring")
-        value = self._call("getGuestPropertyTimestamp", in_p=[property_p])
+        value = self._call("getGuestPropertyTimestamp", in_p=(property_p,))
         return value
 
     def set_guest_property(self, property_p, value, flags):
@@ -17330,7 +17353,7 @@ class IMachine(Interface):
             raise TypeError("value can only be an instance of type basestring")
         if not isinstance(flags, basestring):
             raise TypeError("flags can only be an instance of type basestring")
-        self._call("setGuestProperty", in_p=[property_p, value, flags])
+        self._call("setGuestProperty", in_p=(property_p, value, flags))
 
     def set_guest_property_value(self, property_p, value):
         """Sets or changes a value in the machine's guest property
@@ -17359,7 +17382,7 @@ class IMachine(Interface):
             raise TypeError("property_p can only be an instance of type basestring")
         if not isinstance(value, basestring):
             raise TypeError("value can only be an instance of type basestring")
-        self._call("setGuestPropertyValue", in_p=[property_p, value])
+        self._call("setGuestPropertyValue", in_p=(property_p, value))
 
     def delete_guest_property(self, name):
         """Deletes an entry from the machine's guest property store.
@@ -17373,7 +17396,7 @@ class IMachine(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        self._call("deleteGuestProperty", in_p=[name])
+        self._call("deleteGuestProperty", in_p=(name,))
 
     def enumerate_guest_properties(self, patterns):
         """Return a list of the guest properties matching a set of patterns along
@@ -17402,7 +17425,7 @@ class IMachine(Interface):
         if not isinstance(patterns, basestring):
             raise TypeError("patterns can only be an instance of type basestring")
         (names, values, timestamps, flags) = self._call(
-            "enumerateGuestProperties", in_p=[patterns]
+            "enumerateGuestProperties", in_p=(patterns,)
         )
         return (names, values, timestamps, flags)
 
@@ -17431,7 +17454,7 @@ class IMachine(Interface):
         if not isinstance(screen_id, baseinteger):
             raise TypeError("screen_id can only be an instance of type baseinteger")
         (origin_x, origin_y, width, height, enabled) = self._call(
-            "querySavedGuestScreenInfo", in_p=[screen_id]
+            "querySavedGuestScreenInfo", in_p=(screen_id,)
         )
         return (origin_x, origin_y, width, height, enabled)
 
@@ -17461,7 +17484,7 @@ class IMachine(Interface):
                 "bitmap_format can only be an instance of type BitmapFormat"
             )
         (data, width, height) = self._call(
-            "readSavedThumbnailToArray", in_p=[screen_id, bitmap_format]
+            "readSavedThumbnailToArray", in_p=(screen_id, bitmap_format)
         )
         return (data, width, height)
 
@@ -17484,7 +17507,7 @@ class IMachine(Interface):
         if not isinstance(screen_id, baseinteger):
             raise TypeError("screen_id can only be an instance of type baseinteger")
         (bitmap_formats, width, height) = self._call(
-            "querySavedScreenshotInfo", in_p=[screen_id]
+            "querySavedScreenshotInfo", in_p=(screen_id,)
         )
         bitmap_formats = [BitmapFormat(a) for a in bitmap_formats]
         return (bitmap_formats, width, height)
@@ -17515,7 +17538,7 @@ class IMachine(Interface):
                 "bitmap_format can only be an instance of type BitmapFormat"
             )
         (data, width, height) = self._call(
-            "readSavedScreenshotToArray", in_p=[screen_id, bitmap_format]
+            "readSavedScreenshotToArray", in_p=(screen_id, bitmap_format)
         )
         return (data, width, height)
 
@@ -17528,7 +17551,7 @@ class IMachine(Interface):
         """
         if not isinstance(cpu, baseinteger):
             raise TypeError("cpu can only be an instance of type baseinteger")
-        self._call("hotPlugCPU", in_p=[cpu])
+        self._call("hotPlugCPU", in_p=(cpu,))
 
     def hot_unplug_cpu(self, cpu):
         """Removes a CPU from the machine.
@@ -17539,7 +17562,7 @@ class IMachine(Interface):
         """
         if not isinstance(cpu, baseinteger):
             raise TypeError("cpu can only be an instance of type baseinteger")
-        self._call("hotUnplugCPU", in_p=[cpu])
+        self._call("hotUnplugCPU", in_p=(cpu,))
 
     def get_cpu_status(self, cpu):
         """Returns the current status of the given CPU.
@@ -17553,7 +17576,7 @@ class IMachine(Interface):
         """
         if not isinstance(cpu, baseinteger):
             raise TypeError("cpu can only be an instance of type baseinteger")
-        attached = self._call("getCPUStatus", in_p=[cpu])
+        attached = self._call("getCPUStatus", in_p=(cpu,))
         return attached
 
     def get_effective_paravirt_provider(self):
@@ -17580,7 +17603,7 @@ class IMachine(Interface):
         """
         if not isinstance(idx, baseinteger):
             raise TypeError("idx can only be an instance of type baseinteger")
-        filename = self._call("queryLogFilename", in_p=[idx])
+        filename = self._call("queryLogFilename", in_p=(idx,))
         return filename
 
     def read_log(self, idx, offset, size):
@@ -17609,7 +17632,7 @@ class IMachine(Interface):
             raise TypeError("offset can only be an instance of type baseinteger")
         if not isinstance(size, baseinteger):
             raise TypeError("size can only be an instance of type baseinteger")
-        data = self._call("readLog", in_p=[idx, offset, size])
+        data = self._call("readLog", in_p=(idx, offset, size))
         return data
 
     def clone_to(self, target, mode, options):
@@ -17651,7 +17674,7 @@ class IMachine(Interface):
         for a in options[:10]:
             if not isinstance(a, CloneOptions):
                 raise TypeError("array can only contain objects of type CloneOptions")
-        progress = self._call("cloneTo", in_p=[target, mode, options])
+        progress = self._call("cloneTo", in_p=(target, mode, options))
         progress = IProgress(progress)
         return progress
 
@@ -17679,7 +17702,7 @@ class IMachine(Interface):
             raise TypeError("folder can only be an instance of type basestring")
         if not isinstance(type_p, basestring):
             raise TypeError("type_p can only be an instance of type basestring")
-        progress = self._call("moveTo", in_p=[folder, type_p])
+        progress = self._call("moveTo", in_p=(folder, type_p))
         progress = IProgress(progress)
         return progress
 
@@ -17760,7 +17783,7 @@ class IMachine(Interface):
             raise TypeError(
                 "saved_state_file can only be an instance of type basestring"
             )
-        self._call("adoptSavedState", in_p=[saved_state_file])
+        self._call("adoptSavedState", in_p=(saved_state_file,))
 
     def discard_saved_state(self, f_remove_file):
         """Forcibly resets the machine to "Powered Off" state if it is
@@ -17788,7 +17811,7 @@ class IMachine(Interface):
         """
         if not isinstance(f_remove_file, bool):
             raise TypeError("f_remove_file can only be an instance of type bool")
-        self._call("discardSavedState", in_p=[f_remove_file])
+        self._call("discardSavedState", in_p=(f_remove_file,))
 
     def take_snapshot(self, name, description, pause):
         """Saves the current execution state
@@ -17839,7 +17862,7 @@ class IMachine(Interface):
             raise TypeError("description can only be an instance of type basestring")
         if not isinstance(pause, bool):
             raise TypeError("pause can only be an instance of type bool")
-        (progress, id_p) = self._call("takeSnapshot", in_p=[name, description, pause])
+        (progress, id_p) = self._call("takeSnapshot", in_p=(name, description, pause))
         progress = IProgress(progress)
         return (progress, id_p)
 
@@ -17913,7 +17936,7 @@ class IMachine(Interface):
         """
         if not isinstance(id_p, basestring):
             raise TypeError("id_p can only be an instance of type basestring")
-        progress = self._call("deleteSnapshot", in_p=[id_p])
+        progress = self._call("deleteSnapshot", in_p=(id_p,))
         progress = IProgress(progress)
         return progress
 
@@ -17949,7 +17972,7 @@ class IMachine(Interface):
         """
         if not isinstance(id_p, basestring):
             raise TypeError("id_p can only be an instance of type basestring")
-        progress = self._call("deleteSnapshotAndAllChildren", in_p=[id_p])
+        progress = self._call("deleteSnapshotAndAllChildren", in_p=(id_p,))
         progress = IProgress(progress)
         return progress
 
@@ -17992,7 +18015,7 @@ class IMachine(Interface):
             raise TypeError("start_id can only be an instance of type basestring")
         if not isinstance(end_id, basestring):
             raise TypeError("end_id can only be an instance of type basestring")
-        progress = self._call("deleteSnapshotRange", in_p=[start_id, end_id])
+        progress = self._call("deleteSnapshotRange", in_p=(start_id, end_id))
         progress = IProgress(progress)
         return progress
 
@@ -18033,7 +18056,7 @@ class IMachine(Interface):
         """
         if not isinstance(snapshot, ISnapshot):
             raise TypeError("snapshot can only be an instance of type ISnapshot")
-        progress = self._call("restoreSnapshot", in_p=[snapshot])
+        progress = self._call("restoreSnapshot", in_p=(snapshot,))
         progress = IProgress(progress)
         return progress
 
@@ -18064,7 +18087,7 @@ class IMachine(Interface):
         """
         if not isinstance(flags, basestring):
             raise TypeError("flags can only be an instance of type basestring")
-        self._call("applyDefaults", in_p=[flags])
+        self._call("applyDefaults", in_p=(flags,))
 
 
 class IEmulatedUSB(Interface):
@@ -18074,6 +18097,7 @@ class IEmulatedUSB(Interface):
 
     __uuid__ = "6e253ee8-477a-2497-6759-88b8292a5af0"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     def webcam_attach(self, path, settings):
         """Attaches the emulated USB webcam to the VM, which will use a host video capture device.
@@ -18089,7 +18113,7 @@ class IEmulatedUSB(Interface):
             raise TypeError("path can only be an instance of type basestring")
         if not isinstance(settings, basestring):
             raise TypeError("settings can only be an instance of type basestring")
-        self._call("webcamAttach", in_p=[path, settings])
+        self._call("webcamAttach", in_p=(path, settings))
 
     def webcam_detach(self, path):
         """Detaches the emulated USB webcam from the VM
@@ -18100,7 +18124,7 @@ class IEmulatedUSB(Interface):
         """
         if not isinstance(path, basestring):
             raise TypeError("path can only be an instance of type basestring")
-        self._call("webcamDetach", in_p=[path])
+        self._call("webcamDetach", in_p=(path,))
 
     @property
     def webcams(self):
@@ -18119,6 +18143,7 @@ class IVRDEServerInfo(Interface):
 
     __uuid__ = "c39ef4d6-7532-45e8-96da-eb5986ae76e4"
     __wsmap__ = "struct"
+    __slots__ = ()
 
     @property
     def active(self):
@@ -18267,6 +18292,7 @@ class IConsole(Interface):
 
     __uuid__ = "872da645-4a9b-1727-bee2-5585105b9eed"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def machine(self):
@@ -18629,7 +18655,7 @@ class IConsole(Interface):
         for a in type_p[:10]:
             if not isinstance(a, DeviceType):
                 raise TypeError("array can only contain objects of type DeviceType")
-        activity = self._call("getDeviceActivity", in_p=[type_p])
+        activity = self._call("getDeviceActivity", in_p=(type_p,))
         activity = [DeviceActivity(a) for a in activity]
         return activity
 
@@ -18669,7 +18695,7 @@ class IConsole(Interface):
             raise TypeError(
                 "capture_filename can only be an instance of type basestring"
             )
-        self._call("attachUSBDevice", in_p=[id_p, capture_filename])
+        self._call("attachUSBDevice", in_p=(id_p, capture_filename))
 
     def detach_usb_device(self, id_p):
         """Detaches an USB device with the given UUID from the USB controller
@@ -18698,7 +18724,7 @@ class IConsole(Interface):
         """
         if not isinstance(id_p, basestring):
             raise TypeError("id_p can only be an instance of type basestring")
-        device = self._call("detachUSBDevice", in_p=[id_p])
+        device = self._call("detachUSBDevice", in_p=(id_p,))
         device = IUSBDevice(device)
         return device
 
@@ -18722,7 +18748,7 @@ class IConsole(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        device = self._call("findUSBDeviceByAddress", in_p=[name])
+        device = self._call("findUSBDeviceByAddress", in_p=(name,))
         device = IUSBDevice(device)
         return device
 
@@ -18745,7 +18771,7 @@ class IConsole(Interface):
         """
         if not isinstance(id_p, basestring):
             raise TypeError("id_p can only be an instance of type basestring")
-        device = self._call("findUSBDeviceById", in_p=[id_p])
+        device = self._call("findUSBDeviceById", in_p=(id_p,))
         device = IUSBDevice(device)
         return device
 
@@ -18796,7 +18822,7 @@ class IConsole(Interface):
             )
         self._call(
             "createSharedFolder",
-            in_p=[name, host_path, writable, automount, auto_mount_point],
+            in_p=(name, host_path, writable, automount, auto_mount_point),
         )
 
     def remove_shared_folder(self, name):
@@ -18816,7 +18842,7 @@ class IConsole(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        self._call("removeSharedFolder", in_p=[name])
+        self._call("removeSharedFolder", in_p=(name,))
 
     def teleport(self, hostname, tcpport, password, max_downtime):
         """Teleport the VM to a different host machine or process.
@@ -18860,7 +18886,7 @@ class IConsole(Interface):
         if not isinstance(max_downtime, baseinteger):
             raise TypeError("max_downtime can only be an instance of type baseinteger")
         progress = self._call(
-            "teleport", in_p=[hostname, tcpport, password, max_downtime]
+            "teleport", in_p=(hostname, tcpport, password, max_downtime)
         )
         progress = IProgress(progress)
         return progress
@@ -18890,7 +18916,7 @@ class IConsole(Interface):
             raise TypeError("password can only be an instance of type basestring")
         if not isinstance(clear_on_suspend, bool):
             raise TypeError("clear_on_suspend can only be an instance of type bool")
-        self._call("addDiskEncryptionPassword", in_p=[id_p, password, clear_on_suspend])
+        self._call("addDiskEncryptionPassword", in_p=(id_p, password, clear_on_suspend))
 
     def add_disk_encryption_passwords(self, ids, passwords, clear_on_suspend):
         """Adds a password used for hard disk encryption/decryption.
@@ -18924,7 +18950,7 @@ class IConsole(Interface):
         if not isinstance(clear_on_suspend, bool):
             raise TypeError("clear_on_suspend can only be an instance of type bool")
         self._call(
-            "addDiskEncryptionPasswords", in_p=[ids, passwords, clear_on_suspend]
+            "addDiskEncryptionPasswords", in_p=(ids, passwords, clear_on_suspend)
         )
 
     def remove_disk_encryption_password(self, id_p):
@@ -18940,7 +18966,7 @@ class IConsole(Interface):
         """
         if not isinstance(id_p, basestring):
             raise TypeError("id_p can only be an instance of type basestring")
-        self._call("removeDiskEncryptionPassword", in_p=[id_p])
+        self._call("removeDiskEncryptionPassword", in_p=(id_p,))
 
     def clear_all_disk_encryption_passwords(self):
         """Clears all provided supplied disk encryption passwords."""
@@ -18957,6 +18983,7 @@ class IHostNetworkInterface(Interface):
 
     __uuid__ = "455f8c45-44a0-a470-ba20-27890b96dba9"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def name(self):
@@ -19092,7 +19119,7 @@ class IHostNetworkInterface(Interface):
             raise TypeError("ip_address can only be an instance of type basestring")
         if not isinstance(network_mask, basestring):
             raise TypeError("network_mask can only be an instance of type basestring")
-        self._call("enableStaticIPConfig", in_p=[ip_address, network_mask])
+        self._call("enableStaticIPConfig", in_p=(ip_address, network_mask))
 
     def enable_static_ip_config_v6(self, ipv6_address, ipv6_network_mask_prefix_length):
         """sets and enables the static IP V6 configuration for the given interface.
@@ -19112,7 +19139,7 @@ class IHostNetworkInterface(Interface):
             )
         self._call(
             "enableStaticIPConfigV6",
-            in_p=[ipv6_address, ipv6_network_mask_prefix_length],
+            in_p=(ipv6_address, ipv6_network_mask_prefix_length),
         )
 
     def enable_dynamic_ip_config(self):
@@ -19131,6 +19158,7 @@ class IHostVideoInputDevice(Interface):
 
     __uuid__ = "e8c25d4d-ac97-4c16-b3e2-81bd8a57cc27"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def name(self):
@@ -19165,6 +19193,7 @@ class IHostUpdate(Interface):
 
     __uuid__ = "6fa2671b-0547-448e-bc7c-94e9e173bf57"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     def update_check(self, check_type):
         """Check for a newer version of software based on the 'checkType' value.
@@ -19180,7 +19209,7 @@ class IHostUpdate(Interface):
             raise TypeError(
                 "check_type can only be an instance of type UpdateCheckType"
             )
-        progress = self._call("updateCheck", in_p=[check_type])
+        progress = self._call("updateCheck", in_p=(check_type,))
         progress = IProgress(progress)
         return progress
 
@@ -19228,6 +19257,7 @@ class IHostDrivePartition(Interface):
 
     __uuid__ = "4f529a14-ace3-407c-9c49-066e8e8027f0"
     __wsmap__ = "struct"
+    __slots__ = ()
 
     @property
     def number(self):
@@ -19370,6 +19400,7 @@ class IHostDrive(Interface):
 
     __uuid__ = "70e2e0c3-332c-4d72-b822-2db16e2cb31b"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def drive_path(self):
@@ -19443,6 +19474,7 @@ class IHost(Interface):
 
     __uuid__ = "fc0759a6-a5e2-41e1-93ca-64776335eb2d"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def dvd_drives(self):
@@ -19585,7 +19617,7 @@ class IHost(Interface):
         """
         if not isinstance(cpu_id, baseinteger):
             raise TypeError("cpu_id can only be an instance of type baseinteger")
-        speed = self._call("getProcessorSpeed", in_p=[cpu_id])
+        speed = self._call("getProcessorSpeed", in_p=(cpu_id,))
         return speed
 
     def get_processor_feature(self, feature):
@@ -19600,7 +19632,7 @@ class IHost(Interface):
         """
         if not isinstance(feature, ProcessorFeature):
             raise TypeError("feature can only be an instance of type ProcessorFeature")
-        supported = self._call("getProcessorFeature", in_p=[feature])
+        supported = self._call("getProcessorFeature", in_p=(feature,))
         return supported
 
     def get_processor_description(self, cpu_id):
@@ -19619,7 +19651,7 @@ class IHost(Interface):
         """
         if not isinstance(cpu_id, baseinteger):
             raise TypeError("cpu_id can only be an instance of type baseinteger")
-        description = self._call("getProcessorDescription", in_p=[cpu_id])
+        description = self._call("getProcessorDescription", in_p=(cpu_id,))
         return description
 
     def get_processor_cpuid_leaf(self, cpu_id, leaf, sub_leaf):
@@ -19659,7 +19691,7 @@ class IHost(Interface):
         if not isinstance(sub_leaf, baseinteger):
             raise TypeError("sub_leaf can only be an instance of type baseinteger")
         (val_eax, val_ebx, val_ecx, val_edx) = self._call(
-            "getProcessorCPUIDLeaf", in_p=[cpu_id, leaf, sub_leaf]
+            "getProcessorCPUIDLeaf", in_p=(cpu_id, leaf, sub_leaf)
         )
         return (val_eax, val_ebx, val_ecx, val_edx)
 
@@ -19744,7 +19776,7 @@ class IHost(Interface):
         """
         if not isinstance(id_p, basestring):
             raise TypeError("id_p can only be an instance of type basestring")
-        progress = self._call("removeHostOnlyNetworkInterface", in_p=[id_p])
+        progress = self._call("removeHostOnlyNetworkInterface", in_p=(id_p,))
         progress = IProgress(progress)
         return progress
 
@@ -19767,7 +19799,7 @@ class IHost(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        filter_p = self._call("createUSBDeviceFilter", in_p=[name])
+        filter_p = self._call("createUSBDeviceFilter", in_p=(name,))
         filter_p = IHostUSBDeviceFilter(filter_p)
         return filter_p
 
@@ -19809,7 +19841,7 @@ class IHost(Interface):
             raise TypeError(
                 "filter_p can only be an instance of type IHostUSBDeviceFilter"
             )
-        self._call("insertUSBDeviceFilter", in_p=[position, filter_p])
+        self._call("insertUSBDeviceFilter", in_p=(position, filter_p))
 
     def remove_usb_device_filter(self, position):
         """Removes a USB device filter from the specified position in the
@@ -19835,7 +19867,7 @@ class IHost(Interface):
         """
         if not isinstance(position, baseinteger):
             raise TypeError("position can only be an instance of type baseinteger")
-        self._call("removeUSBDeviceFilter", in_p=[position])
+        self._call("removeUSBDeviceFilter", in_p=(position,))
 
     def find_host_dvd_drive(self, name):
         """Searches for a host DVD drive with the given @c name.
@@ -19852,7 +19884,7 @@ class IHost(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        drive = self._call("findHostDVDDrive", in_p=[name])
+        drive = self._call("findHostDVDDrive", in_p=(name,))
         drive = IMedium(drive)
         return drive
 
@@ -19871,7 +19903,7 @@ class IHost(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        drive = self._call("findHostFloppyDrive", in_p=[name])
+        drive = self._call("findHostFloppyDrive", in_p=(name,))
         drive = IMedium(drive)
         return drive
 
@@ -19891,7 +19923,7 @@ class IHost(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        network_interface = self._call("findHostNetworkInterfaceByName", in_p=[name])
+        network_interface = self._call("findHostNetworkInterfaceByName", in_p=(name,))
         network_interface = IHostNetworkInterface(network_interface)
         return network_interface
 
@@ -19911,7 +19943,7 @@ class IHost(Interface):
         """
         if not isinstance(id_p, basestring):
             raise TypeError("id_p can only be an instance of type basestring")
-        network_interface = self._call("findHostNetworkInterfaceById", in_p=[id_p])
+        network_interface = self._call("findHostNetworkInterfaceById", in_p=(id_p,))
         network_interface = IHostNetworkInterface(network_interface)
         return network_interface
 
@@ -19930,7 +19962,7 @@ class IHost(Interface):
                 "type_p can only be an instance of type HostNetworkInterfaceType"
             )
         network_interfaces = self._call(
-            "findHostNetworkInterfacesOfType", in_p=[type_p]
+            "findHostNetworkInterfacesOfType", in_p=(type_p,)
         )
         network_interfaces = [IHostNetworkInterface(a) for a in network_interfaces]
         return network_interfaces
@@ -19954,7 +19986,7 @@ class IHost(Interface):
         """
         if not isinstance(id_p, basestring):
             raise TypeError("id_p can only be an instance of type basestring")
-        device = self._call("findUSBDeviceById", in_p=[id_p])
+        device = self._call("findUSBDeviceById", in_p=(id_p,))
         device = IHostUSBDevice(device)
         return device
 
@@ -19978,7 +20010,7 @@ class IHost(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        device = self._call("findUSBDeviceByAddress", in_p=[name])
+        device = self._call("findUSBDeviceByAddress", in_p=(name,))
         device = IHostUSBDevice(device)
         return device
 
@@ -20040,7 +20072,7 @@ class IHost(Interface):
                 raise TypeError("array can only contain objects of type basestring")
         self._call(
             "addUSBDeviceSource",
-            in_p=[backend, id_p, address, property_names, property_values],
+            in_p=(backend, id_p, address, property_names, property_values),
         )
 
     def remove_usb_device_source(self, id_p):
@@ -20052,7 +20084,7 @@ class IHost(Interface):
         """
         if not isinstance(id_p, basestring):
             raise TypeError("id_p can only be an instance of type basestring")
-        self._call("removeUSBDeviceSource", in_p=[id_p])
+        self._call("removeUSBDeviceSource", in_p=(id_p,))
 
     @property
     def update(self):
@@ -20070,6 +20102,7 @@ class ICPUProfile(Interface):
 
     __uuid__ = "b7fda727-7a08-46ee-8dd8-f8d7308b519c"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def name(self):
@@ -20108,6 +20141,7 @@ class ISystemProperties(Interface):
 
     __uuid__ = "81c55eb1-d584-41a7-aa0b-08b71cddd773"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def min_guest_ram(self):
@@ -20965,7 +20999,7 @@ class ISystemProperties(Interface):
         """
         if not isinstance(chipset, ChipsetType):
             raise TypeError("chipset can only be an instance of type ChipsetType")
-        max_network_adapters = self._call("getMaxNetworkAdapters", in_p=[chipset])
+        max_network_adapters = self._call("getMaxNetworkAdapters", in_p=(chipset,))
         return max_network_adapters
 
     def get_max_network_adapters_of_type(self, chipset, type_p):
@@ -20990,7 +21024,7 @@ class ISystemProperties(Interface):
                 "type_p can only be an instance of type NetworkAttachmentType"
             )
         max_network_adapters = self._call(
-            "getMaxNetworkAdaptersOfType", in_p=[chipset, type_p]
+            "getMaxNetworkAdaptersOfType", in_p=(chipset, type_p)
         )
         return max_network_adapters
 
@@ -21009,7 +21043,7 @@ class ISystemProperties(Interface):
         if not isinstance(bus, StorageBus):
             raise TypeError("bus can only be an instance of type StorageBus")
         max_devices_per_port = self._call(
-            "getMaxDevicesPerPortForStorageBus", in_p=[bus]
+            "getMaxDevicesPerPortForStorageBus", in_p=(bus,)
         )
         return max_devices_per_port
 
@@ -21025,7 +21059,7 @@ class ISystemProperties(Interface):
         """
         if not isinstance(bus, StorageBus):
             raise TypeError("bus can only be an instance of type StorageBus")
-        min_port_count = self._call("getMinPortCountForStorageBus", in_p=[bus])
+        min_port_count = self._call("getMinPortCountForStorageBus", in_p=(bus,))
         return min_port_count
 
     def get_max_port_count_for_storage_bus(self, bus):
@@ -21040,7 +21074,7 @@ class ISystemProperties(Interface):
         """
         if not isinstance(bus, StorageBus):
             raise TypeError("bus can only be an instance of type StorageBus")
-        max_port_count = self._call("getMaxPortCountForStorageBus", in_p=[bus])
+        max_port_count = self._call("getMaxPortCountForStorageBus", in_p=(bus,))
         return max_port_count
 
     def get_max_instances_of_storage_bus(self, chipset, bus):
@@ -21063,7 +21097,7 @@ class ISystemProperties(Interface):
             raise TypeError("chipset can only be an instance of type ChipsetType")
         if not isinstance(bus, StorageBus):
             raise TypeError("bus can only be an instance of type StorageBus")
-        max_instances = self._call("getMaxInstancesOfStorageBus", in_p=[chipset, bus])
+        max_instances = self._call("getMaxInstancesOfStorageBus", in_p=(chipset, bus))
         return max_instances
 
     def get_device_types_for_storage_bus(self, bus):
@@ -21080,7 +21114,7 @@ class ISystemProperties(Interface):
         """
         if not isinstance(bus, StorageBus):
             raise TypeError("bus can only be an instance of type StorageBus")
-        device_types = self._call("getDeviceTypesForStorageBus", in_p=[bus])
+        device_types = self._call("getDeviceTypesForStorageBus", in_p=(bus,))
         device_types = [DeviceType(a) for a in device_types]
         return device_types
 
@@ -21100,7 +21134,7 @@ class ISystemProperties(Interface):
                 "storage_controller_type can only be an instance of type StorageControllerType"
             )
         storage_bus = self._call(
-            "getStorageBusForStorageControllerType", in_p=[storage_controller_type]
+            "getStorageBusForStorageControllerType", in_p=(storage_controller_type,)
         )
         storage_bus = StorageBus(storage_bus)
         return storage_bus
@@ -21120,7 +21154,7 @@ class ISystemProperties(Interface):
         if not isinstance(storage_bus, StorageBus):
             raise TypeError("storage_bus can only be an instance of type StorageBus")
         storage_controller_type = self._call(
-            "getStorageControllerTypesForStorageBus", in_p=[storage_bus]
+            "getStorageControllerTypesForStorageBus", in_p=(storage_bus,)
         )
         storage_controller_type = [
             StorageControllerType(a) for a in storage_controller_type
@@ -21143,7 +21177,7 @@ class ISystemProperties(Interface):
                 "controller_type can only be an instance of type StorageControllerType"
             )
         enabled = self._call(
-            "getDefaultIoCacheSettingForStorageController", in_p=[controller_type]
+            "getDefaultIoCacheSettingForStorageController", in_p=(controller_type,)
         )
         return enabled
 
@@ -21163,7 +21197,7 @@ class ISystemProperties(Interface):
                 "controller_type can only be an instance of type StorageControllerType"
             )
         hotplug_capable = self._call(
-            "getStorageControllerHotplugCapable", in_p=[controller_type]
+            "getStorageControllerHotplugCapable", in_p=(controller_type,)
         )
         return hotplug_capable
 
@@ -21188,7 +21222,7 @@ class ISystemProperties(Interface):
         if not isinstance(type_p, USBControllerType):
             raise TypeError("type_p can only be an instance of type USBControllerType")
         max_instances = self._call(
-            "getMaxInstancesOfUSBControllerType", in_p=[chipset, type_p]
+            "getMaxInstancesOfUSBControllerType", in_p=(chipset, type_p)
         )
         return max_instances
 
@@ -21212,7 +21246,7 @@ class ISystemProperties(Interface):
             )
         if not isinstance(name_pattern, basestring):
             raise TypeError("name_pattern can only be an instance of type basestring")
-        profiles = self._call("getCPUProfiles", in_p=[architecture, name_pattern])
+        profiles = self._call("getCPUProfiles", in_p=(architecture, name_pattern))
         profiles = [ICPUProfile(a) for a in profiles]
         return profiles
 
@@ -21222,6 +21256,7 @@ class IGuestOSType(Interface):
 
     __uuid__ = "d0d6c6d8-e5db-4d2c-baaa-c71053a6236d"
     __wsmap__ = "struct"
+    __slots__ = ()
 
     @property
     def family_id(self):
@@ -21487,6 +21522,7 @@ class IAdditionsFacility(Interface):
 
     __uuid__ = "f2f7fae4-4a06-81fc-a916-78b2da1fa0e5"
     __wsmap__ = "struct"
+    __slots__ = ()
 
     @property
     def class_type(self):
@@ -21537,6 +21573,7 @@ class IDnDBase(Interface):
 
     __uuid__ = "00727A73-000A-4C4A-006D-E7D300351186"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def formats(self):
@@ -21558,7 +21595,7 @@ class IDnDBase(Interface):
         """
         if not isinstance(format_p, basestring):
             raise TypeError("format_p can only be an instance of type basestring")
-        supported = self._call("isFormatSupported", in_p=[format_p])
+        supported = self._call("isFormatSupported", in_p=(format_p,))
         return supported
 
     def add_formats(self, formats):
@@ -21573,7 +21610,7 @@ class IDnDBase(Interface):
         for a in formats[:10]:
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
-        self._call("addFormats", in_p=[formats])
+        self._call("addFormats", in_p=(formats,))
 
     def remove_formats(self, formats):
         """Removes MIME / Content-type formats from the supported formats.
@@ -21587,7 +21624,7 @@ class IDnDBase(Interface):
         for a in formats[:10]:
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
-        self._call("removeFormats", in_p=[formats])
+        self._call("removeFormats", in_p=(formats,))
 
 
 class IDnDSource(IDnDBase):
@@ -21597,6 +21634,7 @@ class IDnDSource(IDnDBase):
 
     __uuid__ = "d23a9ca3-42da-c94b-8aec-21968e08355d"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     def drag_is_pending(self, screen_id):
         """Ask the source if there is any drag and drop operation pending.
@@ -21621,7 +21659,7 @@ class IDnDSource(IDnDBase):
         if not isinstance(screen_id, baseinteger):
             raise TypeError("screen_id can only be an instance of type baseinteger")
         (default_action, formats, allowed_actions) = self._call(
-            "dragIsPending", in_p=[screen_id]
+            "dragIsPending", in_p=(screen_id,)
         )
         default_action = DnDAction(default_action)
         allowed_actions = [DnDAction(a) for a in allowed_actions]
@@ -21648,7 +21686,7 @@ class IDnDSource(IDnDBase):
             raise TypeError("format_p can only be an instance of type basestring")
         if not isinstance(action, DnDAction):
             raise TypeError("action can only be an instance of type DnDAction")
-        progress = self._call("drop", in_p=[format_p, action])
+        progress = self._call("drop", in_p=(format_p, action))
         progress = IProgress(progress)
         return progress
 
@@ -21674,6 +21712,7 @@ class IGuestDnDSource(IDnDSource):
 
     __uuid__ = "dedfb5d9-4c1b-edf7-fdf3-c1be6827dc28"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def midl_does_not_like_empty_interfaces(self):
@@ -21689,6 +21728,7 @@ class IDnDTarget(IDnDBase):
 
     __uuid__ = "ff5befc3-4ba3-7903-2aa4-43988ba11554"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     def enter(self, screen_id, y, x, default_action, allowed_actions, formats):
         """Informs the target about a drag and drop enter event.
@@ -21737,7 +21777,7 @@ class IDnDTarget(IDnDBase):
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
         result_action = self._call(
-            "enter", in_p=[screen_id, y, x, default_action, allowed_actions, formats]
+            "enter", in_p=(screen_id, y, x, default_action, allowed_actions, formats)
         )
         result_action = DnDAction(result_action)
         return result_action
@@ -21789,7 +21829,7 @@ class IDnDTarget(IDnDBase):
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
         result_action = self._call(
-            "move", in_p=[screen_id, x, y, default_action, allowed_actions, formats]
+            "move", in_p=(screen_id, x, y, default_action, allowed_actions, formats)
         )
         result_action = DnDAction(result_action)
         return result_action
@@ -21806,7 +21846,7 @@ class IDnDTarget(IDnDBase):
         """
         if not isinstance(screen_id, baseinteger):
             raise TypeError("screen_id can only be an instance of type baseinteger")
-        self._call("leave", in_p=[screen_id])
+        self._call("leave", in_p=(screen_id,))
 
     def drop(self, screen_id, x, y, default_action, allowed_actions, formats):
         """Informs the target about a drop event.
@@ -21858,7 +21898,7 @@ class IDnDTarget(IDnDBase):
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
         (result_action, format_p) = self._call(
-            "drop", in_p=[screen_id, x, y, default_action, allowed_actions, formats]
+            "drop", in_p=(screen_id, x, y, default_action, allowed_actions, formats)
         )
         result_action = DnDAction(result_action)
         return (result_action, format_p)
@@ -21891,7 +21931,7 @@ class IDnDTarget(IDnDBase):
         for a in data[:10]:
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
-        progress = self._call("sendData", in_p=[screen_id, format_p, data])
+        progress = self._call("sendData", in_p=(screen_id, format_p, data))
         progress = IProgress(progress)
         return progress
 
@@ -21918,6 +21958,7 @@ class IGuestDnDTarget(IDnDTarget):
 
     __uuid__ = "50ce4b51-0ff7-46b7-a138-3c6e5ac946b4"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def midl_does_not_like_empty_interfaces(self):
@@ -21973,6 +22014,7 @@ class IGuestSession(Interface):
 
     __uuid__ = "3E14C189-4A75-437E-B0BB-7E7C90D0DF2A"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def user(self):
@@ -22226,7 +22268,7 @@ class IGuestSession(Interface):
         if not isinstance(destination, basestring):
             raise TypeError("destination can only be an instance of type basestring")
         progress = self._call(
-            "copyFromGuest", in_p=[sources, filters, flags, destination]
+            "copyFromGuest", in_p=(sources, filters, flags, destination)
         )
         progress = IProgress(progress)
         return progress
@@ -22299,7 +22341,7 @@ class IGuestSession(Interface):
         if not isinstance(destination, basestring):
             raise TypeError("destination can only be an instance of type basestring")
         progress = self._call(
-            "copyToGuest", in_p=[sources, filters, flags, destination]
+            "copyToGuest", in_p=(sources, filters, flags, destination)
         )
         progress = IProgress(progress)
         return progress
@@ -22336,7 +22378,7 @@ class IGuestSession(Interface):
                 raise TypeError(
                     "array can only contain objects of type DirectoryCopyFlag"
                 )
-        progress = self._call("directoryCopy", in_p=[source, destination, flags])
+        progress = self._call("directoryCopy", in_p=(source, destination, flags))
         progress = IProgress(progress)
         return progress
 
@@ -22371,7 +22413,7 @@ class IGuestSession(Interface):
                     "array can only contain objects of type DirectoryCopyFlag"
                 )
         progress = self._call(
-            "directoryCopyFromGuest", in_p=[source, destination, flags]
+            "directoryCopyFromGuest", in_p=(source, destination, flags)
         )
         progress = IProgress(progress)
         return progress
@@ -22406,7 +22448,7 @@ class IGuestSession(Interface):
                 raise TypeError(
                     "array can only contain objects of type DirectoryCopyFlag"
                 )
-        progress = self._call("directoryCopyToGuest", in_p=[source, destination, flags])
+        progress = self._call("directoryCopyToGuest", in_p=(source, destination, flags))
         progress = IProgress(progress)
         return progress
 
@@ -22440,7 +22482,7 @@ class IGuestSession(Interface):
                 raise TypeError(
                     "array can only contain objects of type DirectoryCreateFlag"
                 )
-        self._call("directoryCreate", in_p=[path, mode, flags])
+        self._call("directoryCreate", in_p=(path, mode, flags))
 
     def directory_create_temp(self, template_name, mode, path, secure):
         """Creates a temporary directory in the guest.
@@ -22498,7 +22540,7 @@ class IGuestSession(Interface):
         if not isinstance(secure, bool):
             raise TypeError("secure can only be an instance of type bool")
         directory = self._call(
-            "directoryCreateTemp", in_p=[template_name, mode, path, secure]
+            "directoryCreateTemp", in_p=(template_name, mode, path, secure)
         )
         return directory
 
@@ -22525,7 +22567,7 @@ class IGuestSession(Interface):
             raise TypeError("path can only be an instance of type basestring")
         if not isinstance(follow_symlinks, bool):
             raise TypeError("follow_symlinks can only be an instance of type bool")
-        exists = self._call("directoryExists", in_p=[path, follow_symlinks])
+        exists = self._call("directoryExists", in_p=(path, follow_symlinks))
         return exists
 
     def directory_open(self, path, filter_p, flags):
@@ -22574,7 +22616,7 @@ class IGuestSession(Interface):
                 raise TypeError(
                     "array can only contain objects of type DirectoryOpenFlag"
                 )
-        directory = self._call("directoryOpen", in_p=[path, filter_p, flags])
+        directory = self._call("directoryOpen", in_p=(path, filter_p, flags))
         directory = IGuestDirectory(directory)
         return directory
 
@@ -22590,7 +22632,7 @@ class IGuestSession(Interface):
         """
         if not isinstance(path, basestring):
             raise TypeError("path can only be an instance of type basestring")
-        self._call("directoryRemove", in_p=[path])
+        self._call("directoryRemove", in_p=(path,))
 
     def directory_remove_recursive(self, path, flags):
         """Removes a guest directory recursively.
@@ -22632,7 +22674,7 @@ class IGuestSession(Interface):
                 raise TypeError(
                     "array can only contain objects of type DirectoryRemoveRecFlag"
                 )
-        progress = self._call("directoryRemoveRecursive", in_p=[path, flags])
+        progress = self._call("directoryRemoveRecursive", in_p=(path, flags))
         progress = IProgress(progress)
         return progress
 
@@ -22653,7 +22695,7 @@ class IGuestSession(Interface):
             raise TypeError("name can only be an instance of type basestring")
         if not isinstance(value, basestring):
             raise TypeError("value can only be an instance of type basestring")
-        self._call("environmentScheduleSet", in_p=[name, value])
+        self._call("environmentScheduleSet", in_p=(name, value))
 
     def environment_schedule_unset(self, name):
         """Schedules unsetting (removing) an environment variable when creating
@@ -22667,7 +22709,7 @@ class IGuestSession(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        self._call("environmentScheduleUnset", in_p=[name])
+        self._call("environmentScheduleUnset", in_p=(name,))
 
     def environment_get_base_variable(self, name):
         """Gets an environment variable from the session's base environment
@@ -22694,7 +22736,7 @@ class IGuestSession(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        value = self._call("environmentGetBaseVariable", in_p=[name])
+        value = self._call("environmentGetBaseVariable", in_p=(name,))
         return value
 
     def environment_does_base_variable_exist(self, name):
@@ -22720,7 +22762,7 @@ class IGuestSession(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        exists = self._call("environmentDoesBaseVariableExist", in_p=[name])
+        exists = self._call("environmentDoesBaseVariableExist", in_p=(name,))
         return exists
 
     def file_copy(self, source, destination, flags):
@@ -22755,7 +22797,7 @@ class IGuestSession(Interface):
         for a in flags[:10]:
             if not isinstance(a, FileCopyFlag):
                 raise TypeError("array can only contain objects of type FileCopyFlag")
-        progress = self._call("fileCopy", in_p=[source, destination, flags])
+        progress = self._call("fileCopy", in_p=(source, destination, flags))
         progress = IProgress(progress)
         return progress
 
@@ -22792,7 +22834,7 @@ class IGuestSession(Interface):
         for a in flags[:10]:
             if not isinstance(a, FileCopyFlag):
                 raise TypeError("array can only contain objects of type FileCopyFlag")
-        progress = self._call("fileCopyFromGuest", in_p=[source, destination, flags])
+        progress = self._call("fileCopyFromGuest", in_p=(source, destination, flags))
         progress = IProgress(progress)
         return progress
 
@@ -22829,7 +22871,7 @@ class IGuestSession(Interface):
         for a in flags[:10]:
             if not isinstance(a, FileCopyFlag):
                 raise TypeError("array can only contain objects of type FileCopyFlag")
-        progress = self._call("fileCopyToGuest", in_p=[source, destination, flags])
+        progress = self._call("fileCopyToGuest", in_p=(source, destination, flags))
         progress = IProgress(progress)
         return progress
 
@@ -22888,7 +22930,7 @@ class IGuestSession(Interface):
             raise TypeError("path can only be an instance of type basestring")
         if not isinstance(secure, bool):
             raise TypeError("secure can only be an instance of type bool")
-        file_p = self._call("fileCreateTemp", in_p=[template_name, mode, path, secure])
+        file_p = self._call("fileCreateTemp", in_p=(template_name, mode, path, secure))
         file_p = IGuestFile(file_p)
         return file_p
 
@@ -22916,7 +22958,7 @@ class IGuestSession(Interface):
             raise TypeError("path can only be an instance of type basestring")
         if not isinstance(follow_symlinks, bool):
             raise TypeError("follow_symlinks can only be an instance of type bool")
-        exists = self._call("fileExists", in_p=[path, follow_symlinks])
+        exists = self._call("fileExists", in_p=(path, follow_symlinks))
         return exists
 
     def file_open(self, path, access_mode, open_action, creation_mode):
@@ -22966,7 +23008,7 @@ class IGuestSession(Interface):
         if not isinstance(creation_mode, baseinteger):
             raise TypeError("creation_mode can only be an instance of type baseinteger")
         file_p = self._call(
-            "fileOpen", in_p=[path, access_mode, open_action, creation_mode]
+            "fileOpen", in_p=(path, access_mode, open_action, creation_mode)
         )
         file_p = IGuestFile(file_p)
         return file_p
@@ -23036,7 +23078,7 @@ class IGuestSession(Interface):
                 raise TypeError("array can only contain objects of type FileOpenExFlag")
         file_p = self._call(
             "fileOpenEx",
-            in_p=[path, access_mode, open_action, sharing_mode, creation_mode, flags],
+            in_p=(path, access_mode, open_action, sharing_mode, creation_mode, flags),
         )
         file_p = IGuestFile(file_p)
         return file_p
@@ -23067,7 +23109,7 @@ class IGuestSession(Interface):
             raise TypeError("path can only be an instance of type basestring")
         if not isinstance(follow_symlinks, bool):
             raise TypeError("follow_symlinks can only be an instance of type bool")
-        size = self._call("fileQuerySize", in_p=[path, follow_symlinks])
+        size = self._call("fileQuerySize", in_p=(path, follow_symlinks))
         return size
 
     def fs_obj_exists(self, path, follow_symlinks):
@@ -23095,7 +23137,7 @@ class IGuestSession(Interface):
             raise TypeError("path can only be an instance of type basestring")
         if not isinstance(follow_symlinks, bool):
             raise TypeError("follow_symlinks can only be an instance of type bool")
-        exists = self._call("fsObjExists", in_p=[path, follow_symlinks])
+        exists = self._call("fsObjExists", in_p=(path, follow_symlinks))
         return exists
 
     def fs_obj_query_info(self, path, follow_symlinks):
@@ -23125,7 +23167,7 @@ class IGuestSession(Interface):
             raise TypeError("path can only be an instance of type basestring")
         if not isinstance(follow_symlinks, bool):
             raise TypeError("follow_symlinks can only be an instance of type bool")
-        info = self._call("fsObjQueryInfo", in_p=[path, follow_symlinks])
+        info = self._call("fsObjQueryInfo", in_p=(path, follow_symlinks))
         info = IGuestFsObjInfo(info)
         return info
 
@@ -23152,7 +23194,7 @@ class IGuestSession(Interface):
         """
         if not isinstance(path, basestring):
             raise TypeError("path can only be an instance of type basestring")
-        self._call("fsObjRemove", in_p=[path])
+        self._call("fsObjRemove", in_p=(path,))
 
     def fs_obj_remove_array(self, path):
         """Removes multiple file system objects (files, directories, symlinks, etc)
@@ -23178,7 +23220,7 @@ class IGuestSession(Interface):
         for a in path[:10]:
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
-        progress = self._call("fsObjRemoveArray", in_p=[path])
+        progress = self._call("fsObjRemoveArray", in_p=(path,))
         progress = IProgress(progress)
         return progress
 
@@ -23213,7 +23255,7 @@ class IGuestSession(Interface):
                 raise TypeError(
                     "array can only contain objects of type FsObjRenameFlag"
                 )
-        self._call("fsObjRename", in_p=[old_path, new_path, flags])
+        self._call("fsObjRename", in_p=(old_path, new_path, flags))
 
     def fs_obj_move(self, source, destination, flags):
         """Moves a file system object (file, directory, symlink, etc) from one
@@ -23250,7 +23292,7 @@ class IGuestSession(Interface):
         for a in flags[:10]:
             if not isinstance(a, FsObjMoveFlag):
                 raise TypeError("array can only contain objects of type FsObjMoveFlag")
-        progress = self._call("fsObjMove", in_p=[source, destination, flags])
+        progress = self._call("fsObjMove", in_p=(source, destination, flags))
         progress = IProgress(progress)
         return progress
 
@@ -23287,7 +23329,7 @@ class IGuestSession(Interface):
         for a in flags[:10]:
             if not isinstance(a, FsObjMoveFlag):
                 raise TypeError("array can only contain objects of type FsObjMoveFlag")
-        progress = self._call("fsObjMoveArray", in_p=[source, destination, flags])
+        progress = self._call("fsObjMoveArray", in_p=(source, destination, flags))
         progress = IProgress(progress)
         return progress
 
@@ -23324,7 +23366,7 @@ class IGuestSession(Interface):
         for a in flags[:10]:
             if not isinstance(a, FileCopyFlag):
                 raise TypeError("array can only contain objects of type FileCopyFlag")
-        progress = self._call("fsObjCopyArray", in_p=[source, destination, flags])
+        progress = self._call("fsObjCopyArray", in_p=(source, destination, flags))
         progress = IProgress(progress)
         return progress
 
@@ -23360,7 +23402,7 @@ class IGuestSession(Interface):
             raise TypeError("acl can only be an instance of type basestring")
         if not isinstance(mode, baseinteger):
             raise TypeError("mode can only be an instance of type baseinteger")
-        self._call("fsObjSetACL", in_p=[path, follow_symlinks, acl, mode])
+        self._call("fsObjSetACL", in_p=(path, follow_symlinks, acl, mode))
 
     def process_create(
         self, executable, arguments, environment_changes, flags, timeout_ms
@@ -23450,7 +23492,7 @@ class IGuestSession(Interface):
             raise TypeError("timeout_ms can only be an instance of type baseinteger")
         guest_process = self._call(
             "processCreate",
-            in_p=[executable, arguments, environment_changes, flags, timeout_ms],
+            in_p=(executable, arguments, environment_changes, flags, timeout_ms),
         )
         guest_process = IGuestProcess(guest_process)
         return guest_process
@@ -23554,7 +23596,7 @@ class IGuestSession(Interface):
                 raise TypeError("array can only contain objects of type baseinteger")
         guest_process = self._call(
             "processCreateEx",
-            in_p=[
+            in_p=(
                 executable,
                 arguments,
                 environment_changes,
@@ -23562,7 +23604,7 @@ class IGuestSession(Interface):
                 timeout_ms,
                 priority,
                 affinity,
-            ],
+            ),
         )
         guest_process = IGuestProcess(guest_process)
         return guest_process
@@ -23579,7 +23621,7 @@ class IGuestSession(Interface):
         """
         if not isinstance(pid, baseinteger):
             raise TypeError("pid can only be an instance of type baseinteger")
-        guest_process = self._call("processGet", in_p=[pid])
+        guest_process = self._call("processGet", in_p=(pid,))
         guest_process = IGuestProcess(guest_process)
         return guest_process
 
@@ -23609,7 +23651,7 @@ class IGuestSession(Interface):
             raise TypeError("target can only be an instance of type basestring")
         if not isinstance(type_p, SymlinkType):
             raise TypeError("type_p can only be an instance of type SymlinkType")
-        self._call("symlinkCreate", in_p=[symlink, target, type_p])
+        self._call("symlinkCreate", in_p=(symlink, target, type_p))
 
     def symlink_exists(self, symlink):
         """Checks whether a symbolic link exists in the guest.
@@ -23629,7 +23671,7 @@ class IGuestSession(Interface):
         """
         if not isinstance(symlink, basestring):
             raise TypeError("symlink can only be an instance of type basestring")
-        exists = self._call("symlinkExists", in_p=[symlink])
+        exists = self._call("symlinkExists", in_p=(symlink,))
         return exists
 
     def symlink_read(self, symlink, flags):
@@ -23657,7 +23699,7 @@ class IGuestSession(Interface):
                 raise TypeError(
                     "array can only contain objects of type SymlinkReadFlag"
                 )
-        target = self._call("symlinkRead", in_p=[symlink, flags])
+        target = self._call("symlinkRead", in_p=(symlink, flags))
         return target
 
     def wait_for(self, wait_for, timeout_ms):
@@ -23680,7 +23722,7 @@ class IGuestSession(Interface):
             raise TypeError("wait_for can only be an instance of type baseinteger")
         if not isinstance(timeout_ms, baseinteger):
             raise TypeError("timeout_ms can only be an instance of type baseinteger")
-        reason = self._call("waitFor", in_p=[wait_for, timeout_ms])
+        reason = self._call("waitFor", in_p=(wait_for, timeout_ms))
         reason = GuestSessionWaitResult(reason)
         return reason
 
@@ -23710,7 +23752,7 @@ class IGuestSession(Interface):
                 )
         if not isinstance(timeout_ms, baseinteger):
             raise TypeError("timeout_ms can only be an instance of type baseinteger")
-        reason = self._call("waitForArray", in_p=[wait_for, timeout_ms])
+        reason = self._call("waitForArray", in_p=(wait_for, timeout_ms))
         reason = GuestSessionWaitResult(reason)
         return reason
 
@@ -23722,6 +23764,7 @@ class IProcess(Interface):
 
     __uuid__ = "bc68370c-8a02-45f3-a07d-a67aa72756aa"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def arguments(self):
@@ -23809,7 +23852,7 @@ class IProcess(Interface):
             raise TypeError("wait_for can only be an instance of type baseinteger")
         if not isinstance(timeout_ms, baseinteger):
             raise TypeError("timeout_ms can only be an instance of type baseinteger")
-        reason = self._call("waitFor", in_p=[wait_for, timeout_ms])
+        reason = self._call("waitFor", in_p=(wait_for, timeout_ms))
         reason = ProcessWaitResult(reason)
         return reason
 
@@ -23839,7 +23882,7 @@ class IProcess(Interface):
                 )
         if not isinstance(timeout_ms, baseinteger):
             raise TypeError("timeout_ms can only be an instance of type baseinteger")
-        reason = self._call("waitForArray", in_p=[wait_for, timeout_ms])
+        reason = self._call("waitForArray", in_p=(wait_for, timeout_ms))
         reason = ProcessWaitResult(reason)
         return reason
 
@@ -23866,7 +23909,7 @@ class IProcess(Interface):
             raise TypeError("to_read can only be an instance of type baseinteger")
         if not isinstance(timeout_ms, baseinteger):
             raise TypeError("timeout_ms can only be an instance of type baseinteger")
-        data = self._call("read", in_p=[handle, to_read, timeout_ms])
+        data = self._call("read", in_p=(handle, to_read, timeout_ms))
         return data
 
     def write(self, handle, flags, data, timeout_ms):
@@ -23901,7 +23944,7 @@ class IProcess(Interface):
                 raise TypeError("array can only contain objects of type basestring")
         if not isinstance(timeout_ms, baseinteger):
             raise TypeError("timeout_ms can only be an instance of type baseinteger")
-        written = self._call("write", in_p=[handle, flags, data, timeout_ms])
+        written = self._call("write", in_p=(handle, flags, data, timeout_ms))
         return written
 
     def write_array(self, handle, flags, data, timeout_ms):
@@ -23942,7 +23985,7 @@ class IProcess(Interface):
                 raise TypeError("array can only contain objects of type basestring")
         if not isinstance(timeout_ms, baseinteger):
             raise TypeError("timeout_ms can only be an instance of type baseinteger")
-        written = self._call("writeArray", in_p=[handle, flags, data, timeout_ms])
+        written = self._call("writeArray", in_p=(handle, flags, data, timeout_ms))
         return written
 
     def terminate(self):
@@ -23963,6 +24006,7 @@ class IGuestProcess(IProcess):
 
     __uuid__ = "35cf4b3f-4453-4f3e-c9b8-5686939c80b6"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def midl_does_not_like_empty_interfaces(self):
@@ -23978,6 +24022,7 @@ class IDirectory(Interface):
 
     __uuid__ = "758d7eac-e4b1-486a-8f2e-747ae346c3e9"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def directory_name(self):
@@ -24026,6 +24071,7 @@ class IGuestDirectory(IDirectory):
 
     __uuid__ = "cc830458-4974-a19c-4dc6-cc98c2269626"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def midl_does_not_like_empty_interfaces(self):
@@ -24041,6 +24087,7 @@ class IFile(Interface):
 
     __uuid__ = "59a235ac-2f1a-4d6c-81fc-e3fa843f49ae"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def event_source(self):
@@ -24181,7 +24228,7 @@ class IFile(Interface):
             raise TypeError("to_read can only be an instance of type baseinteger")
         if not isinstance(timeout_ms, baseinteger):
             raise TypeError("timeout_ms can only be an instance of type baseinteger")
-        data = self._call("read", in_p=[to_read, timeout_ms])
+        data = self._call("read", in_p=(to_read, timeout_ms))
         return data
 
     def read_at(self, offset, to_read, timeout_ms):
@@ -24209,7 +24256,7 @@ class IFile(Interface):
             raise TypeError("to_read can only be an instance of type baseinteger")
         if not isinstance(timeout_ms, baseinteger):
             raise TypeError("timeout_ms can only be an instance of type baseinteger")
-        data = self._call("readAt", in_p=[offset, to_read, timeout_ms])
+        data = self._call("readAt", in_p=(offset, to_read, timeout_ms))
         return data
 
     def seek(self, offset, whence):
@@ -24234,7 +24281,7 @@ class IFile(Interface):
             raise TypeError("offset can only be an instance of type baseinteger")
         if not isinstance(whence, FileSeekOrigin):
             raise TypeError("whence can only be an instance of type FileSeekOrigin")
-        new_offset = self._call("seek", in_p=[offset, whence])
+        new_offset = self._call("seek", in_p=(offset, whence))
         return new_offset
 
     def set_acl(self, acl, mode):
@@ -24256,7 +24303,7 @@ class IFile(Interface):
             raise TypeError("acl can only be an instance of type basestring")
         if not isinstance(mode, baseinteger):
             raise TypeError("mode can only be an instance of type baseinteger")
-        self._call("setACL", in_p=[acl, mode])
+        self._call("setACL", in_p=(acl, mode))
 
     def set_size(self, size):
         """Changes the file size.
@@ -24267,7 +24314,7 @@ class IFile(Interface):
         """
         if not isinstance(size, baseinteger):
             raise TypeError("size can only be an instance of type baseinteger")
-        self._call("setSize", in_p=[size])
+        self._call("setSize", in_p=(size,))
 
     def write(self, data, timeout_ms):
         """Writes bytes to this file.
@@ -24293,7 +24340,7 @@ class IFile(Interface):
                 raise TypeError("array can only contain objects of type basestring")
         if not isinstance(timeout_ms, baseinteger):
             raise TypeError("timeout_ms can only be an instance of type baseinteger")
-        written = self._call("write", in_p=[data, timeout_ms])
+        written = self._call("write", in_p=(data, timeout_ms))
         return written
 
     def write_at(self, offset, data, timeout_ms):
@@ -24328,7 +24375,7 @@ class IFile(Interface):
                 raise TypeError("array can only contain objects of type basestring")
         if not isinstance(timeout_ms, baseinteger):
             raise TypeError("timeout_ms can only be an instance of type baseinteger")
-        written = self._call("writeAt", in_p=[offset, data, timeout_ms])
+        written = self._call("writeAt", in_p=(offset, data, timeout_ms))
         return written
 
 
@@ -24340,6 +24387,7 @@ class IGuestFile(IFile):
 
     __uuid__ = "92f21dc0-44de-1653-b717-2ebf0ca9b664"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def midl_does_not_like_empty_interfaces(self):
@@ -24356,6 +24404,7 @@ class IFsObjInfo(Interface):
 
     __uuid__ = "081fc833-c6fa-430e-6020-6a505d086387"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def name(self):
@@ -24521,6 +24570,7 @@ class IGuestFsObjInfo(IFsObjInfo):
 
     __uuid__ = "6620db85-44e0-ca69-e9e0-d4907ceccbe5"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def midl_does_not_like_empty_interfaces(self):
@@ -24542,6 +24592,7 @@ class IGuest(Interface):
 
     __uuid__ = "00892186-A4AF-4627-B21F-FC561CE4473C"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def os_type_id(self):
@@ -24748,7 +24799,7 @@ class IGuest(Interface):
             raise TypeError(
                 "facility can only be an instance of type AdditionsFacilityType"
             )
-        (status, timestamp) = self._call("getFacilityStatus", in_p=[facility])
+        (status, timestamp) = self._call("getFacilityStatus", in_p=(facility,))
         status = AdditionsFacilityStatus(status)
         return (status, timestamp)
 
@@ -24769,7 +24820,7 @@ class IGuest(Interface):
             raise TypeError(
                 "level can only be an instance of type AdditionsRunLevelType"
             )
-        active = self._call("getAdditionsStatus", in_p=[level])
+        active = self._call("getAdditionsStatus", in_p=(level,))
         return active
 
     def set_credentials(self, user_name, password, domain, allow_interactive_logon):
@@ -24809,7 +24860,7 @@ class IGuest(Interface):
             )
         self._call(
             "setCredentials",
-            in_p=[user_name, password, domain, allow_interactive_logon],
+            in_p=(user_name, password, domain, allow_interactive_logon),
         )
 
     def create_session(self, user, password, domain, session_name):
@@ -24864,7 +24915,7 @@ class IGuest(Interface):
         if not isinstance(session_name, basestring):
             raise TypeError("session_name can only be an instance of type basestring")
         guest_session = self._call(
-            "createSession", in_p=[user, password, domain, session_name]
+            "createSession", in_p=(user, password, domain, session_name)
         )
         guest_session = IGuestSession(guest_session)
         return guest_session
@@ -24882,7 +24933,7 @@ class IGuest(Interface):
         """
         if not isinstance(session_name, basestring):
             raise TypeError("session_name can only be an instance of type basestring")
-        sessions = self._call("findSession", in_p=[session_name])
+        sessions = self._call("findSession", in_p=(session_name,))
         sessions = [IGuestSession(a) for a in sessions]
         return sessions
 
@@ -24908,7 +24959,7 @@ class IGuest(Interface):
                 raise TypeError(
                     "array can only contain objects of type GuestShutdownFlag"
                 )
-        self._call("shutdown", in_p=[flags])
+        self._call("shutdown", in_p=(flags,))
 
     def update_guest_additions(self, source, arguments, flags):
         """Automatically updates already installed Guest Additions in a VM.
@@ -24964,7 +25015,7 @@ class IGuest(Interface):
                 raise TypeError(
                     "array can only contain objects of type AdditionsUpdateFlag"
                 )
-        progress = self._call("updateGuestAdditions", in_p=[source, arguments, flags])
+        progress = self._call("updateGuestAdditions", in_p=(source, arguments, flags))
         progress = IProgress(progress)
         return progress
 
@@ -25009,6 +25060,7 @@ class IProgress(Interface):
 
     __uuid__ = "d7b98d2b-30e8-447e-99cb-e31becae6ae4"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def id_p(self):
@@ -25189,7 +25241,7 @@ class IProgress(Interface):
         """
         if not isinstance(timeout, baseinteger):
             raise TypeError("timeout can only be an instance of type baseinteger")
-        self._call("waitForCompletion", in_p=[timeout])
+        self._call("waitForCompletion", in_p=(timeout,))
 
     def wait_for_operation_completion(self, operation, timeout):
         """Waits until the given operation is done with a given timeout in
@@ -25212,7 +25264,7 @@ class IProgress(Interface):
             raise TypeError("operation can only be an instance of type baseinteger")
         if not isinstance(timeout, baseinteger):
             raise TypeError("timeout can only be an instance of type baseinteger")
-        self._call("waitForOperationCompletion", in_p=[operation, timeout])
+        self._call("waitForOperationCompletion", in_p=(operation, timeout))
 
     def cancel(self):
         """Cancels the task.
@@ -25233,6 +25285,7 @@ class IInternalProgressControl(Interface):
 
     __uuid__ = "41a033b8-cc87-4f6e-a0e9-47bb7f2d4be5"
     __wsmap__ = "suppress"
+    __slots__ = ()
 
     def set_current_operation_progress(self, percent):
         """Internal method, not to be called externally.
@@ -25242,7 +25295,7 @@ class IInternalProgressControl(Interface):
         """
         if not isinstance(percent, baseinteger):
             raise TypeError("percent can only be an instance of type baseinteger")
-        self._call("setCurrentOperationProgress", in_p=[percent])
+        self._call("setCurrentOperationProgress", in_p=(percent,))
 
     def wait_for_other_progress_completion(self, progress_other, timeout_ms):
         """Internal method, not to be called externally.
@@ -25277,7 +25330,7 @@ class IInternalProgressControl(Interface):
             raise TypeError("progress_other can only be an instance of type IProgress")
         if not isinstance(timeout_ms, baseinteger):
             raise TypeError("timeout_ms can only be an instance of type baseinteger")
-        self._call("waitForOtherProgressCompletion", in_p=[progress_other, timeout_ms])
+        self._call("waitForOtherProgressCompletion", in_p=(progress_other, timeout_ms))
 
     def set_next_operation(self, next_operation_description, next_operations_weight):
         """Internal method, not to be called externally.
@@ -25297,7 +25350,7 @@ class IInternalProgressControl(Interface):
             )
         self._call(
             "setNextOperation",
-            in_p=[next_operation_description, next_operations_weight],
+            in_p=(next_operation_description, next_operations_weight),
         )
 
     def notify_point_of_no_return(self):
@@ -25318,7 +25371,7 @@ class IInternalProgressControl(Interface):
             raise TypeError(
                 "error_info can only be an instance of type IVirtualBoxErrorInfo"
             )
-        self._call("notifyComplete", in_p=[result_code, error_info])
+        self._call("notifyComplete", in_p=(result_code, error_info))
 
 
 class ISnapshot(Interface):
@@ -25406,6 +25459,7 @@ class ISnapshot(Interface):
 
     __uuid__ = "6cc49055-dad4-4496-85cf-3f76bcb3b5fa"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def id_p(self):
@@ -25693,6 +25747,7 @@ class IMediumAttachment(Interface):
 
     __uuid__ = "8d095cb0-0126-43e0-b05d-326e74abb356"
     __wsmap__ = "struct"
+    __slots__ = ()
 
     @property
     def machine(self):
@@ -25965,6 +26020,7 @@ class IMedium(Interface):
 
     __uuid__ = "ad47ad09-787b-44ab-b343-a082a3f2dfb1"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def id_p(self):
@@ -26355,7 +26411,7 @@ class IMedium(Interface):
             raise TypeError("set_parent_id can only be an instance of type bool")
         if not isinstance(parent_id, basestring):
             raise TypeError("parent_id can only be an instance of type basestring")
-        self._call("setIds", in_p=[set_image_id, image_id, set_parent_id, parent_id])
+        self._call("setIds", in_p=(set_image_id, image_id, set_parent_id, parent_id))
 
     def refresh_state(self):
         """If the current medium state (see :py:class:`MediumState` ) is one of
@@ -26418,7 +26474,7 @@ class IMedium(Interface):
         """
         if not isinstance(machine_id, basestring):
             raise TypeError("machine_id can only be an instance of type basestring")
-        snapshot_ids = self._call("getSnapshotIds", in_p=[machine_id])
+        snapshot_ids = self._call("getSnapshotIds", in_p=(machine_id,))
         return snapshot_ids
 
     def lock_read(self):
@@ -26589,7 +26645,7 @@ class IMedium(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        value = self._call("getProperty", in_p=[name])
+        value = self._call("getProperty", in_p=(name,))
         return value
 
     def set_property(self, name, value):
@@ -26620,7 +26676,7 @@ class IMedium(Interface):
             raise TypeError("name can only be an instance of type basestring")
         if not isinstance(value, basestring):
             raise TypeError("value can only be an instance of type basestring")
-        self._call("setProperty", in_p=[name, value])
+        self._call("setProperty", in_p=(name, value))
 
     def get_properties(self, names):
         """Returns values for a group of properties in one call.
@@ -26655,7 +26711,7 @@ class IMedium(Interface):
         """
         if not isinstance(names, basestring):
             raise TypeError("names can only be an instance of type basestring")
-        (return_values, return_names) = self._call("getProperties", in_p=[names])
+        (return_values, return_names) = self._call("getProperties", in_p=(names,))
         return (return_values, return_names)
 
     def set_properties(self, names, values):
@@ -26698,7 +26754,7 @@ class IMedium(Interface):
         for a in values[:10]:
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
-        self._call("setProperties", in_p=[names, values])
+        self._call("setProperties", in_p=(names, values))
 
     def create_base_storage(self, logical_size, variant):
         """Starts creating a hard disk storage unit (fixed/dynamic, according
@@ -26736,7 +26792,7 @@ class IMedium(Interface):
         for a in variant[:10]:
             if not isinstance(a, MediumVariant):
                 raise TypeError("array can only contain objects of type MediumVariant")
-        progress = self._call("createBaseStorage", in_p=[logical_size, variant])
+        progress = self._call("createBaseStorage", in_p=(logical_size, variant))
         progress = IProgress(progress)
         return progress
 
@@ -26826,7 +26882,7 @@ class IMedium(Interface):
         for a in variant[:10]:
             if not isinstance(a, MediumVariant):
                 raise TypeError("array can only contain objects of type MediumVariant")
-        progress = self._call("createDiffStorage", in_p=[target, variant])
+        progress = self._call("createDiffStorage", in_p=(target, variant))
         progress = IProgress(progress)
         return progress
 
@@ -26908,7 +26964,7 @@ class IMedium(Interface):
         """
         if not isinstance(target, IMedium):
             raise TypeError("target can only be an instance of type IMedium")
-        progress = self._call("mergeTo", in_p=[target])
+        progress = self._call("mergeTo", in_p=(target,))
         progress = IProgress(progress)
         return progress
 
@@ -26967,7 +27023,7 @@ class IMedium(Interface):
                 raise TypeError("array can only contain objects of type MediumVariant")
         if not isinstance(parent, IMedium):
             raise TypeError("parent can only be an instance of type IMedium")
-        progress = self._call("cloneTo", in_p=[target, variant, parent])
+        progress = self._call("cloneTo", in_p=(target, variant, parent))
         progress = IProgress(progress)
         return progress
 
@@ -27020,7 +27076,7 @@ class IMedium(Interface):
         for a in variant[:10]:
             if not isinstance(a, MediumVariant):
                 raise TypeError("array can only contain objects of type MediumVariant")
-        progress = self._call("cloneToBase", in_p=[target, variant])
+        progress = self._call("cloneToBase", in_p=(target, variant))
         progress = IProgress(progress)
         return progress
 
@@ -27059,7 +27115,7 @@ class IMedium(Interface):
         """
         if not isinstance(location, basestring):
             raise TypeError("location can only be an instance of type basestring")
-        progress = self._call("moveTo", in_p=[location])
+        progress = self._call("moveTo", in_p=(location,))
         progress = IProgress(progress)
         return progress
 
@@ -27120,7 +27176,7 @@ class IMedium(Interface):
         """
         if not isinstance(logical_size, baseinteger):
             raise TypeError("logical_size can only be an instance of type baseinteger")
-        progress = self._call("resize", in_p=[logical_size])
+        progress = self._call("resize", in_p=(logical_size,))
         progress = IProgress(progress)
         return progress
 
@@ -27200,7 +27256,7 @@ class IMedium(Interface):
             )
         progress = self._call(
             "changeEncryption",
-            in_p=[current_password, cipher, new_password, new_password_id],
+            in_p=(current_password, cipher, new_password, new_password_id),
         )
         progress = IProgress(progress)
         return progress
@@ -27236,7 +27292,7 @@ class IMedium(Interface):
         """
         if not isinstance(password, basestring):
             raise TypeError("password can only be an instance of type basestring")
-        self._call("checkEncryptionPassword", in_p=[password])
+        self._call("checkEncryptionPassword", in_p=(password,))
 
     def open_for_io(self, writable, password):
         """Open the medium for I/O.
@@ -27256,7 +27312,7 @@ class IMedium(Interface):
             raise TypeError("writable can only be an instance of type bool")
         if not isinstance(password, basestring):
             raise TypeError("password can only be an instance of type basestring")
-        medium_io = self._call("openForIO", in_p=[writable, password])
+        medium_io = self._call("openForIO", in_p=(writable, password))
         medium_io = IMediumIO(medium_io)
         return medium_io
 
@@ -27282,6 +27338,7 @@ class IMediumFormat(Interface):
 
     __uuid__ = "11be93c7-a862-4dc9-8c89-bf4ba74a886a"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def id_p(self):
@@ -27394,6 +27451,7 @@ class IDataStream(Interface):
 
     __uuid__ = "a338ed20-58d9-43ae-8b03-c1fd7088ef15"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def read_size(self):
@@ -27427,7 +27485,7 @@ class IDataStream(Interface):
             raise TypeError("size can only be an instance of type baseinteger")
         if not isinstance(timeout_ms, baseinteger):
             raise TypeError("timeout_ms can only be an instance of type baseinteger")
-        data = self._call("read", in_p=[size, timeout_ms])
+        data = self._call("read", in_p=(size, timeout_ms))
         return data
 
 
@@ -27439,6 +27497,7 @@ class IMediumIO(Interface):
 
     __uuid__ = "e4b301a9-5f86-4d65-ad1b-87ca284fb1c8"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def medium(self):
@@ -27500,7 +27559,7 @@ class IMediumIO(Interface):
             raise TypeError("offset can only be an instance of type baseinteger")
         if not isinstance(size, baseinteger):
             raise TypeError("size can only be an instance of type baseinteger")
-        data = self._call("read", in_p=[offset, size])
+        data = self._call("read", in_p=(offset, size))
         return data
 
     def write(self, offset, data):
@@ -27523,7 +27582,7 @@ class IMediumIO(Interface):
         for a in data[:10]:
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
-        written = self._call("write", in_p=[offset, data])
+        written = self._call("write", in_p=(offset, data))
         return written
 
     def format_fat(self, quick):
@@ -27536,7 +27595,7 @@ class IMediumIO(Interface):
         """
         if not isinstance(quick, bool):
             raise TypeError("quick can only be an instance of type bool")
-        self._call("formatFAT", in_p=[quick])
+        self._call("formatFAT", in_p=(quick,))
 
     def initialize_partition_table(self, format_p, whole_disk_in_one_entry):
         """Writes an empty partition table to the disk.
@@ -27557,7 +27616,7 @@ class IMediumIO(Interface):
             raise TypeError(
                 "whole_disk_in_one_entry can only be an instance of type bool"
             )
-        self._call("initializePartitionTable", in_p=[format_p, whole_disk_in_one_entry])
+        self._call("initializePartitionTable", in_p=(format_p, whole_disk_in_one_entry))
 
     def convert_to_stream(self, format_p, variant, buffer_size):
         """Converts the currently opened image into a stream of the specified
@@ -27599,7 +27658,7 @@ class IMediumIO(Interface):
         if not isinstance(buffer_size, baseinteger):
             raise TypeError("buffer_size can only be an instance of type baseinteger")
         (progress, stream) = self._call(
-            "convertToStream", in_p=[format_p, variant, buffer_size]
+            "convertToStream", in_p=(format_p, variant, buffer_size)
         )
         progress = IProgress(progress)
         stream = IDataStream(stream)
@@ -27631,6 +27690,7 @@ class IToken(Interface):
 
     __uuid__ = "20479eaf-d8ed-44cf-85ac-c83a26c95a4d"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     def abandon(self):
         """Releases this token. Cannot be undone in any way, and makes the
@@ -27662,6 +27722,7 @@ class IKeyboard(Interface):
 
     __uuid__ = "755e6bdf-1640-41f9-bd74-3ef5fd653250"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def keyboard_le_ds(self):
@@ -27682,7 +27743,7 @@ class IKeyboard(Interface):
         """
         if not isinstance(scancode, baseinteger):
             raise TypeError("scancode can only be an instance of type baseinteger")
-        self._call("putScancode", in_p=[scancode])
+        self._call("putScancode", in_p=(scancode,))
 
     def put_scancodes(self, scancodes):
         """Sends an array of scancodes to the keyboard.
@@ -27700,7 +27761,7 @@ class IKeyboard(Interface):
         for a in scancodes[:10]:
             if not isinstance(a, baseinteger):
                 raise TypeError("array can only contain objects of type baseinteger")
-        codes_stored = self._call("putScancodes", in_p=[scancodes])
+        codes_stored = self._call("putScancodes", in_p=(scancodes,))
         return codes_stored
 
     def put_cad(self):
@@ -27745,7 +27806,7 @@ class IKeyboard(Interface):
             raise TypeError("usage_page can only be an instance of type baseinteger")
         if not isinstance(key_release, bool):
             raise TypeError("key_release can only be an instance of type bool")
-        self._call("putUsageCode", in_p=[usage_code, usage_page, key_release])
+        self._call("putUsageCode", in_p=(usage_code, usage_page, key_release))
 
     @property
     def event_source(self):
@@ -27763,6 +27824,7 @@ class IMousePointerShape(Interface):
 
     __uuid__ = "1e775ea3-9070-4f9c-b0d5-53054496dbe0"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def visible(self):
@@ -27858,6 +27920,7 @@ class IMouse(Interface):
 
     __uuid__ = "10cd08d0-e8b8-4838-b10c-45ba193734c1"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def absolute_supported(self):
@@ -27976,7 +28039,7 @@ class IMouse(Interface):
             raise TypeError("dw can only be an instance of type baseinteger")
         if not isinstance(button_state, baseinteger):
             raise TypeError("button_state can only be an instance of type baseinteger")
-        self._call("putMouseEvent", in_p=[dx, dy, dz, dw, button_state])
+        self._call("putMouseEvent", in_p=(dx, dy, dz, dw, button_state))
 
     def put_mouse_event_absolute(self, x, y, dz, dw, button_state):
         """Positions the mouse pointer using absolute x and y coordinates.
@@ -28041,7 +28104,7 @@ class IMouse(Interface):
             raise TypeError("dw can only be an instance of type baseinteger")
         if not isinstance(button_state, baseinteger):
             raise TypeError("button_state can only be an instance of type baseinteger")
-        self._call("putMouseEventAbsolute", in_p=[x, y, dz, dw, button_state])
+        self._call("putMouseEventAbsolute", in_p=(x, y, dz, dw, button_state))
 
     def put_event_multi_touch(self, count, contacts, scan_time):
         """Sends a multi-touch pointer event. The coordinates are expressed in
@@ -28087,7 +28150,7 @@ class IMouse(Interface):
                 raise TypeError("array can only contain objects of type baseinteger")
         if not isinstance(scan_time, baseinteger):
             raise TypeError("scan_time can only be an instance of type baseinteger")
-        self._call("putEventMultiTouch", in_p=[count, contacts, scan_time])
+        self._call("putEventMultiTouch", in_p=(count, contacts, scan_time))
 
     def put_event_multi_touch_string(self, count, contacts, scan_time):
         """:py:func:`put_event_multi_touch`
@@ -28110,7 +28173,7 @@ class IMouse(Interface):
             raise TypeError("contacts can only be an instance of type basestring")
         if not isinstance(scan_time, baseinteger):
             raise TypeError("scan_time can only be an instance of type baseinteger")
-        self._call("putEventMultiTouchString", in_p=[count, contacts, scan_time])
+        self._call("putEventMultiTouchString", in_p=(count, contacts, scan_time))
 
     @property
     def event_source(self):
@@ -28128,6 +28191,7 @@ class IDisplaySourceBitmap(Interface):
 
     __uuid__ = "5094f67a-8084-11e9-b185-dbe296e54799"
     __wsmap__ = "suppress"
+    __slots__ = ()
 
     @property
     def screen_id(self):
@@ -28170,6 +28234,7 @@ class IFramebuffer(Interface):
 
     __uuid__ = "1e8d3f27-b45c-48ae-8b36-d35e83d207aa"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def width(self):
@@ -28289,7 +28354,7 @@ class IFramebuffer(Interface):
             raise TypeError("width can only be an instance of type baseinteger")
         if not isinstance(height, baseinteger):
             raise TypeError("height can only be an instance of type baseinteger")
-        self._call("notifyUpdate", in_p=[x, y, width, height])
+        self._call("notifyUpdate", in_p=(x, y, width, height))
 
     def notify_update_image(self, x, y, width, height, image):
         """Informs about an update and provides 32bpp bitmap.
@@ -28323,7 +28388,7 @@ class IFramebuffer(Interface):
         for a in image[:10]:
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
-        self._call("notifyUpdateImage", in_p=[x, y, width, height, image])
+        self._call("notifyUpdateImage", in_p=(x, y, width, height, image))
 
     def notify_change(self, screen_id, x_origin, y_origin, width, height):
         """Requests a size change.
@@ -28354,7 +28419,7 @@ class IFramebuffer(Interface):
             raise TypeError("width can only be an instance of type baseinteger")
         if not isinstance(height, baseinteger):
             raise TypeError("height can only be an instance of type baseinteger")
-        self._call("notifyChange", in_p=[screen_id, x_origin, y_origin, width, height])
+        self._call("notifyChange", in_p=(screen_id, x_origin, y_origin, width, height))
 
     def video_mode_supported(self, width, height, bpp):
         """Returns whether the frame buffer implementation is willing to
@@ -28380,7 +28445,7 @@ class IFramebuffer(Interface):
             raise TypeError("height can only be an instance of type baseinteger")
         if not isinstance(bpp, baseinteger):
             raise TypeError("bpp can only be an instance of type baseinteger")
-        supported = self._call("videoModeSupported", in_p=[width, height, bpp])
+        supported = self._call("videoModeSupported", in_p=(width, height, bpp))
         return supported
 
     def get_visible_region(self, rectangles, count):
@@ -28417,7 +28482,7 @@ class IFramebuffer(Interface):
             raise TypeError("rectangles can only be an instance of type basestring")
         if not isinstance(count, baseinteger):
             raise TypeError("count can only be an instance of type baseinteger")
-        count_copied = self._call("getVisibleRegion", in_p=[rectangles, count])
+        count_copied = self._call("getVisibleRegion", in_p=(rectangles, count))
         return count_copied
 
     def set_visible_region(self, rectangles, count):
@@ -28450,7 +28515,7 @@ class IFramebuffer(Interface):
             raise TypeError("rectangles can only be an instance of type basestring")
         if not isinstance(count, baseinteger):
             raise TypeError("count can only be an instance of type baseinteger")
-        self._call("setVisibleRegion", in_p=[rectangles, count])
+        self._call("setVisibleRegion", in_p=(rectangles, count))
 
     def process_vhwa_command(self, command, enm_cmd, from_guest):
         """Posts a Video HW Acceleration Command to the frame buffer for processing.
@@ -28477,7 +28542,7 @@ class IFramebuffer(Interface):
             raise TypeError("enm_cmd can only be an instance of type baseinteger")
         if not isinstance(from_guest, bool):
             raise TypeError("from_guest can only be an instance of type bool")
-        self._call("processVHWACommand", in_p=[command, enm_cmd, from_guest])
+        self._call("processVHWACommand", in_p=(command, enm_cmd, from_guest))
 
     def notify3_d_event(self, type_p, data):
         """Notifies framebuffer about 3D backend event.
@@ -28496,7 +28561,7 @@ class IFramebuffer(Interface):
         for a in data[:10]:
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
-        self._call("notify3DEvent", in_p=[type_p, data])
+        self._call("notify3DEvent", in_p=(type_p, data))
 
 
 class IFramebufferOverlay(IFramebuffer):
@@ -28513,6 +28578,7 @@ class IFramebufferOverlay(IFramebuffer):
 
     __uuid__ = "af398a9a-6b76-4805-8fab-00a9dcf4732b"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def x(self):
@@ -28571,7 +28637,7 @@ class IFramebufferOverlay(IFramebuffer):
             raise TypeError("x can only be an instance of type baseinteger")
         if not isinstance(y, baseinteger):
             raise TypeError("y can only be an instance of type baseinteger")
-        self._call("move", in_p=[x, y])
+        self._call("move", in_p=(x, y))
 
 
 class IGuestScreenInfo(Interface):
@@ -28579,6 +28645,7 @@ class IGuestScreenInfo(Interface):
 
     __uuid__ = "6b2f98f8-9641-4397-854a-040439d0114b"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def screen_id(self):
@@ -28656,6 +28723,7 @@ class IDisplay(Interface):
 
     __uuid__ = "4680b2de-8690-11e9-b83d-5719e53cf1de"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def guest_screen_layout(self):
@@ -28698,7 +28766,7 @@ class IDisplay(Interface):
             x_origin,
             y_origin,
             guest_monitor_status,
-        ) = self._call("getScreenResolution", in_p=[screen_id])
+        ) = self._call("getScreenResolution", in_p=(screen_id,))
         guest_monitor_status = GuestMonitorStatus(guest_monitor_status)
         return (width, height, bits_per_pixel, x_origin, y_origin, guest_monitor_status)
 
@@ -28716,7 +28784,7 @@ class IDisplay(Interface):
             raise TypeError("screen_id can only be an instance of type baseinteger")
         if not isinstance(framebuffer, IFramebuffer):
             raise TypeError("framebuffer can only be an instance of type IFramebuffer")
-        id_p = self._call("attachFramebuffer", in_p=[screen_id, framebuffer])
+        id_p = self._call("attachFramebuffer", in_p=(screen_id, framebuffer))
         return id_p
 
     def detach_framebuffer(self, screen_id, id_p):
@@ -28731,7 +28799,7 @@ class IDisplay(Interface):
             raise TypeError("screen_id can only be an instance of type baseinteger")
         if not isinstance(id_p, basestring):
             raise TypeError("id_p can only be an instance of type basestring")
-        self._call("detachFramebuffer", in_p=[screen_id, id_p])
+        self._call("detachFramebuffer", in_p=(screen_id, id_p))
 
     def query_framebuffer(self, screen_id):
         """Queries the graphics updates targets for a screen.
@@ -28743,7 +28811,7 @@ class IDisplay(Interface):
         """
         if not isinstance(screen_id, baseinteger):
             raise TypeError("screen_id can only be an instance of type baseinteger")
-        framebuffer = self._call("queryFramebuffer", in_p=[screen_id])
+        framebuffer = self._call("queryFramebuffer", in_p=(screen_id,))
         framebuffer = IFramebuffer(framebuffer)
         return framebuffer
 
@@ -28837,7 +28905,7 @@ class IDisplay(Interface):
             raise TypeError("notify can only be an instance of type bool")
         self._call(
             "setVideoModeHint",
-            in_p=[
+            in_p=(
                 display,
                 enabled,
                 change_origin,
@@ -28847,7 +28915,7 @@ class IDisplay(Interface):
                 height,
                 bits_per_pixel,
                 notify,
-            ],
+            ),
         )
 
     def get_video_mode_hint(self, display):
@@ -28899,7 +28967,7 @@ class IDisplay(Interface):
             width,
             height,
             bits_per_pixel,
-        ) = self._call("getVideoModeHint", in_p=[display])
+        ) = self._call("getVideoModeHint", in_p=(display,))
         return (
             enabled,
             change_origin,
@@ -28922,7 +28990,7 @@ class IDisplay(Interface):
         """
         if not isinstance(enabled, bool):
             raise TypeError("enabled can only be an instance of type bool")
-        self._call("setSeamlessMode", in_p=[enabled])
+        self._call("setSeamlessMode", in_p=(enabled,))
 
     def take_screen_shot(self, screen_id, address, width, height, bitmap_format):
         """Takes a screen shot of the requested size and format and copies it to the
@@ -28960,7 +29028,7 @@ class IDisplay(Interface):
                 "bitmap_format can only be an instance of type BitmapFormat"
             )
         self._call(
-            "takeScreenShot", in_p=[screen_id, address, width, height, bitmap_format]
+            "takeScreenShot", in_p=(screen_id, address, width, height, bitmap_format)
         )
 
     def take_screen_shot_to_array(self, screen_id, width, height, bitmap_format):
@@ -28994,7 +29062,7 @@ class IDisplay(Interface):
                 "bitmap_format can only be an instance of type BitmapFormat"
             )
         screen_data = self._call(
-            "takeScreenShotToArray", in_p=[screen_id, width, height, bitmap_format]
+            "takeScreenShotToArray", in_p=(screen_id, width, height, bitmap_format)
         )
         return screen_data
 
@@ -29039,7 +29107,7 @@ class IDisplay(Interface):
             raise TypeError("width can only be an instance of type baseinteger")
         if not isinstance(height, baseinteger):
             raise TypeError("height can only be an instance of type baseinteger")
-        self._call("drawToScreen", in_p=[screen_id, address, x, y, width, height])
+        self._call("drawToScreen", in_p=(screen_id, address, x, y, width, height))
 
     def invalidate_and_update(self):
         """Does a full invalidation of the VM display and instructs the VM
@@ -29060,7 +29128,7 @@ class IDisplay(Interface):
         """
         if not isinstance(screen_id, baseinteger):
             raise TypeError("screen_id can only be an instance of type baseinteger")
-        self._call("invalidateAndUpdateScreen", in_p=[screen_id])
+        self._call("invalidateAndUpdateScreen", in_p=(screen_id,))
 
     def complete_vhwa_command(self, command):
         """Signals that the Video HW Acceleration command has completed.
@@ -29071,7 +29139,7 @@ class IDisplay(Interface):
         """
         if not isinstance(command, basestring):
             raise TypeError("command can only be an instance of type basestring")
-        self._call("completeVHWACommand", in_p=[command])
+        self._call("completeVHWACommand", in_p=(command,))
 
     def viewport_changed(self, screen_id, x, y, width, height):
         """Signals that framebuffer window viewport has changed.
@@ -29105,7 +29173,7 @@ class IDisplay(Interface):
             raise TypeError("width can only be an instance of type baseinteger")
         if not isinstance(height, baseinteger):
             raise TypeError("height can only be an instance of type baseinteger")
-        self._call("viewportChanged", in_p=[screen_id, x, y, width, height])
+        self._call("viewportChanged", in_p=(screen_id, x, y, width, height))
 
     def query_source_bitmap(self, screen_id):
         """Obtains the guest screen bitmap parameters.
@@ -29117,7 +29185,7 @@ class IDisplay(Interface):
         """
         if not isinstance(screen_id, baseinteger):
             raise TypeError("screen_id can only be an instance of type baseinteger")
-        display_source_bitmap = self._call("querySourceBitmap", in_p=[screen_id])
+        display_source_bitmap = self._call("querySourceBitmap", in_p=(screen_id,))
         display_source_bitmap = IDisplaySourceBitmap(display_source_bitmap)
         return display_source_bitmap
 
@@ -29145,11 +29213,11 @@ class IDisplay(Interface):
             )
         self._call(
             "notifyScaleFactorChange",
-            in_p=[
+            in_p=(
                 screen_id,
                 u32_scale_factor_w_multiplied,
                 u32_scale_factor_h_multiplied,
-            ],
+            ),
         )
 
     def notify_hi_dpi_output_policy_change(self, f_unscaled_hi_dpi):
@@ -29160,7 +29228,7 @@ class IDisplay(Interface):
         """
         if not isinstance(f_unscaled_hi_dpi, bool):
             raise TypeError("f_unscaled_hi_dpi can only be an instance of type bool")
-        self._call("notifyHiDPIOutputPolicyChange", in_p=[f_unscaled_hi_dpi])
+        self._call("notifyHiDPIOutputPolicyChange", in_p=(f_unscaled_hi_dpi,))
 
     def set_screen_layout(self, screen_layout_mode, guest_screen_info):
         """Set video modes for the guest screens.
@@ -29181,7 +29249,7 @@ class IDisplay(Interface):
                 raise TypeError(
                     "array can only contain objects of type IGuestScreenInfo"
                 )
-        self._call("setScreenLayout", in_p=[screen_layout_mode, guest_screen_info])
+        self._call("setScreenLayout", in_p=(screen_layout_mode, guest_screen_info))
 
     def detach_screens(self, screen_ids):
         """Unplugs monitors from the virtual graphics card.
@@ -29194,7 +29262,7 @@ class IDisplay(Interface):
         for a in screen_ids[:10]:
             if not isinstance(a, baseinteger):
                 raise TypeError("array can only contain objects of type baseinteger")
-        self._call("detachScreens", in_p=[screen_ids])
+        self._call("detachScreens", in_p=(screen_ids,))
 
     def create_guest_screen_info(
         self,
@@ -29265,7 +29333,7 @@ class IDisplay(Interface):
             )
         guest_screen_info = self._call(
             "createGuestScreenInfo",
-            in_p=[
+            in_p=(
                 display,
                 status,
                 primary,
@@ -29275,7 +29343,7 @@ class IDisplay(Interface):
                 width,
                 height,
                 bits_per_pixel,
-            ],
+            ),
         )
         guest_screen_info = IGuestScreenInfo(guest_screen_info)
         return guest_screen_info
@@ -29296,6 +29364,7 @@ class INetworkAdapter(Interface):
 
     __uuid__ = "e9a0c183-7071-4894-93d6-dcbec010fa91"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def adapter_type(self):
@@ -29588,7 +29657,7 @@ class INetworkAdapter(Interface):
         """
         if not isinstance(key, basestring):
             raise TypeError("key can only be an instance of type basestring")
-        value = self._call("getProperty", in_p=[key])
+        value = self._call("getProperty", in_p=(key,))
         return value
 
     def set_property(self, key, value):
@@ -29611,7 +29680,7 @@ class INetworkAdapter(Interface):
             raise TypeError("key can only be an instance of type basestring")
         if not isinstance(value, basestring):
             raise TypeError("value can only be an instance of type basestring")
-        self._call("setProperty", in_p=[key, value])
+        self._call("setProperty", in_p=(key, value))
 
     def get_properties(self, names):
         """Returns values for a group of properties in one call.
@@ -29640,7 +29709,7 @@ class INetworkAdapter(Interface):
         """
         if not isinstance(names, basestring):
             raise TypeError("names can only be an instance of type basestring")
-        (return_values, return_names) = self._call("getProperties", in_p=[names])
+        (return_values, return_names) = self._call("getProperties", in_p=(names,))
         return (return_values, return_names)
 
 
@@ -29671,6 +29740,7 @@ class ISerialPort(Interface):
 
     __uuid__ = "5587d0f6-a227-4f23-8278-2f675eea1bb2"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def slot(self):
@@ -29811,6 +29881,7 @@ class IParallelPort(Interface):
 
     __uuid__ = "788b87df-7708-444b-9eef-c116ce423d39"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def slot(self):
@@ -29891,6 +29962,7 @@ class IMachineDebugger(Interface):
 
     __uuid__ = "00ae6af4-00a7-4104-0009-49bc00b2da80"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     def dump_guest_core(self, filename, compression):
         """Takes a core dump of the guest.
@@ -29908,7 +29980,7 @@ class IMachineDebugger(Interface):
             raise TypeError("filename can only be an instance of type basestring")
         if not isinstance(compression, basestring):
             raise TypeError("compression can only be an instance of type basestring")
-        self._call("dumpGuestCore", in_p=[filename, compression])
+        self._call("dumpGuestCore", in_p=(filename, compression))
 
     def dump_host_process_core(self, filename, compression):
         """Takes a core dump of the VM process on the host.
@@ -29927,7 +29999,7 @@ class IMachineDebugger(Interface):
             raise TypeError("filename can only be an instance of type basestring")
         if not isinstance(compression, basestring):
             raise TypeError("compression can only be an instance of type basestring")
-        self._call("dumpHostProcessCore", in_p=[filename, compression])
+        self._call("dumpHostProcessCore", in_p=(filename, compression))
 
     def info(self, name, args):
         """Interfaces with the info dumpers (DBGFInfo).
@@ -29949,7 +30021,7 @@ class IMachineDebugger(Interface):
             raise TypeError("name can only be an instance of type basestring")
         if not isinstance(args, basestring):
             raise TypeError("args can only be an instance of type basestring")
-        info = self._call("info", in_p=[name, args])
+        info = self._call("info", in_p=(name, args))
         return info
 
     def inject_nmi(self):
@@ -29966,7 +30038,7 @@ class IMachineDebugger(Interface):
         """
         if not isinstance(settings, basestring):
             raise TypeError("settings can only be an instance of type basestring")
-        self._call("modifyLogGroups", in_p=[settings])
+        self._call("modifyLogGroups", in_p=(settings,))
 
     def modify_log_flags(self, settings):
         """Modifies the debug or release logger flags.
@@ -29978,7 +30050,7 @@ class IMachineDebugger(Interface):
         """
         if not isinstance(settings, basestring):
             raise TypeError("settings can only be an instance of type basestring")
-        self._call("modifyLogFlags", in_p=[settings])
+        self._call("modifyLogFlags", in_p=(settings,))
 
     def modify_log_destinations(self, settings):
         """Modifies the debug or release logger destinations.
@@ -29990,7 +30062,7 @@ class IMachineDebugger(Interface):
         """
         if not isinstance(settings, basestring):
             raise TypeError("settings can only be an instance of type basestring")
-        self._call("modifyLogDestinations", in_p=[settings])
+        self._call("modifyLogDestinations", in_p=(settings,))
 
     def read_physical_memory(self, address, size):
         """Reads guest physical memory, no side effects (MMIO++).
@@ -30012,7 +30084,7 @@ class IMachineDebugger(Interface):
             raise TypeError("address can only be an instance of type baseinteger")
         if not isinstance(size, baseinteger):
             raise TypeError("size can only be an instance of type baseinteger")
-        bytes_p = self._call("readPhysicalMemory", in_p=[address, size])
+        bytes_p = self._call("readPhysicalMemory", in_p=(address, size))
         return bytes_p
 
     def write_physical_memory(self, address, size, bytes_p):
@@ -30040,7 +30112,7 @@ class IMachineDebugger(Interface):
         for a in bytes_p[:10]:
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
-        self._call("writePhysicalMemory", in_p=[address, size, bytes_p])
+        self._call("writePhysicalMemory", in_p=(address, size, bytes_p))
 
     def read_virtual_memory(self, cpu_id, address, size):
         """Reads guest virtual memory, no side effects (MMIO++).
@@ -30067,7 +30139,7 @@ class IMachineDebugger(Interface):
             raise TypeError("address can only be an instance of type baseinteger")
         if not isinstance(size, baseinteger):
             raise TypeError("size can only be an instance of type baseinteger")
-        bytes_p = self._call("readVirtualMemory", in_p=[cpu_id, address, size])
+        bytes_p = self._call("readVirtualMemory", in_p=(cpu_id, address, size))
         return bytes_p
 
     def write_virtual_memory(self, cpu_id, address, size, bytes_p):
@@ -30100,7 +30172,7 @@ class IMachineDebugger(Interface):
         for a in bytes_p[:10]:
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
-        self._call("writeVirtualMemory", in_p=[cpu_id, address, size, bytes_p])
+        self._call("writeVirtualMemory", in_p=(cpu_id, address, size, bytes_p))
 
     def load_plug_in(self, name):
         """Loads a DBGF plug-in.
@@ -30114,7 +30186,7 @@ class IMachineDebugger(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        plug_in_name = self._call("loadPlugIn", in_p=[name])
+        plug_in_name = self._call("loadPlugIn", in_p=(name,))
         return plug_in_name
 
     def unload_plug_in(self, name):
@@ -30126,7 +30198,7 @@ class IMachineDebugger(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        self._call("unloadPlugIn", in_p=[name])
+        self._call("unloadPlugIn", in_p=(name,))
 
     def detect_os(self):
         """Tries to (re-)detect the guest OS kernel.
@@ -30154,7 +30226,7 @@ class IMachineDebugger(Interface):
         """
         if not isinstance(max_messages, baseinteger):
             raise TypeError("max_messages can only be an instance of type baseinteger")
-        dmesg = self._call("queryOSKernelLog", in_p=[max_messages])
+        dmesg = self._call("queryOSKernelLog", in_p=(max_messages,))
         return dmesg
 
     def get_register(self, cpu_id, name):
@@ -30175,7 +30247,7 @@ class IMachineDebugger(Interface):
             raise TypeError("cpu_id can only be an instance of type baseinteger")
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        value = self._call("getRegister", in_p=[cpu_id, name])
+        value = self._call("getRegister", in_p=(cpu_id, name))
         return value
 
     def get_registers(self, cpu_id):
@@ -30194,7 +30266,7 @@ class IMachineDebugger(Interface):
         """
         if not isinstance(cpu_id, baseinteger):
             raise TypeError("cpu_id can only be an instance of type baseinteger")
-        (names, values) = self._call("getRegisters", in_p=[cpu_id])
+        (names, values) = self._call("getRegisters", in_p=(cpu_id,))
         return (names, values)
 
     def set_register(self, cpu_id, name, value):
@@ -30221,7 +30293,7 @@ class IMachineDebugger(Interface):
             raise TypeError("name can only be an instance of type basestring")
         if not isinstance(value, basestring):
             raise TypeError("value can only be an instance of type basestring")
-        self._call("setRegister", in_p=[cpu_id, name, value])
+        self._call("setRegister", in_p=(cpu_id, name, value))
 
     def set_registers(self, cpu_id, names, values):
         """Sets zero or more registers atomically.
@@ -30253,7 +30325,7 @@ class IMachineDebugger(Interface):
         for a in values[:10]:
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
-        self._call("setRegisters", in_p=[cpu_id, names, values])
+        self._call("setRegisters", in_p=(cpu_id, names, values))
 
     def dump_guest_stack(self, cpu_id):
         """Produce a simple stack dump using the current guest state.
@@ -30270,7 +30342,7 @@ class IMachineDebugger(Interface):
         """
         if not isinstance(cpu_id, baseinteger):
             raise TypeError("cpu_id can only be an instance of type baseinteger")
-        stack = self._call("dumpGuestStack", in_p=[cpu_id])
+        stack = self._call("dumpGuestStack", in_p=(cpu_id,))
         return stack
 
     def reset_stats(self, pattern):
@@ -30285,7 +30357,7 @@ class IMachineDebugger(Interface):
         """
         if not isinstance(pattern, basestring):
             raise TypeError("pattern can only be an instance of type basestring")
-        self._call("resetStats", in_p=[pattern])
+        self._call("resetStats", in_p=(pattern,))
 
     def dump_stats(self, pattern):
         """Dumps VM statistics.
@@ -30299,7 +30371,7 @@ class IMachineDebugger(Interface):
         """
         if not isinstance(pattern, basestring):
             raise TypeError("pattern can only be an instance of type basestring")
-        self._call("dumpStats", in_p=[pattern])
+        self._call("dumpStats", in_p=(pattern,))
 
     def get_stats(self, pattern, with_descriptions):
         """Get the VM statistics in a XMLish format.
@@ -30321,7 +30393,7 @@ class IMachineDebugger(Interface):
             raise TypeError("pattern can only be an instance of type basestring")
         if not isinstance(with_descriptions, bool):
             raise TypeError("with_descriptions can only be an instance of type bool")
-        stats = self._call("getStats", in_p=[pattern, with_descriptions])
+        stats = self._call("getStats", in_p=(pattern, with_descriptions))
         return stats
 
     def get_cpu_load(self, cpu_id):
@@ -30349,7 +30421,7 @@ class IMachineDebugger(Interface):
         if not isinstance(cpu_id, baseinteger):
             raise TypeError("cpu_id can only be an instance of type baseinteger")
         (ms_interval, pct_executing, pct_halted, pct_other) = self._call(
-            "getCPULoad", in_p=[cpu_id]
+            "getCPULoad", in_p=(cpu_id,)
         )
         return (ms_interval, pct_executing, pct_halted, pct_other)
 
@@ -30639,6 +30711,7 @@ class IUSBDeviceFilters(Interface):
 
     __uuid__ = "9709db9b-3346-49d6-8f1c-41b0c4784ff2"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def device_filters(self):
@@ -30692,7 +30765,7 @@ class IUSBDeviceFilters(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        filter_p = self._call("createDeviceFilter", in_p=[name])
+        filter_p = self._call("createDeviceFilter", in_p=(name,))
         filter_p = IUSBDeviceFilter(filter_p)
         return filter_p
 
@@ -30734,7 +30807,7 @@ class IUSBDeviceFilters(Interface):
             raise TypeError("position can only be an instance of type baseinteger")
         if not isinstance(filter_p, IUSBDeviceFilter):
             raise TypeError("filter_p can only be an instance of type IUSBDeviceFilter")
-        self._call("insertDeviceFilter", in_p=[position, filter_p])
+        self._call("insertDeviceFilter", in_p=(position, filter_p))
 
     def remove_device_filter(self, position):
         """Removes a USB device filter from the specified position in the
@@ -30761,7 +30834,7 @@ class IUSBDeviceFilters(Interface):
         """
         if not isinstance(position, baseinteger):
             raise TypeError("position can only be an instance of type baseinteger")
-        filter_p = self._call("removeDeviceFilter", in_p=[position])
+        filter_p = self._call("removeDeviceFilter", in_p=(position,))
         filter_p = IUSBDeviceFilter(filter_p)
         return filter_p
 
@@ -30773,6 +30846,7 @@ class IUSBController(Interface):
 
     __uuid__ = "ee206a6e-7ff8-4a84-bd34-0c651e118bb5"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def name(self):
@@ -30825,6 +30899,7 @@ class IUSBDevice(Interface):
 
     __uuid__ = "6dc83c2c-81a9-4005-9d52-fc45a78bf3f5"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def id_p(self):
@@ -31036,6 +31111,7 @@ class IUSBDeviceFilter(Interface):
 
     __uuid__ = "45587218-4289-ef4e-8e6a-e5b07816b631"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def name(self):
@@ -31231,6 +31307,7 @@ class IHostUSBDevice(IUSBDevice):
 
     __uuid__ = "c19073dd-cc7b-431b-98b2-951fda8eab89"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def state(self):
@@ -31262,6 +31339,7 @@ class IHostUSBDeviceFilter(IUSBDeviceFilter):
 
     __uuid__ = "01adb2d6-aedf-461c-be2c-99e91bdad8a1"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def action(self):
@@ -31287,6 +31365,7 @@ class IUSBProxyBackend(Interface):
 
     __uuid__ = "dfe56449-6989-4002-80cf-3607f377d40c"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def name(self):
@@ -31313,6 +31392,7 @@ class IAudioAdapter(Interface):
 
     __uuid__ = "5155bfd3-7ba7-45a8-b26d-c91ae3754e37"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def enabled(self):
@@ -31432,7 +31512,7 @@ class IAudioAdapter(Interface):
             raise TypeError("key can only be an instance of type basestring")
         if not isinstance(value, basestring):
             raise TypeError("value can only be an instance of type basestring")
-        self._call("setProperty", in_p=[key, value])
+        self._call("setProperty", in_p=(key, value))
 
     def get_property(self, key):
         """Returns an audio specific property string.
@@ -31449,7 +31529,7 @@ class IAudioAdapter(Interface):
         """
         if not isinstance(key, basestring):
             raise TypeError("key can only be an instance of type basestring")
-        value = self._call("getProperty", in_p=[key])
+        value = self._call("getProperty", in_p=(key,))
         return value
 
 
@@ -31460,6 +31540,7 @@ class IVRDEServer(Interface):
 
     __uuid__ = "08e25756-08a2-41af-a05f-d7c661abaebe"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def enabled(self):
@@ -31589,7 +31670,7 @@ class IVRDEServer(Interface):
             raise TypeError("key can only be an instance of type basestring")
         if not isinstance(value, basestring):
             raise TypeError("value can only be an instance of type basestring")
-        self._call("setVRDEProperty", in_p=[key, value])
+        self._call("setVRDEProperty", in_p=(key, value))
 
     def get_vrde_property(self, key):
         """Returns a VRDE specific property string.
@@ -31606,7 +31687,7 @@ class IVRDEServer(Interface):
         """
         if not isinstance(key, basestring):
             raise TypeError("key can only be an instance of type basestring")
-        value = self._call("getVRDEProperty", in_p=[key])
+        value = self._call("getVRDEProperty", in_p=(key,))
         return value
 
 
@@ -31662,6 +31743,7 @@ class ISharedFolder(Interface):
 
     __uuid__ = "9622225a-5409-414b-bd16-77df7ba3451e"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def name(self):
@@ -31766,6 +31848,7 @@ class IInternalSessionControl(Interface):
 
     __uuid__ = "f4638054-f1f8-4590-941a-cdb66075c5bf"
     __wsmap__ = "suppress"
+    __slots__ = ()
 
     @property
     def pid(self):
@@ -31817,7 +31900,7 @@ class IInternalSessionControl(Interface):
             raise TypeError("lock_type can only be an instance of type LockType")
         if not isinstance(token, IToken):
             raise TypeError("token can only be an instance of type IToken")
-        self._call("assignMachine", in_p=[machine, lock_type, token])
+        self._call("assignMachine", in_p=(machine, lock_type, token))
 
     def assign_remote_machine(self, machine, console):
         """Assigns the machine and the (remote) console object associated with
@@ -31835,7 +31918,7 @@ class IInternalSessionControl(Interface):
             raise TypeError("machine can only be an instance of type IMachine")
         if not isinstance(console, IConsole):
             raise TypeError("console can only be an instance of type IConsole")
-        self._call("assignRemoteMachine", in_p=[machine, console])
+        self._call("assignRemoteMachine", in_p=(machine, console))
 
     def update_machine_state(self, machine_state):
         """Updates the machine state in the VM process.
@@ -31855,7 +31938,7 @@ class IInternalSessionControl(Interface):
             raise TypeError(
                 "machine_state can only be an instance of type MachineState"
             )
-        self._call("updateMachineState", in_p=[machine_state])
+        self._call("updateMachineState", in_p=(machine_state,))
 
     def uninitialize(self):
         """Uninitializes (closes) this session. Used by VirtualBox to close
@@ -31889,7 +31972,7 @@ class IInternalSessionControl(Interface):
             )
         if not isinstance(change_adapter, bool):
             raise TypeError("change_adapter can only be an instance of type bool")
-        self._call("onNetworkAdapterChange", in_p=[network_adapter, change_adapter])
+        self._call("onNetworkAdapterChange", in_p=(network_adapter, change_adapter))
 
     def on_audio_adapter_change(self, audio_adapter):
         """Triggerd when settings of the audio adapter of the
@@ -31908,7 +31991,7 @@ class IInternalSessionControl(Interface):
             raise TypeError(
                 "audio_adapter can only be an instance of type IAudioAdapter"
             )
-        self._call("onAudioAdapterChange", in_p=[audio_adapter])
+        self._call("onAudioAdapterChange", in_p=(audio_adapter,))
 
     def on_serial_port_change(self, serial_port):
         """Triggered when settings of a serial port of the
@@ -31925,7 +32008,7 @@ class IInternalSessionControl(Interface):
         """
         if not isinstance(serial_port, ISerialPort):
             raise TypeError("serial_port can only be an instance of type ISerialPort")
-        self._call("onSerialPortChange", in_p=[serial_port])
+        self._call("onSerialPortChange", in_p=(serial_port,))
 
     def on_parallel_port_change(self, parallel_port):
         """Triggered when settings of a parallel port of the
@@ -31944,7 +32027,7 @@ class IInternalSessionControl(Interface):
             raise TypeError(
                 "parallel_port can only be an instance of type IParallelPort"
             )
-        self._call("onParallelPortChange", in_p=[parallel_port])
+        self._call("onParallelPortChange", in_p=(parallel_port,))
 
     def on_storage_controller_change(self, machine_id, controller_name):
         """Triggered when settings of a storage controller of the
@@ -31969,7 +32052,7 @@ class IInternalSessionControl(Interface):
             raise TypeError(
                 "controller_name can only be an instance of type basestring"
             )
-        self._call("onStorageControllerChange", in_p=[machine_id, controller_name])
+        self._call("onStorageControllerChange", in_p=(machine_id, controller_name))
 
     def on_medium_change(self, medium_attachment, force):
         """Triggered when attached media of the
@@ -31994,7 +32077,7 @@ class IInternalSessionControl(Interface):
             )
         if not isinstance(force, bool):
             raise TypeError("force can only be an instance of type bool")
-        self._call("onMediumChange", in_p=[medium_attachment, force])
+        self._call("onMediumChange", in_p=(medium_attachment, force))
 
     def on_storage_device_change(self, medium_attachment, remove, silent):
         """Triggered when attached storage devices of the
@@ -32025,7 +32108,7 @@ class IInternalSessionControl(Interface):
             raise TypeError("remove can only be an instance of type bool")
         if not isinstance(silent, bool):
             raise TypeError("silent can only be an instance of type bool")
-        self._call("onStorageDeviceChange", in_p=[medium_attachment, remove, silent])
+        self._call("onStorageDeviceChange", in_p=(medium_attachment, remove, silent))
 
     def on_vm_process_priority_change(self, priority):
         """Triggered when process priority of the
@@ -32046,7 +32129,7 @@ class IInternalSessionControl(Interface):
         """
         if not isinstance(priority, VMProcPriority):
             raise TypeError("priority can only be an instance of type VMProcPriority")
-        self._call("onVMProcessPriorityChange", in_p=[priority])
+        self._call("onVMProcessPriorityChange", in_p=(priority,))
 
     def on_clipboard_mode_change(self, clipboard_mode):
         """Notification when the shared clipboard mode changes.
@@ -32059,7 +32142,7 @@ class IInternalSessionControl(Interface):
             raise TypeError(
                 "clipboard_mode can only be an instance of type ClipboardMode"
             )
-        self._call("onClipboardModeChange", in_p=[clipboard_mode])
+        self._call("onClipboardModeChange", in_p=(clipboard_mode,))
 
     def on_clipboard_file_transfer_mode_change(self, enabled):
         """Notification when the shared clipboard file transfers mode changes.
@@ -32070,7 +32153,7 @@ class IInternalSessionControl(Interface):
         """
         if not isinstance(enabled, bool):
             raise TypeError("enabled can only be an instance of type bool")
-        self._call("onClipboardFileTransferModeChange", in_p=[enabled])
+        self._call("onClipboardFileTransferModeChange", in_p=(enabled,))
 
     def on_dn_d_mode_change(self, dnd_mode):
         """Notification when the drag'n drop mode changes.
@@ -32081,7 +32164,7 @@ class IInternalSessionControl(Interface):
         """
         if not isinstance(dnd_mode, DnDMode):
             raise TypeError("dnd_mode can only be an instance of type DnDMode")
-        self._call("onDnDModeChange", in_p=[dnd_mode])
+        self._call("onDnDModeChange", in_p=(dnd_mode,))
 
     def on_cpu_change(self, cpu, add):
         """Notification when a CPU changes.
@@ -32097,7 +32180,7 @@ class IInternalSessionControl(Interface):
             raise TypeError("cpu can only be an instance of type baseinteger")
         if not isinstance(add, bool):
             raise TypeError("add can only be an instance of type bool")
-        self._call("onCPUChange", in_p=[cpu, add])
+        self._call("onCPUChange", in_p=(cpu, add))
 
     def on_cpu_execution_cap_change(self, execution_cap):
         """Notification when the CPU execution cap changes.
@@ -32108,7 +32191,7 @@ class IInternalSessionControl(Interface):
         """
         if not isinstance(execution_cap, baseinteger):
             raise TypeError("execution_cap can only be an instance of type baseinteger")
-        self._call("onCPUExecutionCapChange", in_p=[execution_cap])
+        self._call("onCPUExecutionCapChange", in_p=(execution_cap,))
 
     def on_vrde_server_change(self, restart):
         """Triggered when settings of the VRDE server object of the
@@ -32126,7 +32209,7 @@ class IInternalSessionControl(Interface):
         """
         if not isinstance(restart, bool):
             raise TypeError("restart can only be an instance of type bool")
-        self._call("onVRDEServerChange", in_p=[restart])
+        self._call("onVRDEServerChange", in_p=(restart,))
 
     def on_recording_change(self, enable):
         """Triggered when recording settings have changed.
@@ -32137,7 +32220,7 @@ class IInternalSessionControl(Interface):
         """
         if not isinstance(enable, bool):
             raise TypeError("enable can only be an instance of type bool")
-        self._call("onRecordingChange", in_p=[enable])
+        self._call("onRecordingChange", in_p=(enable,))
 
     def on_usb_controller_change(self):
         """Triggered when settings of the USB controller object of the
@@ -32172,7 +32255,7 @@ class IInternalSessionControl(Interface):
         """
         if not isinstance(global_p, bool):
             raise TypeError("global_p can only be an instance of type bool")
-        self._call("onSharedFolderChange", in_p=[global_p])
+        self._call("onSharedFolderChange", in_p=(global_p,))
 
     def on_usb_device_attach(self, device, error, masked_interfaces, capture_filename):
         """Triggered when a request to capture a USB device (as a result
@@ -32212,7 +32295,7 @@ class IInternalSessionControl(Interface):
             )
         self._call(
             "onUSBDeviceAttach",
-            in_p=[device, error, masked_interfaces, capture_filename],
+            in_p=(device, error, masked_interfaces, capture_filename),
         )
 
     def on_usb_device_detach(self, id_p, error):
@@ -32239,7 +32322,7 @@ class IInternalSessionControl(Interface):
             raise TypeError(
                 "error can only be an instance of type IVirtualBoxErrorInfo"
             )
-        self._call("onUSBDeviceDetach", in_p=[id_p, error])
+        self._call("onUSBDeviceDetach", in_p=(id_p, error))
 
     def on_show_window(self, check):
         """Called by :py:func:`IMachine.can_show_console_window`  and by
@@ -32260,7 +32343,7 @@ class IInternalSessionControl(Interface):
         """
         if not isinstance(check, bool):
             raise TypeError("check can only be an instance of type bool")
-        (can_show, win_id) = self._call("onShowWindow", in_p=[check])
+        (can_show, win_id) = self._call("onShowWindow", in_p=(check,))
         return (can_show, win_id)
 
     def on_bandwidth_group_change(self, bandwidth_group):
@@ -32274,7 +32357,7 @@ class IInternalSessionControl(Interface):
             raise TypeError(
                 "bandwidth_group can only be an instance of type IBandwidthGroup"
             )
-        self._call("onBandwidthGroupChange", in_p=[bandwidth_group])
+        self._call("onBandwidthGroupChange", in_p=(bandwidth_group,))
 
     def access_guest_property(self, name, value, flags, access_mode):
         """Called by :py:func:`IMachine.get_guest_property`  and by
@@ -32318,7 +32401,7 @@ class IInternalSessionControl(Interface):
         if not isinstance(access_mode, baseinteger):
             raise TypeError("access_mode can only be an instance of type baseinteger")
         (ret_value, ret_timestamp, ret_flags) = self._call(
-            "accessGuestProperty", in_p=[name, value, flags, access_mode]
+            "accessGuestProperty", in_p=(name, value, flags, access_mode)
         )
         return (ret_value, ret_timestamp, ret_flags)
 
@@ -32356,7 +32439,7 @@ class IInternalSessionControl(Interface):
         if not isinstance(patterns, basestring):
             raise TypeError("patterns can only be an instance of type basestring")
         (keys, values, timestamps, flags) = self._call(
-            "enumerateGuestProperties", in_p=[patterns]
+            "enumerateGuestProperties", in_p=(patterns,)
         )
         return (keys, values, timestamps, flags)
 
@@ -32397,7 +32480,7 @@ class IInternalSessionControl(Interface):
             raise TypeError("progress can only be an instance of type IProgress")
         self._call(
             "onlineMergeMedium",
-            in_p=[medium_attachment, source_idx, target_idx, progress],
+            in_p=(medium_attachment, source_idx, target_idx, progress),
         )
 
     def reconfigure_medium_attachments(self, attachments):
@@ -32422,7 +32505,7 @@ class IInternalSessionControl(Interface):
                 raise TypeError(
                     "array can only contain objects of type IMediumAttachment"
                 )
-        self._call("reconfigureMediumAttachments", in_p=[attachments])
+        self._call("reconfigureMediumAttachments", in_p=(attachments,))
 
     def enable_vmm_statistics(self, enable):
         """Enables or disables collection of VMM RAM statistics.
@@ -32439,7 +32522,7 @@ class IInternalSessionControl(Interface):
         """
         if not isinstance(enable, bool):
             raise TypeError("enable can only be an instance of type bool")
-        self._call("enableVMMStatistics", in_p=[enable])
+        self._call("enableVMMStatistics", in_p=(enable,))
 
     def pause_with_reason(self, reason):
         """Internal method for triggering a VM pause with a specified reason code.
@@ -32461,7 +32544,7 @@ class IInternalSessionControl(Interface):
         """
         if not isinstance(reason, Reason):
             raise TypeError("reason can only be an instance of type Reason")
-        self._call("pauseWithReason", in_p=[reason])
+        self._call("pauseWithReason", in_p=(reason,))
 
     def resume_with_reason(self, reason):
         """Internal method for triggering a VM resume with a specified reason code.
@@ -32483,7 +32566,7 @@ class IInternalSessionControl(Interface):
         """
         if not isinstance(reason, Reason):
             raise TypeError("reason can only be an instance of type Reason")
-        self._call("resumeWithReason", in_p=[reason])
+        self._call("resumeWithReason", in_p=(reason,))
 
     def save_state_with_reason(
         self, reason, progress, snapshot, state_file_path, pause_vm
@@ -32540,7 +32623,7 @@ class IInternalSessionControl(Interface):
             raise TypeError("pause_vm can only be an instance of type bool")
         left_paused = self._call(
             "saveStateWithReason",
-            in_p=[reason, progress, snapshot, state_file_path, pause_vm],
+            in_p=(reason, progress, snapshot, state_file_path, pause_vm),
         )
         return left_paused
 
@@ -32610,6 +32693,7 @@ class ISession(Interface):
 
     __uuid__ = "c0447716-ff5a-4795-b57a-ecd5fffa18a4"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def state(self):
@@ -32714,6 +32798,7 @@ class IStorageController(Interface):
 
     __uuid__ = "ddca7247-bf98-47fb-ab2f-b5177533f493"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def name(self):
@@ -32856,6 +32941,7 @@ class IPerformanceMetric(Interface):
 
     __uuid__ = "81314d14-fd1c-411a-95c5-e9bb1414e632"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def metric_name(self):
@@ -33031,6 +33117,7 @@ class IPerformanceCollector(Interface):
 
     __uuid__ = "b14290ad-cd54-400c-b858-797bcb82570e"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def metric_names(self):
@@ -33072,7 +33159,7 @@ class IPerformanceCollector(Interface):
         for a in objects[:10]:
             if not isinstance(a, Interface):
                 raise TypeError("array can only contain objects of type Interface")
-        metrics = self._call("getMetrics", in_p=[metric_names, objects])
+        metrics = self._call("getMetrics", in_p=(metric_names, objects))
         metrics = [IPerformanceMetric(a) for a in metrics]
         return metrics
 
@@ -33121,7 +33208,7 @@ class IPerformanceCollector(Interface):
         if not isinstance(count, baseinteger):
             raise TypeError("count can only be an instance of type baseinteger")
         affected_metrics = self._call(
-            "setupMetrics", in_p=[metric_names, objects, period, count]
+            "setupMetrics", in_p=(metric_names, objects, period, count)
         )
         affected_metrics = [IPerformanceMetric(a) for a in affected_metrics]
         return affected_metrics
@@ -33158,7 +33245,7 @@ class IPerformanceCollector(Interface):
         for a in objects[:10]:
             if not isinstance(a, Interface):
                 raise TypeError("array can only contain objects of type Interface")
-        affected_metrics = self._call("enableMetrics", in_p=[metric_names, objects])
+        affected_metrics = self._call("enableMetrics", in_p=(metric_names, objects))
         affected_metrics = [IPerformanceMetric(a) for a in affected_metrics]
         return affected_metrics
 
@@ -33194,7 +33281,7 @@ class IPerformanceCollector(Interface):
         for a in objects[:10]:
             if not isinstance(a, Interface):
                 raise TypeError("array can only contain objects of type Interface")
-        affected_metrics = self._call("disableMetrics", in_p=[metric_names, objects])
+        affected_metrics = self._call("disableMetrics", in_p=(metric_names, objects))
         affected_metrics = [IPerformanceMetric(a) for a in affected_metrics]
         return affected_metrics
 
@@ -33292,7 +33379,7 @@ class IPerformanceCollector(Interface):
             return_sequence_numbers,
             return_data_indices,
             return_data_lengths,
-        ) = self._call("queryMetricsData", in_p=[metric_names, objects])
+        ) = self._call("queryMetricsData", in_p=(metric_names, objects))
         return_objects = [Interface(a) for a in return_objects]
         return (
             return_data,
@@ -33315,6 +33402,7 @@ class INATEngine(Interface):
 
     __uuid__ = "8faef61e-6e15-4f71-a6a5-94e707fafbcc"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def network(self):
@@ -33490,7 +33578,7 @@ class INATEngine(Interface):
             raise TypeError("tcp_wnd_rcv can only be an instance of type baseinteger")
         self._call(
             "setNetworkSettings",
-            in_p=[mtu, sock_snd, sock_rcv, tcp_wnd_snd, tcp_wnd_rcv],
+            in_p=(mtu, sock_snd, sock_rcv, tcp_wnd_snd, tcp_wnd_rcv),
         )
 
     def get_network_settings(self):
@@ -33552,7 +33640,7 @@ class INATEngine(Interface):
         if not isinstance(guest_port, baseinteger):
             raise TypeError("guest_port can only be an instance of type baseinteger")
         self._call(
-            "addRedirect", in_p=[name, proto, host_ip, host_port, guest_ip, guest_port]
+            "addRedirect", in_p=(name, proto, host_ip, host_port, guest_ip, guest_port)
         )
 
     def remove_redirect(self, name):
@@ -33564,7 +33652,7 @@ class INATEngine(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        self._call("removeRedirect", in_p=[name])
+        self._call("removeRedirect", in_p=(name,))
 
 
 class IExtPackPlugIn(Interface):
@@ -33575,6 +33663,7 @@ class IExtPackPlugIn(Interface):
 
     __uuid__ = "78861431-d545-44aa-8013-181b8c288554"
     __wsmap__ = "suppress"
+    __slots__ = ()
 
     @property
     def name(self):
@@ -33617,6 +33706,7 @@ class IExtPackBase(Interface):
 
     __uuid__ = "f25aca3d-0b79-4350-bdd9-a0376cd6e6e3"
     __wsmap__ = "suppress"
+    __slots__ = ()
 
     @property
     def name(self):
@@ -33755,7 +33845,7 @@ class IExtPackBase(Interface):
         if not isinstance(format_p, basestring):
             raise TypeError("format_p can only be an instance of type basestring")
         license_text = self._call(
-            "queryLicense", in_p=[preferred_locale, preferred_language, format_p]
+            "queryLicense", in_p=(preferred_locale, preferred_language, format_p)
         )
         return license_text
 
@@ -33768,6 +33858,7 @@ class IExtPack(IExtPackBase):
 
     __uuid__ = "431685da-3618-4ebc-b038-833ba829b4b2"
     __wsmap__ = "suppress"
+    __slots__ = ()
 
     def query_object(self, obj_uuid):
         """Queries the IUnknown interface to an object in the extension pack
@@ -33783,7 +33874,7 @@ class IExtPack(IExtPackBase):
         """
         if not isinstance(obj_uuid, basestring):
             raise TypeError("obj_uuid can only be an instance of type basestring")
-        return_interface = self._call("queryObject", in_p=[obj_uuid])
+        return_interface = self._call("queryObject", in_p=(obj_uuid,))
         return_interface = Interface(return_interface)
         return return_interface
 
@@ -33797,6 +33888,7 @@ class IExtPackFile(IExtPackBase):
 
     __uuid__ = "41304f1b-7e72-4f34-b8f6-682785620c57"
     __wsmap__ = "suppress"
+    __slots__ = ()
 
     @property
     def file_path(self):
@@ -33824,7 +33916,7 @@ class IExtPackFile(IExtPackBase):
             raise TypeError("replace can only be an instance of type bool")
         if not isinstance(display_info, basestring):
             raise TypeError("display_info can only be an instance of type basestring")
-        progess = self._call("install", in_p=[replace, display_info])
+        progess = self._call("install", in_p=(replace, display_info))
         progess = IProgress(progess)
         return progess
 
@@ -33838,6 +33930,7 @@ class IExtPackManager(Interface):
 
     __uuid__ = "70401eef-c8e9-466b-9660-45cb3e9979e4"
     __wsmap__ = "suppress"
+    __slots__ = ()
 
     @property
     def installed_ext_packs(self):
@@ -33862,7 +33955,7 @@ class IExtPackManager(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        return_data = self._call("find", in_p=[name])
+        return_data = self._call("find", in_p=(name,))
         return_data = IExtPack(return_data)
         return return_data
 
@@ -33880,7 +33973,7 @@ class IExtPackManager(Interface):
         """
         if not isinstance(path, basestring):
             raise TypeError("path can only be an instance of type basestring")
-        file_p = self._call("openExtPackFile", in_p=[path])
+        file_p = self._call("openExtPackFile", in_p=(path,))
         file_p = IExtPackFile(file_p)
         return file_p
 
@@ -33907,7 +34000,7 @@ class IExtPackManager(Interface):
             raise TypeError("forced_removal can only be an instance of type bool")
         if not isinstance(display_info, basestring):
             raise TypeError("display_info can only be an instance of type basestring")
-        progess = self._call("uninstall", in_p=[name, forced_removal, display_info])
+        progess = self._call("uninstall", in_p=(name, forced_removal, display_info))
         progess = IProgress(progess)
         return progess
 
@@ -33930,7 +34023,7 @@ class IExtPackManager(Interface):
         """
         if not isinstance(frontend_name, basestring):
             raise TypeError("frontend_name can only be an instance of type basestring")
-        plug_in_modules = self._call("queryAllPlugInsForFrontend", in_p=[frontend_name])
+        plug_in_modules = self._call("queryAllPlugInsForFrontend", in_p=(frontend_name,))
         return plug_in_modules
 
     def is_ext_pack_usable(self, name):
@@ -33945,7 +34038,7 @@ class IExtPackManager(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        usable = self._call("isExtPackUsable", in_p=[name])
+        usable = self._call("isExtPackUsable", in_p=(name,))
         return usable
 
 
@@ -33956,6 +34049,7 @@ class IBandwidthGroup(Interface):
 
     __uuid__ = "31587f93-2d12-4d7c-ba6d-ce51d0d5b265"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def name(self):
@@ -34005,6 +34099,7 @@ class IBandwidthControl(Interface):
 
     __uuid__ = "48c7f4c0-c9d6-4742-957c-a6fd52e8c4ae"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def num_groups(self):
@@ -34036,7 +34131,7 @@ class IBandwidthControl(Interface):
             raise TypeError(
                 "max_bytes_per_sec can only be an instance of type baseinteger"
             )
-        self._call("createBandwidthGroup", in_p=[name, type_p, max_bytes_per_sec])
+        self._call("createBandwidthGroup", in_p=(name, type_p, max_bytes_per_sec))
 
     def delete_bandwidth_group(self, name):
         """Deletes a new bandwidth group.
@@ -34047,7 +34142,7 @@ class IBandwidthControl(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        self._call("deleteBandwidthGroup", in_p=[name])
+        self._call("deleteBandwidthGroup", in_p=(name,))
 
     def get_bandwidth_group(self, name):
         """Get a bandwidth group by name.
@@ -34061,7 +34156,7 @@ class IBandwidthControl(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        bandwidth_group = self._call("getBandwidthGroup", in_p=[name])
+        bandwidth_group = self._call("getBandwidthGroup", in_p=(name,))
         bandwidth_group = IBandwidthGroup(bandwidth_group)
         return bandwidth_group
 
@@ -34095,6 +34190,7 @@ class IVirtualBoxClient(Interface):
 
     __uuid__ = "d2937a8e-cb8d-4382-90ba-b7da78a74573"
     __wsmap__ = "suppress"
+    __slots__ = ()
 
     @property
     def virtual_box(self):
@@ -34132,7 +34228,7 @@ class IVirtualBoxClient(Interface):
         """
         if not isinstance(machine, IMachine):
             raise TypeError("machine can only be an instance of type IMachine")
-        self._call("checkMachineError", in_p=[machine])
+        self._call("checkMachineError", in_p=(machine,))
 
 
 class IEventSource(Interface):
@@ -34148,6 +34244,7 @@ class IEventSource(Interface):
 
     __uuid__ = "9b6e1aee-35f3-4f4d-b5bb-ed0ecefd8538"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     def create_listener(self):
         """Creates a new listener object, useful for passive mode.
@@ -34176,7 +34273,7 @@ class IEventSource(Interface):
         for a in subordinates[:10]:
             if not isinstance(a, IEventSource):
                 raise TypeError("array can only contain objects of type IEventSource")
-        result = self._call("createAggregator", in_p=[subordinates])
+        result = self._call("createAggregator", in_p=(subordinates,))
         result = IEventSource(result)
         return result
 
@@ -34217,7 +34314,7 @@ class IEventSource(Interface):
                 raise TypeError("array can only contain objects of type VBoxEventType")
         if not isinstance(active, bool):
             raise TypeError("active can only be an instance of type bool")
-        self._call("registerListener", in_p=[listener, interesting, active])
+        self._call("registerListener", in_p=(listener, interesting, active))
 
     def unregister_listener(self, listener):
         """Unregister an event listener. If listener is passive, and some waitable events are still
@@ -34229,7 +34326,7 @@ class IEventSource(Interface):
         """
         if not isinstance(listener, IEventListener):
             raise TypeError("listener can only be an instance of type IEventListener")
-        self._call("unregisterListener", in_p=[listener])
+        self._call("unregisterListener", in_p=(listener,))
 
     def fire_event(self, event, timeout):
         """Fire an event for this source.
@@ -34249,7 +34346,7 @@ class IEventSource(Interface):
             raise TypeError("event can only be an instance of type IEvent")
         if not isinstance(timeout, baseinteger):
             raise TypeError("timeout can only be an instance of type baseinteger")
-        result = self._call("fireEvent", in_p=[event, timeout])
+        result = self._call("fireEvent", in_p=(event, timeout))
         return result
 
     def get_event(self, listener, timeout):
@@ -34275,7 +34372,7 @@ class IEventSource(Interface):
             raise TypeError("listener can only be an instance of type IEventListener")
         if not isinstance(timeout, baseinteger):
             raise TypeError("timeout can only be an instance of type baseinteger")
-        event = self._call("getEvent", in_p=[listener, timeout])
+        event = self._call("getEvent", in_p=(listener, timeout))
         event = IEvent(event)
         return event
 
@@ -34295,7 +34392,7 @@ class IEventSource(Interface):
             raise TypeError("listener can only be an instance of type IEventListener")
         if not isinstance(event, IEvent):
             raise TypeError("event can only be an instance of type IEvent")
-        self._call("eventProcessed", in_p=[listener, event])
+        self._call("eventProcessed", in_p=(listener, event))
 
 
 class IEventListener(Interface):
@@ -34307,6 +34404,7 @@ class IEventListener(Interface):
 
     __uuid__ = "67099191-32e7-4f6c-85ee-422304c71b90"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     def handle_event(self, event):
         """Handle event callback for active listeners. It is not called for
@@ -34322,7 +34420,7 @@ class IEventListener(Interface):
         """
         if not isinstance(event, IEvent):
             raise TypeError("event can only be an instance of type IEvent")
-        self._call("handleEvent", in_p=[event])
+        self._call("handleEvent", in_p=(event,))
 
 
 class IEvent(Interface):
@@ -34402,6 +34500,7 @@ class IEvent(Interface):
 
     __uuid__ = "0ca2adba-8f30-401b-a8cd-fe31dbe839c0"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def type_p(self):
@@ -34453,7 +34552,7 @@ class IEvent(Interface):
         """
         if not isinstance(timeout, baseinteger):
             raise TypeError("timeout can only be an instance of type baseinteger")
-        result = self._call("waitProcessed", in_p=[timeout])
+        result = self._call("waitProcessed", in_p=(timeout,))
         return result
 
 
@@ -34464,6 +34563,7 @@ class IReusableEvent(IEvent):
 
     __uuid__ = "69bfb134-80f6-4266-8e20-16371f68fa25"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def generation(self):
@@ -34488,6 +34588,7 @@ class IMachineEvent(IEvent):
 
     __uuid__ = "92ed7b1a-0d96-40ed-ae46-a564d484325e"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.machine_event
 
     @property
@@ -34506,6 +34607,7 @@ class IMachineStateChangedEvent(IMachineEvent):
 
     __uuid__ = "5748F794-48DF-438D-85EB-98FFD70D18C9"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_machine_state_changed
 
     @property
@@ -34524,6 +34626,7 @@ class IMachineDataChangedEvent(IMachineEvent):
 
     __uuid__ = "abe94809-2e88-4436-83d7-50f3e64d0503"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_machine_data_changed
 
     @property
@@ -34546,6 +34649,7 @@ class IMediumRegisteredEvent(IEvent):
 
     __uuid__ = "53fac49a-b7f1-4a5a-a4ef-a11dd9c2a458"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_medium_registered
 
     @property
@@ -34582,6 +34686,7 @@ class IMediumConfigChangedEvent(IEvent):
 
     __uuid__ = "dd3e2654-a161-41f1-b583-4892f4a9d5d5"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_medium_config_changed
 
     @property
@@ -34601,6 +34706,7 @@ class IMachineRegisteredEvent(IMachineEvent):
 
     __uuid__ = "c354a762-3ff2-4f2e-8f09-07382ee25088"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_machine_registered
 
     @property
@@ -34621,6 +34727,7 @@ class ISessionStateChangedEvent(IMachineEvent):
 
     __uuid__ = "714a3eef-799a-4489-86cd-fe8e45b2ff8e"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_session_state_changed
 
     @property
@@ -34639,6 +34746,7 @@ class IGuestPropertyChangedEvent(IMachineEvent):
 
     __uuid__ = "3f63597a-26f1-4edb-8dd2-6bddd0912368"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_guest_property_changed
 
     @property
@@ -34673,6 +34781,7 @@ class ISnapshotEvent(IMachineEvent):
 
     __uuid__ = "21637b0e-34b8-42d3-acfb-7e96daf77c22"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.snapshot_event
 
     @property
@@ -34692,6 +34801,7 @@ class ISnapshotTakenEvent(ISnapshotEvent):
 
     __uuid__ = "d27c0b3d-6038-422c-b45e-6d4a0503d9f1"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_snapshot_taken
 
     @property
@@ -34716,6 +34826,7 @@ class ISnapshotDeletedEvent(ISnapshotEvent):
 
     __uuid__ = "c48f3401-4a9e-43f4-b7a7-54bd285e22f4"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_snapshot_deleted
 
     @property
@@ -34733,6 +34844,7 @@ class ISnapshotRestoredEvent(ISnapshotEvent):
 
     __uuid__ = "f4d803b4-9b2d-4377-bfe6-9702e881516b"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_snapshot_restored
 
     @property
@@ -34750,6 +34862,7 @@ class ISnapshotChangedEvent(ISnapshotEvent):
 
     __uuid__ = "07541941-8079-447a-a33e-47a69c7980db"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_snapshot_changed
 
     @property
@@ -34767,6 +34880,7 @@ class IMousePointerShapeChangedEvent(IEvent):
 
     __uuid__ = "a6dcf6e8-416b-4181-8c4a-45ec95177aef"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_mouse_pointer_shape_changed
 
     @property
@@ -34859,6 +34973,7 @@ class IMouseCapabilityChangedEvent(IEvent):
 
     __uuid__ = "70e7779a-e64a-4908-804e-371cad23a756"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_mouse_capability_changed
 
     @property
@@ -34902,6 +35017,7 @@ class IKeyboardLedsChangedEvent(IEvent):
 
     __uuid__ = "6DDEF35E-4737-457B-99FC-BC52C851A44F"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_keyboard_leds_changed
 
     @property
@@ -34937,6 +35053,7 @@ class IStateChangedEvent(IEvent):
 
     __uuid__ = "4376693C-CF37-453B-9289-3B0F521CAF27"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_state_changed
 
     @property
@@ -34957,6 +35074,7 @@ class IAdditionsStateChangedEvent(IEvent):
 
     __uuid__ = "D70F7915-DA7C-44C8-A7AC-9F173490446A"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_additions_state_changed
 
     @property
@@ -34976,6 +35094,7 @@ class INetworkAdapterChangedEvent(IEvent):
 
     __uuid__ = "08889892-1EC6-4883-801D-77F56CFD0103"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_network_adapter_changed
 
     @property
@@ -34996,6 +35115,7 @@ class IAudioAdapterChangedEvent(IEvent):
 
     __uuid__ = "D5ABC823-04D0-4DB6-8D66-DC2F033120E1"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_audio_adapter_changed
 
     @property
@@ -35017,6 +35137,7 @@ class ISerialPortChangedEvent(IEvent):
 
     __uuid__ = "3BA329DC-659C-488B-835C-4ECA7AE71C6C"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_serial_port_changed
 
     @property
@@ -35038,6 +35159,7 @@ class IParallelPortChangedEvent(IEvent):
 
     __uuid__ = "813C99FC-9849-4F47-813E-24A75DC85615"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_parallel_port_changed
 
     @property
@@ -35058,6 +35180,7 @@ class IStorageControllerChangedEvent(IEvent):
 
     __uuid__ = "6BB335CC-1C58-440C-BB7B-3A1397284C7B"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_storage_controller_changed
 
     @property
@@ -35086,6 +35209,7 @@ class IMediumChangedEvent(IEvent):
 
     __uuid__ = "0FE2DA40-5637-472A-9736-72019EABD7DE"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_medium_changed
 
     @property
@@ -35104,6 +35228,7 @@ class IClipboardModeChangedEvent(IEvent):
 
     __uuid__ = "cac21692-7997-4595-a731-3a509db604e5"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_clipboard_mode_changed
 
     @property
@@ -35122,6 +35247,7 @@ class IClipboardFileTransferModeChangedEvent(IEvent):
 
     __uuid__ = "00391758-00B1-4E9D-0000-11FA00F9D583"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_clipboard_file_transfer_mode_changed
 
     @property
@@ -35140,6 +35266,7 @@ class IDnDModeChangedEvent(IEvent):
 
     __uuid__ = "b55cf856-1f8b-4692-abb4-462429fae5e9"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_dn_d_mode_changed
 
     @property
@@ -35158,6 +35285,7 @@ class ICPUChangedEvent(IEvent):
 
     __uuid__ = "4da2dec7-71b2-4817-9a64-4ed12c17388e"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_cpu_changed
 
     @property
@@ -35184,6 +35312,7 @@ class ICPUExecutionCapChangedEvent(IEvent):
 
     __uuid__ = "dfa7e4f5-b4a4-44ce-85a8-127ac5eb59dc"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_cpu_execution_cap_changed
 
     @property
@@ -35202,6 +35331,7 @@ class IGuestKeyboardEvent(IEvent):
 
     __uuid__ = "88394258-7006-40d4-b339-472ee3801844"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_guest_keyboard
 
     @property
@@ -35220,6 +35350,7 @@ class IGuestMouseEvent(IReusableEvent):
 
     __uuid__ = "179f8647-319c-4e7e-8150-c5837bd265f6"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_guest_mouse
 
     @property
@@ -35278,6 +35409,7 @@ class IGuestMultiTouchEvent(IEvent):
 
     __uuid__ = "be8a0eb5-f4f4-4dd0-9d30-c89b873247ec"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_guest_multi_touch
 
     @property
@@ -35338,6 +35470,7 @@ class IGuestSessionEvent(IEvent):
 
     __uuid__ = "b9acd33f-647d-45ac-8fe9-f49b3183ba37"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def session(self):
@@ -35355,6 +35488,7 @@ class IGuestSessionStateChangedEvent(IGuestSessionEvent):
 
     __uuid__ = "327e3c00-ee61-462f-aed3-0dff6cbf9904"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_guest_session_state_changed
 
     @property
@@ -35393,6 +35527,7 @@ class IGuestSessionRegisteredEvent(IGuestSessionEvent):
 
     __uuid__ = "b79de686-eabd-4fa6-960a-f1756c99ea1c"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_guest_session_registered
 
     @property
@@ -35412,6 +35547,7 @@ class IGuestProcessEvent(IGuestSessionEvent):
 
     __uuid__ = "2405f0e5-6588-40a3-9b0a-68c05ba52c4b"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def process(self):
@@ -35437,6 +35573,7 @@ class IGuestProcessRegisteredEvent(IGuestProcessEvent):
 
     __uuid__ = "1d89e2b3-c6ea-45b6-9d43-dc6f70cc9f02"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_guest_process_registered
 
     @property
@@ -35456,6 +35593,7 @@ class IGuestProcessStateChangedEvent(IGuestProcessEvent):
 
     __uuid__ = "c365fb7b-4430-499f-92c8-8bed814a567a"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_guest_process_state_changed
 
     @property
@@ -35486,6 +35624,7 @@ class IGuestProcessIOEvent(IGuestProcessEvent):
 
     __uuid__ = "9ea9227c-e9bb-49b3-bfc7-c5171e93ef38"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def handle(self):
@@ -35513,6 +35652,7 @@ class IGuestProcessInputNotifyEvent(IGuestProcessIOEvent):
 
     __uuid__ = "0de887f2-b7db-4616-aac6-cfb94d89ba78"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_guest_process_input_notify
 
     @property
@@ -35531,6 +35671,7 @@ class IGuestProcessOutputEvent(IGuestProcessIOEvent):
 
     __uuid__ = "d3d5f1ee-bcb2-4905-a7ab-cc85448a742b"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_guest_process_output
 
     @property
@@ -35549,6 +35690,7 @@ class IGuestFileEvent(IGuestSessionEvent):
 
     __uuid__ = "c8adb7b0-057d-4391-b928-f14b06b710c5"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def file_p(self):
@@ -35566,6 +35708,7 @@ class IGuestFileRegisteredEvent(IGuestFileEvent):
 
     __uuid__ = "d0d93830-70a2-487e-895e-d3fc9679f7b3"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_guest_file_registered
 
     @property
@@ -35585,6 +35728,7 @@ class IGuestFileStateChangedEvent(IGuestFileEvent):
 
     __uuid__ = "d37fe88f-0979-486c-baa1-3abb144dc82d"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_guest_file_state_changed
 
     @property
@@ -35615,6 +35759,7 @@ class IGuestFileIOEvent(IGuestFileEvent):
 
     __uuid__ = "b5191a7c-9536-4ef8-820e-3b0e17e5bbc8"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def offset(self):
@@ -35640,6 +35785,7 @@ class IGuestFileOffsetChangedEvent(IGuestFileIOEvent):
 
     __uuid__ = "e8f79a21-1207-4179-94cf-ca250036308f"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_guest_file_offset_changed
 
     @property
@@ -35656,6 +35802,7 @@ class IGuestFileSizeChangedEvent(IGuestFileEvent):
 
     __uuid__ = "d78374e9-486e-472f-481b-969746af2480"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_guest_file_size_changed
 
     @property
@@ -35672,6 +35819,7 @@ class IGuestFileReadEvent(IGuestFileIOEvent):
 
     __uuid__ = "4ee3cbcb-486f-40db-9150-deee3fd24189"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_guest_file_read
 
     @property
@@ -35690,6 +35838,7 @@ class IGuestFileWriteEvent(IGuestFileIOEvent):
 
     __uuid__ = "e062a915-3cf5-4c0a-bc90-9b8d4cc94d89"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_guest_file_write
 
     @property
@@ -35709,6 +35858,7 @@ class IVRDEServerChangedEvent(IEvent):
 
     __uuid__ = "a06fd66a-3188-4c8c-8756-1395e8cb691c"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_vrde_server_changed
 
     @property
@@ -35727,6 +35877,7 @@ class IVRDEServerInfoChangedEvent(IEvent):
 
     __uuid__ = "dd6a1080-e1b7-4339-a549-f0878115596e"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_vrde_server_info_changed
 
     @property
@@ -35743,6 +35894,7 @@ class IRecordingChangedEvent(IEvent):
 
     __uuid__ = "B5DDB370-08A7-4C8F-910D-47AABD67253A"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_recording_changed
 
     @property
@@ -35762,6 +35914,7 @@ class IUSBControllerChangedEvent(IEvent):
 
     __uuid__ = "93BADC0C-61D9-4940-A084-E6BB29AF3D83"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_usb_controller_changed
 
     @property
@@ -35794,6 +35947,7 @@ class IUSBDeviceStateChangedEvent(IEvent):
 
     __uuid__ = "806da61b-6679-422a-b629-51b06b0c6d93"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_usb_device_state_changed
 
     @property
@@ -35836,6 +35990,7 @@ class ISharedFolderChangedEvent(IEvent):
 
     __uuid__ = "B66349B5-3534-4239-B2DE-8E1535D94C0B"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_shared_folder_changed
 
     @property
@@ -35900,6 +36055,7 @@ class IRuntimeErrorEvent(IEvent):
 
     __uuid__ = "883DD18B-0721-4CDE-867C-1A82ABAF914C"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_runtime_error
 
     @property
@@ -35934,6 +36090,7 @@ class IEventSourceChangedEvent(IEvent):
 
     __uuid__ = "e7932cb8-f6d4-4ab6-9cbf-558eb8959a6a"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_event_source_changed
 
     @property
@@ -35961,6 +36118,7 @@ class IExtraDataChangedEvent(IEvent):
 
     __uuid__ = "024F00CE-6E0B-492A-A8D0-968472A94DC7"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_extra_data_changed
 
     @property
@@ -35996,6 +36154,7 @@ class IVetoEvent(IEvent):
 
     __uuid__ = "7c5e945f-2354-4267-883f-2f417d216519"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     def add_veto(self, reason):
         """Adds a veto on this event.
@@ -36006,7 +36165,7 @@ class IVetoEvent(IEvent):
         """
         if not isinstance(reason, basestring):
             raise TypeError("reason can only be an instance of type basestring")
-        self._call("addVeto", in_p=[reason])
+        self._call("addVeto", in_p=(reason,))
 
     def is_vetoed(self):
         """If this event was vetoed.
@@ -36037,7 +36196,7 @@ class IVetoEvent(IEvent):
         """
         if not isinstance(reason, basestring):
             raise TypeError("reason can only be an instance of type basestring")
-        self._call("addApproval", in_p=[reason])
+        self._call("addApproval", in_p=(reason,))
 
     def is_approved(self):
         """If this event was approved.
@@ -36068,6 +36227,7 @@ class IExtraDataCanChangeEvent(IVetoEvent):
 
     __uuid__ = "245d88bd-800a-40f8-87a6-170d02249a55"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_extra_data_can_change
 
     @property
@@ -36111,6 +36271,7 @@ class ICanShowWindowEvent(IVetoEvent):
 
     __uuid__ = "adf292b0-92c9-4a77-9d35-e058b39fe0b9"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_can_show_window
 
     @property
@@ -36151,6 +36312,7 @@ class IShowWindowEvent(IEvent):
 
     __uuid__ = "B0A0904D-2F05-4D28-855F-488F96BAD2B2"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_show_window
 
     @property
@@ -36178,6 +36340,7 @@ class INATRedirectEvent(IMachineEvent):
 
     __uuid__ = "24eef068-c380-4510-bc7c-19314a7352f1"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_nat_redirect
 
     @property
@@ -36256,6 +36419,7 @@ class IHostPCIDevicePlugEvent(IMachineEvent):
 
     __uuid__ = "a0bad6df-d612-47d3-89d4-db3992533948"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_host_pci_device_plug
 
     @property
@@ -36300,6 +36464,7 @@ class IVBoxSVCAvailabilityChangedEvent(IEvent):
 
     __uuid__ = "97c78fcd-d4fc-485f-8613-5af88bfcfcdc"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_v_box_svc_availability_changed
 
     @property
@@ -36318,6 +36483,7 @@ class IBandwidthGroupChangedEvent(IEvent):
 
     __uuid__ = "334df94a-7556-4cbc-8c04-043096b02d82"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_bandwidth_group_changed
 
     @property
@@ -36336,6 +36502,7 @@ class IGuestMonitorChangedEvent(IEvent):
 
     __uuid__ = "0f7b8a22-c71f-4a36-8e5f-a77d01d76090"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_guest_monitor_changed
 
     @property
@@ -36398,6 +36565,7 @@ class IGuestUserStateChangedEvent(IEvent):
 
     __uuid__ = "39b4e759-1ec0-4c0f-857f-fbe2a737a256"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_guest_user_state_changed
 
     @property
@@ -36444,6 +36612,7 @@ class IStorageDeviceChangedEvent(IEvent):
 
     __uuid__ = "232e9151-ae84-4b8e-b0f3-5c20c35caac9"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_storage_device_changed
 
     @property
@@ -36476,6 +36645,7 @@ class INATNetworkChangedEvent(IEvent):
 
     __uuid__ = "101ae042-1a29-4a19-92cf-02285773f3b5"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_nat_network_changed
 
     @property
@@ -36492,6 +36662,7 @@ class INATNetworkStartStopEvent(INATNetworkChangedEvent):
 
     __uuid__ = "269d8f6b-fa1e-4cee-91c7-6d8496bea3c1"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_nat_network_start_stop
 
     @property
@@ -36508,6 +36679,7 @@ class INATNetworkAlterEvent(INATNetworkChangedEvent):
 
     __uuid__ = "d947adf5-4022-dc80-5535-6fb116815604"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_nat_network_alter
 
     @property
@@ -36522,6 +36694,7 @@ class INATNetworkCreationDeletionEvent(INATNetworkAlterEvent):
 
     __uuid__ = "8d984a7e-b855-40b8-ab0c-44d3515b4528"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_nat_network_creation_deletion
 
     @property
@@ -36536,6 +36709,7 @@ class INATNetworkSettingEvent(INATNetworkAlterEvent):
 
     __uuid__ = "9db3a9e6-7f29-4aae-a627-5a282c83092c"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_nat_network_setting
 
     @property
@@ -36574,6 +36748,7 @@ class INATNetworkPortForwardEvent(INATNetworkAlterEvent):
 
     __uuid__ = "2514881b-23d0-430a-a7ff-7ed7f05534bc"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_nat_network_port_forward
 
     @property
@@ -36630,6 +36805,7 @@ class IHostNameResolutionConfigurationChangeEvent(IEvent):
 
     __uuid__ = "f9b9e1cf-cb63-47a1-84fb-02c4894b89a9"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_host_name_resolution_configuration_change
 
     @property
@@ -36646,6 +36822,7 @@ class IProgressEvent(IEvent):
 
     __uuid__ = "daaf9016-1f04-4191-aa2f-1fac9646ae4c"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def progress_id(self):
@@ -36663,6 +36840,7 @@ class IProgressPercentageChangedEvent(IProgressEvent):
 
     __uuid__ = "f05d7e60-1bcf-4218-9807-04e036cc70f1"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_progress_percentage_changed
 
     @property
@@ -36681,6 +36859,7 @@ class IProgressTaskCompletedEvent(IProgressEvent):
 
     __uuid__ = "a5bbdb7d-8ce7-469f-a4c2-6476f581ff72"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_progress_task_completed
 
     @property
@@ -36697,6 +36876,7 @@ class ICursorPositionChangedEvent(IEvent):
 
     __uuid__ = "6f302674-c927-11e7-b788-33c248e71fc7"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_cursor_position_changed
 
     @property
@@ -36731,6 +36911,7 @@ class IGuestAdditionsStatusChangedEvent(IEvent):
 
     __uuid__ = "a443da5b-aa82-4720-bc84-bd097b2b13b8"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_guest_additions_status_changed
 
     @property
@@ -36773,6 +36954,7 @@ class IGuestMonitorInfoChangedEvent(IEvent):
 
     __uuid__ = "0b3cdeb2-808e-11e9-b773-133d9330f849"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_guest_monitor_info_changed
 
     @property
@@ -36794,6 +36976,7 @@ class IStringArray(Interface):
 
     __uuid__ = "3890b2c8-604d-11e9-92d3-53cb473db9fb"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def values(self):
@@ -36807,6 +36990,7 @@ class IFormValue(Interface):
 
     __uuid__ = "67c50afe-3e78-11e9-b25e-7768f80c0e07"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def type_p(self):
@@ -36856,6 +37040,7 @@ class IBooleanFormValue(IFormValue):
 
     __uuid__ = "4f4adcf6-3e87-11e9-8af2-576e84223953"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     def get_selected(self):
         """
@@ -36876,7 +37061,7 @@ class IBooleanFormValue(IFormValue):
         """
         if not isinstance(selected, bool):
             raise TypeError("selected can only be an instance of type bool")
-        progress = self._call("setSelected", in_p=[selected])
+        progress = self._call("setSelected", in_p=(selected,))
         progress = IProgress(progress)
         return progress
 
@@ -36889,6 +37074,7 @@ class IRangedIntegerFormValue(IFormValue):
 
     __uuid__ = "b31c4052-7bdc-11e9-8bc2-8ffdb8b19219"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def suffix(self):
@@ -36930,7 +37116,7 @@ class IRangedIntegerFormValue(IFormValue):
         """
         if not isinstance(value, baseinteger):
             raise TypeError("value can only be an instance of type baseinteger")
-        progress = self._call("setInteger", in_p=[value])
+        progress = self._call("setInteger", in_p=(value,))
         progress = IProgress(progress)
         return progress
 
@@ -36944,6 +37130,7 @@ class IStringFormValue(IFormValue):
 
     __uuid__ = "cb6f0f2c-8384-11e9-921d-8b984e28a686"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def multiline(self):
@@ -36970,7 +37157,7 @@ class IStringFormValue(IFormValue):
         """
         if not isinstance(text, basestring):
             raise TypeError("text can only be an instance of type basestring")
-        progress = self._call("setString", in_p=[text])
+        progress = self._call("setString", in_p=(text,))
         progress = IProgress(progress)
         return progress
 
@@ -36990,6 +37177,7 @@ class IChoiceFormValue(IFormValue):
 
     __uuid__ = "7191cf38-3e8a-11e9-825c-ab7b2cabce23"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def values(self):
@@ -37016,7 +37204,7 @@ class IChoiceFormValue(IFormValue):
         """
         if not isinstance(index, baseinteger):
             raise TypeError("index can only be an instance of type baseinteger")
-        progress = self._call("setSelectedIndex", in_p=[index])
+        progress = self._call("setSelectedIndex", in_p=(index,))
         progress = IProgress(progress)
         return progress
 
@@ -37026,6 +37214,7 @@ class IForm(Interface):
 
     __uuid__ = "d05c91e2-3e8a-11e9-8082-db8ae479ef87"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def values(self):
@@ -37043,7 +37232,7 @@ class IForm(Interface):
         """
         if not isinstance(field, basestring):
             raise TypeError("field can only be an instance of type basestring")
-        group = self._call("getFieldGroup", in_p=[field])
+        group = self._call("getFieldGroup", in_p=(field,))
         return group
 
     def apply_p(self):
@@ -37062,6 +37251,7 @@ class IVirtualSystemDescriptionForm(IForm):
 
     __uuid__ = "14c2db8a-3ee4-11e9-b872-cb9447aad965"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     def get_virtual_system_description(self):
         """
@@ -37079,6 +37269,7 @@ class ICloudNetworkGatewayInfo(Interface):
 
     __uuid__ = "89a63ace-0c65-11ea-ad23-0ff257c71a7f"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def public_ip(self):
@@ -37110,6 +37301,7 @@ class ICloudNetworkEnvironmentInfo(Interface):
 
     __uuid__ = "181dfb55-394d-44d3-9edb-af2c4472c40a"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def tunnel_network_id(self):
@@ -37128,6 +37320,7 @@ class ICloudMachine(Interface):
 
     __uuid__ = "8e3b08e6-a605-11ea-9edf-3bfdab40b718"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def id_p(self):
@@ -37325,7 +37518,7 @@ class ICloudMachine(Interface):
         """
         if not isinstance(ssh_public_key, basestring):
             raise TypeError("ssh_public_key can only be an instance of type basestring")
-        progress = self._call("createConsoleConnection", in_p=[ssh_public_key])
+        progress = self._call("createConsoleConnection", in_p=(ssh_public_key,))
         progress = IProgress(progress)
         return progress
 
@@ -37394,6 +37587,7 @@ class ICloudClient(Interface):
 
     __uuid__ = "5fa3a8db-1c4f-4cda-b8d4-7982ef60fefb"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     def get_export_description_form(self, description):
         """Returns a form for editing the virtual system description for
@@ -37413,7 +37607,7 @@ class ICloudClient(Interface):
             raise TypeError(
                 "description can only be an instance of type IVirtualSystemDescription"
             )
-        (progress, form) = self._call("getExportDescriptionForm", in_p=[description])
+        (progress, form) = self._call("getExportDescriptionForm", in_p=(description,))
         progress = IProgress(progress)
         form = IVirtualSystemDescriptionForm(form)
         return (progress, form)
@@ -37435,7 +37629,7 @@ class ICloudClient(Interface):
             )
         if not isinstance(progress, IProgress):
             raise TypeError("progress can only be an instance of type IProgress")
-        self._call("exportVM", in_p=[description, progress])
+        self._call("exportVM", in_p=(description, progress))
 
     def get_launch_description_form(self, description):
         """Virtual system description to be edited.
@@ -37454,7 +37648,7 @@ class ICloudClient(Interface):
             raise TypeError(
                 "description can only be an instance of type IVirtualSystemDescription"
             )
-        (progress, form) = self._call("getLaunchDescriptionForm", in_p=[description])
+        (progress, form) = self._call("getLaunchDescriptionForm", in_p=(description,))
         progress = IProgress(progress)
         form = IVirtualSystemDescriptionForm(form)
         return (progress, form)
@@ -37475,7 +37669,7 @@ class ICloudClient(Interface):
             raise TypeError(
                 "description can only be an instance of type IVirtualSystemDescription"
             )
-        progress = self._call("launchVM", in_p=[description])
+        progress = self._call("launchVM", in_p=(description,))
         progress = IProgress(progress)
         return progress
 
@@ -37497,7 +37691,7 @@ class ICloudClient(Interface):
             raise TypeError(
                 "description can only be an instance of type IVirtualSystemDescription"
             )
-        (progress, form) = self._call("getImportDescriptionForm", in_p=[description])
+        (progress, form) = self._call("getImportDescriptionForm", in_p=(description,))
         progress = IProgress(progress)
         form = IVirtualSystemDescriptionForm(form)
         return (progress, form)
@@ -37519,7 +37713,7 @@ class ICloudClient(Interface):
             )
         if not isinstance(progress, IProgress):
             raise TypeError("progress can only be an instance of type IProgress")
-        self._call("importInstance", in_p=[description, progress])
+        self._call("importInstance", in_p=(description, progress))
 
     def get_cloud_machine(self, id_p):
         """Create an object that represents a cloud machine with the
@@ -37536,7 +37730,7 @@ class ICloudClient(Interface):
         """
         if not isinstance(id_p, basestring):
             raise TypeError("id_p can only be an instance of type basestring")
-        machine = self._call("getCloudMachine", in_p=[id_p])
+        machine = self._call("getCloudMachine", in_p=(id_p,))
         machine = ICloudMachine(machine)
         return machine
 
@@ -37599,7 +37793,7 @@ class ICloudClient(Interface):
         """
         if not isinstance(instance_id, basestring):
             raise TypeError("instance_id can only be an instance of type basestring")
-        (progress, machine) = self._call("addCloudMachine", in_p=[instance_id])
+        (progress, machine) = self._call("addCloudMachine", in_p=(instance_id,))
         progress = IProgress(progress)
         machine = ICloudMachine(machine)
         return (progress, machine)
@@ -37623,7 +37817,7 @@ class ICloudClient(Interface):
             raise TypeError(
                 "description can only be an instance of type IVirtualSystemDescription"
             )
-        (progress, machine) = self._call("createCloudMachine", in_p=[description])
+        (progress, machine) = self._call("createCloudMachine", in_p=(description,))
         progress = IProgress(progress)
         machine = ICloudMachine(machine)
         return (progress, machine)
@@ -37652,7 +37846,7 @@ class ICloudClient(Interface):
                     "array can only contain objects of type CloudMachineState"
                 )
         (progress, return_names, return_ids) = self._call(
-            "listInstances", in_p=[machine_state]
+            "listInstances", in_p=(machine_state,)
         )
         progress = IProgress(progress)
         return_names = IStringArray(return_names)
@@ -37703,7 +37897,7 @@ class ICloudClient(Interface):
                     "array can only contain objects of type CloudImageState"
                 )
         (progress, return_names, return_ids) = self._call(
-            "listImages", in_p=[image_state]
+            "listImages", in_p=(image_state,)
         )
         progress = IProgress(progress)
         return_names = IStringArray(return_names)
@@ -37768,7 +37962,7 @@ class ICloudClient(Interface):
             raise TypeError(
                 "description can only be an instance of type IVirtualSystemDescription"
             )
-        progress = self._call("getInstanceInfo", in_p=[uid, description])
+        progress = self._call("getInstanceInfo", in_p=(uid, description))
         progress = IProgress(progress)
         return progress
 
@@ -37784,7 +37978,7 @@ class ICloudClient(Interface):
         """
         if not isinstance(uid, basestring):
             raise TypeError("uid can only be an instance of type basestring")
-        progress = self._call("startInstance", in_p=[uid])
+        progress = self._call("startInstance", in_p=(uid,))
         progress = IProgress(progress)
         return progress
 
@@ -37800,7 +37994,7 @@ class ICloudClient(Interface):
         """
         if not isinstance(uid, basestring):
             raise TypeError("uid can only be an instance of type basestring")
-        progress = self._call("pauseInstance", in_p=[uid])
+        progress = self._call("pauseInstance", in_p=(uid,))
         progress = IProgress(progress)
         return progress
 
@@ -37816,7 +38010,7 @@ class ICloudClient(Interface):
         """
         if not isinstance(uid, basestring):
             raise TypeError("uid can only be an instance of type basestring")
-        progress = self._call("terminateInstance", in_p=[uid])
+        progress = self._call("terminateInstance", in_p=(uid,))
         progress = IProgress(progress)
         return progress
 
@@ -37835,7 +38029,7 @@ class ICloudClient(Interface):
         for a in parameters[:10]:
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
-        progress = self._call("createImage", in_p=[parameters])
+        progress = self._call("createImage", in_p=(parameters,))
         progress = IProgress(progress)
         return progress
 
@@ -37859,7 +38053,7 @@ class ICloudClient(Interface):
         for a in parameters[:10]:
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
-        progress = self._call("exportImage", in_p=[image, parameters])
+        progress = self._call("exportImage", in_p=(image, parameters))
         progress = IProgress(progress)
         return progress
 
@@ -37883,7 +38077,7 @@ class ICloudClient(Interface):
         for a in parameters[:10]:
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
-        progress = self._call("importImage", in_p=[uid, parameters])
+        progress = self._call("importImage", in_p=(uid, parameters))
         progress = IProgress(progress)
         return progress
 
@@ -37899,7 +38093,7 @@ class ICloudClient(Interface):
         """
         if not isinstance(uid, basestring):
             raise TypeError("uid can only be an instance of type basestring")
-        progress = self._call("deleteImage", in_p=[uid])
+        progress = self._call("deleteImage", in_p=(uid,))
         progress = IProgress(progress)
         return progress
 
@@ -37919,7 +38113,7 @@ class ICloudClient(Interface):
         """
         if not isinstance(uid, basestring):
             raise TypeError("uid can only be an instance of type basestring")
-        (progress, info_array) = self._call("getImageInfo", in_p=[uid])
+        (progress, info_array) = self._call("getImageInfo", in_p=(uid,))
         progress = IProgress(progress)
         info_array = IStringArray(info_array)
         return (progress, info_array)
@@ -37945,7 +38139,7 @@ class ICloudClient(Interface):
         if not isinstance(ssh_public_key, basestring):
             raise TypeError("ssh_public_key can only be an instance of type basestring")
         (progress, gateway_info) = self._call(
-            "startCloudNetworkGateway", in_p=[network, ssh_public_key]
+            "startCloudNetworkGateway", in_p=(network, ssh_public_key)
         )
         progress = IProgress(progress)
         gateway_info = ICloudNetworkGatewayInfo(gateway_info)
@@ -38008,13 +38202,13 @@ class ICloudClient(Interface):
             raise TypeError("gateway_shape can only be an instance of type basestring")
         (progress, network_environment_info) = self._call(
             "setupCloudNetworkEnvironment",
-            in_p=[
+            in_p=(
                 tunnel_network_name,
                 tunnel_network_range,
                 gateway_os_name,
                 gateway_os_version,
                 gateway_shape,
-            ],
+            ),
         )
         progress = IProgress(progress)
         network_environment_info = ICloudNetworkEnvironmentInfo(
@@ -38030,6 +38224,7 @@ class ICloudProfile(Interface):
 
     __uuid__ = "b1d978b8-f7b7-4b05-900e-2a9253c00f51"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def name(self):
@@ -38071,7 +38266,7 @@ class ICloudProfile(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        value = self._call("getProperty", in_p=[name])
+        value = self._call("getProperty", in_p=(name,))
         return value
 
     def set_property(self, name, value):
@@ -38094,7 +38289,7 @@ class ICloudProfile(Interface):
             raise TypeError("name can only be an instance of type basestring")
         if not isinstance(value, basestring):
             raise TypeError("value can only be an instance of type basestring")
-        self._call("setProperty", in_p=[name, value])
+        self._call("setProperty", in_p=(name, value))
 
     def get_properties(self, names):
         """Returns values for a group of properties in one call.
@@ -38123,7 +38318,7 @@ class ICloudProfile(Interface):
         """
         if not isinstance(names, basestring):
             raise TypeError("names can only be an instance of type basestring")
-        (return_values, return_names) = self._call("getProperties", in_p=[names])
+        (return_values, return_names) = self._call("getProperties", in_p=(names,))
         return (return_values, return_names)
 
     def set_properties(self, names, values):
@@ -38162,7 +38357,7 @@ class ICloudProfile(Interface):
         for a in values[:10]:
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
-        self._call("setProperties", in_p=[names, values])
+        self._call("setProperties", in_p=(names, values))
 
     def remove(self):
         """Deletes a profile."""
@@ -38188,6 +38383,7 @@ class ICloudProvider(Interface):
 
     __uuid__ = "22363cfc-07da-41ec-ac4a-3dd99db35594"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def name(self):
@@ -38252,7 +38448,7 @@ class ICloudProvider(Interface):
         """
         if not isinstance(name, basestring):
             raise TypeError("name can only be an instance of type basestring")
-        description = self._call("getPropertyDescription", in_p=[name])
+        description = self._call("getPropertyDescription", in_p=(name,))
         return description
 
     def create_profile(self, profile_name, names, values):
@@ -38280,7 +38476,7 @@ class ICloudProvider(Interface):
         for a in values[:10]:
             if not isinstance(a, basestring):
                 raise TypeError("array can only contain objects of type basestring")
-        self._call("createProfile", in_p=[profile_name, names, values])
+        self._call("createProfile", in_p=(profile_name, names, values))
 
     def import_profiles(self):
         """Import the profiles from the original source"""
@@ -38304,7 +38500,7 @@ class ICloudProvider(Interface):
         """
         if not isinstance(profile_name, basestring):
             raise TypeError("profile_name can only be an instance of type basestring")
-        profile = self._call("getProfileByName", in_p=[profile_name])
+        profile = self._call("getProfileByName", in_p=(profile_name,))
         profile = ICloudProfile(profile)
         return profile
 
@@ -38328,6 +38524,7 @@ class ICloudProviderManager(Interface):
 
     __uuid__ = "9128800f-762e-4120-871c-a2014234a607"
     __wsmap__ = "managed"
+    __slots__ = ()
 
     @property
     def providers(self):
@@ -38347,7 +38544,7 @@ class ICloudProviderManager(Interface):
         """
         if not isinstance(provider_id, basestring):
             raise TypeError("provider_id can only be an instance of type basestring")
-        provider = self._call("getProviderById", in_p=[provider_id])
+        provider = self._call("getProviderById", in_p=(provider_id,))
         provider = ICloudProvider(provider)
         return provider
 
@@ -38361,7 +38558,7 @@ class ICloudProviderManager(Interface):
         """
         if not isinstance(provider_name, basestring):
             raise TypeError("provider_name can only be an instance of type basestring")
-        provider = self._call("getProviderByShortName", in_p=[provider_name])
+        provider = self._call("getProviderByShortName", in_p=(provider_name,))
         provider = ICloudProvider(provider)
         return provider
 
@@ -38375,7 +38572,7 @@ class ICloudProviderManager(Interface):
         """
         if not isinstance(provider_name, basestring):
             raise TypeError("provider_name can only be an instance of type basestring")
-        provider = self._call("getProviderByName", in_p=[provider_name])
+        provider = self._call("getProviderByName", in_p=(provider_name,))
         provider = ICloudProvider(provider)
         return provider
 
@@ -38390,6 +38587,7 @@ class ICloudProviderListChangedEvent(IEvent):
 
     __uuid__ = "a54d9cca-f23f-11ea-9755-efd0f1f792d9"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_cloud_provider_list_changed
 
     @property
@@ -38407,6 +38605,7 @@ class ICloudProviderRegisteredEvent(IEvent):
 
     __uuid__ = "e28e227a-f231-11ea-9641-9b500c6d5365"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_cloud_provider_registered
 
     @property
@@ -38435,6 +38634,7 @@ class ICloudProviderUninstallEvent(IEvent):
 
     __uuid__ = "f01f1066-f231-11ea-8eee-33bb2afb0b6e"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_cloud_provider_uninstall
 
     @property
@@ -38449,6 +38649,7 @@ class ICloudProfileRegisteredEvent(IEvent):
 
     __uuid__ = "6a5e65ba-eeb9-11ea-ae38-73242bc0f172"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_cloud_profile_registered
 
     @property
@@ -38475,6 +38676,7 @@ class ICloudProfileChangedEvent(IEvent):
 
     __uuid__ = "83795a4c-fce1-11ea-8a17-636028ae0be2"
     __wsmap__ = "managed"
+    __slots__ = ()
     id = VBoxEventType.on_cloud_profile_changed
 
     @property
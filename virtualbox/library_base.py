@@ -3,8 +3,14 @@
 import re
 import inspect
 import platform
+import sys
 import time
 
+try:
+    from collections.abc import Sequence
+except ImportError:
+    from collections import Sequence
+
 # Py2 and Py3 compatibility
 try:
     import __builtin__ as builtin
@@ -26,6 +32,11 @@ class EnumType(type):
 
     def __init__(cls, name, bases, dct):
         cls._value = None
+        cls._instances = {}
+        if sys.flags.optimize > 1:
+            # python -OO strips the docstrings, drop the (much larger)
+            # documentation of each enumeration value along with them.
+            cls._enums = [(label, v, None) for label, v, _ in cls._enums]
         cls._lookup_label = dict((v, l) for l, v, _ in cls._enums)
         cls._lookup_doc = dict((v, d) for _, v, d in cls._enums)
         for l, v, _ in cls._enums:
@@ -62,11 +73,23 @@ class Enum(object):
 
     _enums = {}
 
-    def __init__(self, value):
-        if value not in self._lookup_label:
+    def __new__(cls, value):
+        # Enumeration values are immutable, so hand out a single instance
+        # per value instead of building a new one on every attribute read.
+        try:
+            return cls._instances[value]
+        except KeyError:
+            pass
+        if value not in cls._lookup_label:
             raise ValueError("Can not find enumeration where value=%s" % value)
+        self = object.__new__(cls)
         self._value = value
-        self.__doc__ = self._lookup_doc[self._value]
+        self.__doc__ = cls._lookup_doc[value]
+        cls._instances[value] = self
+        return self
+
+    def __reduce__(self):
+        return (self.__class__, (self._value,))
 
     def __str__(self):
         if self._value is None:
@@ -100,6 +123,11 @@ class Enum(object):
     def __cmp__(self, k):
         return (int(self) > int(k)) - (int(self) < int(k))
 
+    # Enums compare equal to their integer value, hash them the same way so
+    # they can be used as dict keys (defining __eq__ drops __hash__ on py3).
+    def __hash__(self):
+        return hash(self._value)
+
     def __getitem__(self, k):
         return self.__class__[k]
 
@@ -126,11 +154,141 @@ class VBoxError(Exception):
         return "0x%x (%s)" % (self.value, self.msg)
 
 
+_uuid_re = re.compile(
+    r"\A(\{)?[0-9a-fA-F]{8}(-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}(?(1)\})\Z"
+)
+
+
+def check_uuid(value):
+    """Reject a malformed UUID string before it is sent to VirtualBox.
+
+    Raises the same E_INVALIDARG error VirtualBox would, without the
+    round-trip.  Values which are not strings are left to the caller's
+    type checks.
+    """
+    try:
+        if _uuid_re.match(value):
+            return
+    except TypeError:
+        return
+    errobj = vbox_error.get(0x80070057, VBoxError)()
+    errobj.value = 0x80070057
+    errobj.msg = "Invalid UUID %r" % (value,)
+    raise errobj
+
+
+class cached_property(object):
+    """cached_property wraps an Interface attribute getter whose value does
+    not change for the lifetime of the COM object.  The first read goes
+    through to VirtualBox, later reads are served from the wrapper's
+    attribute cache.
+
+    It accepts a plain getter function or an existing property, so an
+    extension class can write ``machine = cached_property(library.IConsole.machine)``.
+    """
+
+    def __init__(self, func):
+        if isinstance(func, property):
+            func = func.fget
+        self.func = func
+        self.__name__ = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            cache = instance._attr_cache
+        except AttributeError:
+            cache = instance._attr_cache = {}
+        try:
+            return cache[self.__name__]
+        except KeyError:
+            value = cache[self.__name__] = self.func(instance)
+            return value
+
+
+class InterfaceList(Sequence):
+    """InterfaceList is a read-only sequence over a safe array of COM
+    objects.  Each element is only wrapped in its Interface class the first
+    time it is accessed, so len(), truth tests and loops that stop early do
+    not pay for wrapping every element.
+    """
+
+    __slots__ = ("_raw", "_interface", "_wrapped")
+
+    def __init__(self, raw, interface):
+        self._raw = raw
+        self._interface = interface
+        self._wrapped = {}
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._raw)))]
+        if index < 0:
+            index += len(self._raw)
+        if not 0 <= index < len(self._raw):
+            raise IndexError("InterfaceList index out of range")
+        try:
+            return self._wrapped[index]
+        except KeyError:
+            value = self._wrapped[index] = self._interface(self._raw[index])
+            return value
+
+    # Compare and concatenate like the plain lists these used to be.
+    def __eq__(self, other):
+        if not isinstance(other, (InterfaceList, list)):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        if not isinstance(other, (InterfaceList, list)):
+            return NotImplemented
+        return list(self) != list(other)
+
+    __hash__ = None
+
+    def __add__(self, other):
+        if not isinstance(other, (InterfaceList, list)):
+            return NotImplemented
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        if not isinstance(other, list):
+            return NotImplemented
+        return other + list(self)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+def _cast_to_valuetype(value):
+    """Return the value the COM layer expects for a single parameter."""
+    if isinstance(value, Interface):
+        return value._i
+    elif isinstance(value, Enum):
+        return int(value)
+    else:
+        return value
+
+
 class Interface(object):
     """Interface objects provide a wrapper for the VirtualBox COM objects"""
 
+    # Wrappers hold on to their COM object and, once a cached_property has
+    # been read, a small attribute cache.  Keeping them free of a
+    # per-instance __dict__ keeps large enumerations (media, snapshots, ...)
+    # cheap.  Subclasses must declare their own (usually empty) __slots__.
+    __slots__ = ("_i", "_attr_cache", "__weakref__")
+
     def __init__(self, interface=None):
-        if isinstance(interface, Interface):
+        if isinstance(interface, self.__class__):
+            # Already wrapped as this interface, no need to ask COM to cast it.
+            self._i = interface._i
+        elif isinstance(interface, Interface):
             import virtualbox
 
             manager = virtualbox.Manager()
@@ -141,21 +299,30 @@ class Interface(object):
     def __nonzero__(self):
         return bool(self._i)
 
-    def _cast_to_valuetype(self, value):
-        def cast_to_valuetype(value):
-            if isinstance(value, Interface):
-                return value._i
-            elif isinstance(value, Enum):
-                return int(value)
-            else:
-                return value
+    def prefetch_attrs(self, *names):
+        """Read several attributes in one pass and return them as a dict.
 
+        Attributes backed by a :class:`cached_property` are stored in the
+        attribute cache as a side effect, so hot code can warm them up
+        front, e.g. ``console.prefetch_attrs("machine", "guest", "state")``.
+
+        The COM API has no call to fetch several attributes at once, so each
+        name still costs one round-trip the first time it is read.
+        """
+        return dict((name, getattr(self, name)) for name in names)
+
+    def _cast_to_valuetype(self, value):
         if isinstance(value, list):
-            return [cast_to_valuetype(a) for a in value]
+            return [_cast_to_valuetype(a) for a in value]
         else:
-            return cast_to_valuetype(value)
+            return _cast_to_valuetype(value)
 
     def _search_attr(self, name, prefix=None):
+        # Fast path: the plain name resolves straight away on every call
+        # that does not need the prefixed fallback or a retry.
+        attr = getattr(self._i, name, self)
+        if attr is not self:
+            return attr
         attr_names = [name]
         if prefix is not None:
             attr_names.append(prefix + name[0].upper() + name[1:])
@@ -192,9 +359,6 @@ class Interface(object):
             return setattr(self._i, name, value)
 
     def _call(self, name, in_p=None):
-        if in_p is None:
-            in_p = []
-        global vbox_error
         method = self._search_attr(name)
         if inspect.isfunction(method) or inspect.ismethod(method):
             return self._call_method(method, in_p=in_p)
@@ -202,9 +366,12 @@ class Interface(object):
             return method
 
     def _call_method(self, method, in_p=None):
-        if in_p is None:
-            in_p = []
-        in_params = [self._cast_to_valuetype(p) for p in in_p]
+        # Most calls are getters or take no arguments at all, skip building
+        # the parameter list for those.
+        if in_p:
+            in_params = [self._cast_to_valuetype(p) for p in in_p]
+        else:
+            in_params = ()
         try:
             ret = method(*in_params)
         except Exception as exc:
@@ -16,8 +16,10 @@ from .vbox import IVirtualBox  # noqa: F401
 from .session import ISession  # noqa: F401
 from .keyboard import IKeyboard  # noqa: F401
 from .guest_session import IGuestSession  # noqa: F401
+from .guest_file import IGuestFile  # noqa: F401
 from .guest import IGuest  # noqa: F401
 from .host import IHost  # noqa: F401
+from .host_network_interface import IHostNetworkInterface  # noqa: F401
 from .machine import IMachine  # noqa: F401
 from .progress import IProgress  # noqa: F401
 from .console import IConsole  # noqa: F401
@@ -27,6 +29,9 @@ from .process import IProcess  # noqa: F401
 from .guest_process import IGuestProcess  # noqa: F401
 from .appliance import IAppliance  # noqa: F401
 from .virtual_system_description import IVirtualSystemDescription  # noqa: F401
+from .vrde_server_info import IVRDEServerInfo  # noqa: F401
+from .system_properties import ISystemProperties  # noqa: F401
+from .guest_os_type import IGuestOSType  # noqa: F401
 
 
 # Replace original with extension
@@ -10,6 +10,7 @@ from virtualbox.library import VirtualSystemDescriptionValueType as DescValueTyp
 # Define some default params for create session
 class IAppliance(library.IAppliance):
     __doc__ = library.IAppliance.__doc__
+    __slots__ = ()
 
     # Extend read to wait and interpret the values into Description
     # objects.
@@ -3,11 +3,149 @@ Add helper code to the default IConsole class.
 """
 
 from __future__ import print_function
+import time
+
 from virtualbox import library
+from virtualbox.library_base import cached_property
+from virtualbox.library_base import check_uuid
+from virtualbox.library_base import InterfaceList
+
+
+_monotonic = getattr(time, "monotonic", time.time)
 
 
 class IConsole(library.IConsole):
     __doc__ = library.IConsole.__doc__
+    __slots__ = ("_missing_usb",)
+
+    # Number of seconds a failed find_usb_device_by_* lookup is remembered.
+    # Hot-plug pollers that ask again within this window get the
+    # VBoxErrorObjectNotFound straight back without a round-trip.
+    usb_miss_ttl = 0.5
+
+    # These sub-objects are fixed for the lifetime of the console, so only
+    # fetch and wrap them once.  vrde_server_info is left alone as it is a
+    # struct that holds a snapshot of the server's counters.
+    machine = cached_property(library.IConsole.machine)
+    guest = cached_property(library.IConsole.guest)
+    keyboard = cached_property(library.IConsole.keyboard)
+    mouse = cached_property(library.IConsole.mouse)
+    display = cached_property(library.IConsole.display)
+    debugger = cached_property(library.IConsole.debugger)
+    event_source = cached_property(library.IConsole.event_source)
+
+    # Only wrap the devices and folders callers actually look at.
+    @property
+    def usb_devices(self):
+        return InterfaceList(self._get_attr("USBDevices"), library.IUSBDevice)
+
+    usb_devices.__doc__ = library.IConsole.usb_devices.__doc__
+
+    @property
+    def remote_usb_devices(self):
+        ret = self._get_attr("remoteUSBDevices")
+        return InterfaceList(ret, library.IHostUSBDevice)
+
+    remote_usb_devices.__doc__ = library.IConsole.remote_usb_devices.__doc__
+
+    @property
+    def shared_folders(self):
+        return InterfaceList(self._get_attr("sharedFolders"), library.ISharedFolder)
+
+    shared_folders.__doc__ = library.IConsole.shared_folders.__doc__
+
+    @property
+    def attached_pci_devices(self):
+        ret = self._get_attr("attachedPCIDevices")
+        return InterfaceList(ret, library.IPCIDeviceAttachment)
+
+    attached_pci_devices.__doc__ = library.IConsole.attached_pci_devices.__doc__
+
+    @property
+    def attached_pci_addresses(self):
+        """Get the (host_address, guest_address) pair of every attached PCI
+        device.
+
+        PCI addresses are encoded as (bus << 8) | (device << 3) | function,
+        so filtering code can work on plain ints and keep no wrappers
+        around, i.e. ``[g for h, g in addrs if g >> 8 == bus]``.
+        """
+        return [(a.host_address, a.guest_address) for a in self.attached_pci_devices]
+
+    # Monitoring loops keep their device types as plain ints, accept those as
+    # well as DeviceType values.  Unknown values are rejected by VirtualBox.
+    def get_device_activity(self, type_p):
+        if not isinstance(type_p, list):
+            raise TypeError("type_p can only be an instance of type list")
+        for a in type_p[:10]:
+            if isinstance(a, bool) or not isinstance(
+                a, (library.DeviceType, library.baseinteger)
+            ):
+                raise TypeError(
+                    "array can only contain objects of type DeviceType or int"
+                )
+        activity = self._call("getDeviceActivity", in_p=(type_p,))
+        return [library.DeviceActivity(a) for a in activity]
+
+    get_device_activity.__doc__ = library.IConsole.get_device_activity.__doc__
+
+    def _find_usb_device(self, method, key):
+        now = _monotonic()
+        try:
+            missing = self._missing_usb
+        except AttributeError:
+            missing = self._missing_usb = {}
+        try:
+            miss = missing.get((method, key))
+        except TypeError:
+            # Unhashable key, let the generated type checks reject it.
+            return getattr(super(IConsole, self), method)(key)
+        if miss is not None:
+            expires, errno, msg = miss
+            if now < expires:
+                # Raise a fresh error each time, re-raising the stored one
+                # would keep growing (and holding on to) its traceback.
+                errobj = library.VBoxErrorObjectNotFound()
+                errobj.value = errno
+                errobj.msg = msg
+                raise errobj
+            del missing[(method, key)]
+        try:
+            return getattr(super(IConsole, self), method)(key)
+        except library.VBoxErrorObjectNotFound as exc:
+            missing[(method, key)] = (now + self.usb_miss_ttl, exc.value, exc.msg)
+            raise
+
+    def _forget_missing_usb(self):
+        try:
+            self._missing_usb.clear()
+        except AttributeError:
+            pass
+
+    def find_usb_device_by_address(self, name):
+        return self._find_usb_device("find_usb_device_by_address", name)
+
+    find_usb_device_by_address.__doc__ = (
+        library.IConsole.find_usb_device_by_address.__doc__
+    )
+
+    def find_usb_device_by_id(self, id_p):
+        check_uuid(id_p)
+        return self._find_usb_device("find_usb_device_by_id", id_p)
+
+    find_usb_device_by_id.__doc__ = library.IConsole.find_usb_device_by_id.__doc__
+
+    def attach_usb_device(self, id_p, capture_filename):
+        self._forget_missing_usb()
+        super(IConsole, self).attach_usb_device(id_p, capture_filename)
+
+    attach_usb_device.__doc__ = library.IConsole.attach_usb_device.__doc__
+
+    def detach_usb_device(self, id_p):
+        self._forget_missing_usb()
+        return super(IConsole, self).detach_usb_device(id_p)
+
+    detach_usb_device.__doc__ = library.IConsole.detach_usb_device.__doc__
 
     # TODO: Where do these events exist in 5x ?
     def register_on_network_adapter_changed(self, callback):
@@ -6,6 +6,7 @@ from virtualbox import library, events
 
 class IEventSource(library.IEventSource):
     __doc__ = library.IEventSource.__doc__
+    __slots__ = ()
 
     def register_callback(self, callback, event_type):
         """register a callback function for the provided given event_type"""
@@ -11,6 +11,7 @@ from virtualbox import library
 # Define some default params for create session
 class IGuest(library.IGuest):
     __doc__ = library.IGuest.__doc__
+    __slots__ = ()
 
     def create_session(
         self, user, password, domain="", session_name="pyvbox", timeout_ms=0
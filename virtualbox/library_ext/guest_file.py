@@ -0,0 +1,20 @@
+"""
+Add helper code to the default IGuestFile class.
+"""
+
+from virtualbox import library
+from virtualbox.library_base import cached_property
+
+
+class IGuestFile(library.IGuestFile):
+    __doc__ = library.IGuestFile.__doc__
+    __slots__ = ()
+
+    # How the file was opened does not change after creation.  offset and
+    # status do and are left uncached.
+    id_p = cached_property(library.IFile.id_p)
+    filename = cached_property(library.IFile.filename)
+    initial_size = cached_property(library.IFile.initial_size)
+    creation_mode = cached_property(library.IFile.creation_mode)
+    open_action = cached_property(library.IFile.open_action)
+    access_mode = cached_property(library.IFile.access_mode)
@@ -0,0 +1,19 @@
+"""
+Add helper code to the default IGuestOSType class.
+"""
+
+from virtualbox import library
+from virtualbox.library_base import cached_property
+
+
+class IGuestOSType(library.IGuestOSType):
+    __doc__ = library.IGuestOSType.__doc__
+    __slots__ = ()
+
+
+# A guest OS type only describes the defaults VirtualBox recommends for an
+# operating system, none of its attributes ever change.
+for _name, _attr in list(vars(library.IGuestOSType).items()):
+    if isinstance(_attr, property):
+        setattr(IGuestOSType, _name, cached_property(_attr))
+del _name, _attr
@@ -13,3 +13,4 @@ from virtualbox.library_ext import process
 
 class IGuestProcess(process.IProcess):
     __doc__ = library.IGuestProcess.__doc__
+    __slots__ = ()
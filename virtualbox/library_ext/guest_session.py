@@ -5,11 +5,58 @@ Add helper code to the default IGuestSession class.
 import time
 from virtualbox import library
 from virtualbox import utils
+from virtualbox.library_base import InterfaceList
+
+
+_monotonic = getattr(time, "monotonic", time.time)
 
 
 # Add context management to IGuestSession
 class IGuestSession(library.IGuestSession):
     __doc__ = library.IGuestSession.__doc__
+    __slots__ = ("_fs_queries",)
+
+    # Number of seconds the answer to a file system query is reused for the
+    # same arguments.  Code polling the guest for a file asks the same
+    # question back to back.  Any other call made through this session may
+    # change the guest file system and drops the stored answers.  Changes
+    # made by processes running in the guest, or through IGuestFile and
+    # IGuestProcess objects, do not go through this session and can be
+    # missed until the answer expires.  Set to 0 to always ask the guest.
+    fs_query_ttl = 0.1
+    fs_query_methods = frozenset(
+        [
+            "directoryExists",
+            "fileExists",
+            "fileQuerySize",
+            "fsObjExists",
+            "fsObjQueryInfo",
+            "symlinkExists",
+        ]
+    )
+
+    def _call(self, name, in_p=None):
+        if name not in self.fs_query_methods or not self.fs_query_ttl:
+            self._forget_fs_queries()
+            return super(IGuestSession, self)._call(name, in_p=in_p)
+        now = _monotonic()
+        try:
+            fs_queries = self._fs_queries
+        except AttributeError:
+            fs_queries = self._fs_queries = {}
+        key = (name,) + tuple(in_p or ())
+        hit = fs_queries.get(key)
+        if hit is not None and now < hit[0]:
+            return hit[1]
+        value = super(IGuestSession, self)._call(name, in_p=in_p)
+        fs_queries[key] = (now + self.fs_query_ttl, value)
+        return value
+
+    def _forget_fs_queries(self):
+        try:
+            self._fs_queries.clear()
+        except AttributeError:
+            pass
 
     def __enter__(self):
         return self
@@ -17,6 +64,25 @@ class IGuestSession(library.IGuestSession):
     def __exit__(self, *_):
         self.close()
 
+    # Only wrap the processes, directories and files callers look at.
+    @property
+    def processes(self):
+        return InterfaceList(self._get_attr("processes"), library.IGuestProcess)
+
+    processes.__doc__ = library.IGuestSession.processes.__doc__
+
+    @property
+    def directories(self):
+        return InterfaceList(self._get_attr("directories"), library.IGuestDirectory)
+
+    directories.__doc__ = library.IGuestSession.directories.__doc__
+
+    @property
+    def files(self):
+        return InterfaceList(self._get_attr("files"), library.IGuestFile)
+
+    files.__doc__ = library.IGuestSession.files.__doc__
+
     def execute(
         self,
         command,
@@ -107,9 +173,107 @@ class IGuestSession(library.IGuestSession):
 
         return process, b"".join(stdout), b"".join(stderr)
 
+    def environment_set_many(self, variables):
+        """Schedule several environment changes at once
+
+        Arguments:
+            variables - dict or iterable of (name, value) pairs.  A value of
+                        None schedules the variable for unsetting.
+
+        environment_schedule_set does one round-trip per variable.  This
+        reads environment_changes once, merges the new entries in and writes
+        the result back, i.e. two round-trips however many variables are
+        changed.
+        """
+        if hasattr(variables, "items"):
+            variables = variables.items()
+        names = set()
+        updates = []
+        for name, value in variables:
+            names.add(name)
+            updates.append(name if value is None else "%s=%s" % (name, value))
+        changes = [
+            change
+            for change in self.environment_changes
+            if change.split("=", 1)[0] not in names
+        ]
+        # The generated setter only accepts a string, set the array directly.
+        self._set_attr("environmentChanges", changes + updates)
+
+    def environment_unset_many(self, names):
+        """Schedule several environment variables for unsetting at once
+
+        Arguments:
+            names - iterable of variable names
+
+        See environment_set_many.
+        """
+        self.environment_set_many((name, None) for name in names)
+
+    def copy_from_bytes(self, source, timeout_ms=0, chunk_size=65536):
+        """Read a guest file straight into memory
+
+        Arguments:
+            source - path of the file in the guest
+            timeout_ms - timeout for each read, 0 waits for ever
+            chunk_size - number of bytes to ask for per read
+
+        copy_from goes through a host file and an IProgress which has to be
+        polled.  For small files it is cheaper to open the file in the guest
+        and read it back directly.
+
+        Return the content of the file as bytes
+        """
+        guest_file = self.file_open(
+            source,
+            library.FileAccessMode.read_only,
+            library.FileOpenAction.open_existing,
+            0,
+        )
+        chunks = []
+        try:
+            while True:
+                chunk = utils.to_bytes(guest_file.read(chunk_size, timeout_ms))
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        finally:
+            guest_file.close()
+        return b"".join(chunks)
+
+    def copy_to_guest_many(self, pairs, flags=None):
+        """Start copying several host files to the guest at once
+
+        Arguments:
+            pairs - iterable of (source, destination) paths, see
+                    file_copy_to_guest
+            flags - list of FileCopyFlag applied to every copy
+
+        All copies are started before any of them is waited for, so the
+        guest works on them side by side.  Pass the result to
+        IProgress.wait_for_all to wait for them together.
+
+        Return a list of IProgress objects, one per copy
+        """
+        if flags is None:
+            flags = []
+        return [
+            self.file_copy_to_guest(source, destination, flags)
+            for source, destination in pairs
+        ]
+
     def makedirs(self, path, mode=0x777):
         "Super-mkdir: create a leaf directory and all intermediate ones."
-        self.directory_create(path, mode, [library.DirectoryCreateFlag.parents])
+        self.directory_create(path, mode, [], parents=True)
+
+    # parents=True lets the guest create the missing intermediate
+    # directories in the same call instead of one call per component.
+    def directory_create(self, path, mode, flags, parents=False):
+        if parents and library.DirectoryCreateFlag.parents not in flags:
+            flags = list(flags) + [library.DirectoryCreateFlag.parents]
+        super(IGuestSession, self).directory_create(path, mode, flags)
+
+    directory_create.__doc__ = library.IGuestSession.directory_create.__doc__
 
     # Simplify calling directory_remove_recursive.  Set default flags to
     # content_and_dir if they have not yet been set.
@@ -142,8 +306,27 @@ class IGuestSession(library.IGuestSession):
 
     def path_exists(self, path, follow_symlinks=True):
         "test if path exists"
-        return (
-            self.file_exists(path, follow_symlinks)
-            or self.symlink_exists(path, follow_symlinks)
-            or self.directory_exists(path, follow_symlinks)
-        )
+        # One fsObjExists round-trip covers files, directories and symlinks.
+        return self.fs_obj_exists(path, follow_symlinks)
+
+    def stat_many(self, paths, follow_symlinks=True):
+        """Query information about several guest file system objects
+
+        Arguments:
+            paths - iterable of guest paths
+            follow_symlinks - passed on to fs_obj_query_info
+
+        Existence checks followed by a query cost two round-trips per path.
+        fs_obj_query_info answers both, so each path takes a single call.
+
+        Return a list with an IGuestFsObjInfo per path, or None where the
+        path does not exist
+        """
+        infos = []
+        for path in paths:
+            try:
+                info = self.fs_obj_query_info(path, follow_symlinks)
+            except library.VBoxErrorObjectNotFound:
+                info = None
+            infos.append(info)
+        return infos
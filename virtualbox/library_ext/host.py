@@ -1,9 +1,265 @@
+import time
+
 from virtualbox import library
+from virtualbox.library_base import cached_property
+from virtualbox.library_base import check_uuid
+from virtualbox.library_base import InterfaceList
 from virtualbox.library_ext.progress import IProgress
 
 
+_monotonic = getattr(time, "monotonic", time.time)
+
+
 class IHost(library.IHost):
     __doc__ = library.IHost.__doc__
+    __slots__ = ("_interfaces", "_interfaces_progress", "_processor", "_found")
+
+    # Number of seconds the list of host network interfaces is reused.
+    # Enumerating them is slow on most hosts, and while the list is fresh
+    # the find_host_network_interface_by_* lookups are answered from it.
+    # Creating or removing a host-only interface through this object drops
+    # the list, and nothing is cached again until that operation completes.
+    network_interfaces_ttl = 2.0
+
+    # Number of seconds the result of a find_host_*_drive or
+    # find_usb_device_by_* lookup is reused.  Set to 0 to always ask
+    # VirtualBox.
+    find_ttl = 1.0
+
+    # Fixed for as long as the host is up.  Online processor counts and
+    # available memory change and are always read.  The per-processor
+    # maximum speeds and descriptions are cached further down.
+    processor_count = cached_property(library.IHost.processor_count)
+    processor_core_count = cached_property(library.IHost.processor_core_count)
+    memory_size = cached_property(library.IHost.memory_size)
+    operating_system = cached_property(library.IHost.operating_system)
+    os_version = cached_property(library.IHost.os_version)
+
+    # Only wrap the drives, devices and filters callers actually look at.
+    @property
+    def dvd_drives(self):
+        return InterfaceList(self._get_attr("DVDDrives"), library.IMedium)
+
+    dvd_drives.__doc__ = library.IHost.dvd_drives.__doc__
+
+    @property
+    def floppy_drives(self):
+        return InterfaceList(self._get_attr("floppyDrives"), library.IMedium)
+
+    floppy_drives.__doc__ = library.IHost.floppy_drives.__doc__
+
+    @property
+    def usb_devices(self):
+        return InterfaceList(self._get_attr("USBDevices"), library.IHostUSBDevice)
+
+    usb_devices.__doc__ = library.IHost.usb_devices.__doc__
+
+    @property
+    def usb_device_filters(self):
+        ret = self._get_attr("USBDeviceFilters")
+        return InterfaceList(ret, library.IHostUSBDeviceFilter)
+
+    usb_device_filters.__doc__ = library.IHost.usb_device_filters.__doc__
+
+    def _network_interfaces_changing(self):
+        progress = getattr(self, "_interfaces_progress", None)
+        if progress is None:
+            return False
+        if progress.completed:
+            self._interfaces_progress = None
+            return False
+        return True
+
+    def _cached_network_interfaces(self):
+        if self._network_interfaces_changing():
+            return None
+        try:
+            expires, interfaces = self._interfaces
+        except AttributeError:
+            return None
+        if interfaces is None or _monotonic() >= expires:
+            return None
+        return interfaces
+
+    def _network_interfaces(self):
+        interfaces = self._cached_network_interfaces()
+        if interfaces is None:
+            ret = self._get_attr("networkInterfaces")
+            interfaces = [library.IHostNetworkInterface(a) for a in ret]
+            if not self._network_interfaces_changing():
+                expires = _monotonic() + self.network_interfaces_ttl
+                self._interfaces = (expires, interfaces)
+        return interfaces
+
+    def _forget_network_interfaces(self, progress=None):
+        self._interfaces = (0, None)
+        self._interfaces_progress = progress
+
+    @property
+    def network_interfaces(self):
+        return list(self._network_interfaces())
+
+    network_interfaces.__doc__ = library.IHost.network_interfaces.__doc__
+
+    # A single lookup is one round-trip.  Only answer from the cached list
+    # when the wrappers in it already hold the attribute, reading it on each
+    # of them would cost one round-trip per interface.
+    def _known_network_interface(self, attr, value):
+        for interface in self._cached_network_interfaces() or ():
+            cache = getattr(interface, "_attr_cache", None)
+            if cache and attr in cache and cache[attr] == value:
+                return interface
+        return None
+
+    def find_host_network_interface_by_name(self, name):
+        interface = self._known_network_interface("name", name)
+        if interface is not None:
+            return interface
+        return super(IHost, self).find_host_network_interface_by_name(name)
+
+    find_host_network_interface_by_name.__doc__ = (
+        library.IHost.find_host_network_interface_by_name.__doc__
+    )
+
+    def find_host_network_interface_by_id(self, id_p):
+        interface = self._known_network_interface("id_p", id_p)
+        if interface is not None:
+            return interface
+        check_uuid(id_p)
+        return super(IHost, self).find_host_network_interface_by_id(id_p)
+
+    find_host_network_interface_by_id.__doc__ = (
+        library.IHost.find_host_network_interface_by_id.__doc__
+    )
+
+    def _find(self, method, key):
+        now = _monotonic()
+        try:
+            found = self._found
+        except AttributeError:
+            found = self._found = {}
+        try:
+            hit = found.get((method, key))
+        except TypeError:
+            # Unhashable key, let the generated type checks reject it.
+            return getattr(super(IHost, self), method)(key)
+        if hit is not None and now < hit[0]:
+            return hit[1]
+        value = getattr(super(IHost, self), method)(key)
+        if self.find_ttl:
+            found[(method, key)] = (now + self.find_ttl, value)
+        return value
+
+    def _forget_found(self):
+        try:
+            self._found.clear()
+        except AttributeError:
+            pass
+
+    def find_host_dvd_drive(self, name):
+        return self._find("find_host_dvd_drive", name)
+
+    find_host_dvd_drive.__doc__ = library.IHost.find_host_dvd_drive.__doc__
+
+    def find_host_floppy_drive(self, name):
+        return self._find("find_host_floppy_drive", name)
+
+    find_host_floppy_drive.__doc__ = library.IHost.find_host_floppy_drive.__doc__
+
+    def find_usb_device_by_id(self, id_p):
+        check_uuid(id_p)
+        return self._find("find_usb_device_by_id", id_p)
+
+    find_usb_device_by_id.__doc__ = library.IHost.find_usb_device_by_id.__doc__
+
+    def find_usb_device_by_address(self, name):
+        return self._find("find_usb_device_by_address", name)
+
+    find_usb_device_by_address.__doc__ = (
+        library.IHost.find_usb_device_by_address.__doc__
+    )
+
+    def insert_usb_device_filter(self, position, filter_p):
+        self._forget_found()
+        super(IHost, self).insert_usb_device_filter(position, filter_p)
+
+    insert_usb_device_filter.__doc__ = library.IHost.insert_usb_device_filter.__doc__
+
+    def remove_usb_device_filter(self, position):
+        self._forget_found()
+        super(IHost, self).remove_usb_device_filter(position)
+
+    remove_usb_device_filter.__doc__ = library.IHost.remove_usb_device_filter.__doc__
+
+    # Processor speeds, descriptions and CPUID values do not change while
+    # the host is up, ask for each of them only once.
+    def _processor_value(self, method, *args):
+        try:
+            processor = self._processor
+        except AttributeError:
+            processor = self._processor = {}
+        key = (method,) + args
+        try:
+            return processor[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable arguments, let the generated type checks reject them.
+            return getattr(super(IHost, self), method)(*args)
+        value = getattr(super(IHost, self), method)(*args)
+        processor[key] = value
+        return value
+
+    def get_processor_speed(self, cpu_id):
+        return self._processor_value("get_processor_speed", cpu_id)
+
+    get_processor_speed.__doc__ = library.IHost.get_processor_speed.__doc__
+
+    def get_processor_description(self, cpu_id):
+        return self._processor_value("get_processor_description", cpu_id)
+
+    get_processor_description.__doc__ = (
+        library.IHost.get_processor_description.__doc__
+    )
+
+    def get_processor_cpuid_leaf(self, cpu_id, leaf, sub_leaf):
+        return self._processor_value("get_processor_cpuid_leaf", cpu_id, leaf, sub_leaf)
+
+    get_processor_cpuid_leaf.__doc__ = library.IHost.get_processor_cpuid_leaf.__doc__
+
+    @property
+    def processor_info(self):
+        """Get the (speed, description) pair of every host processor.
+
+        Speeds are in MHz, see :py:func:`get_processor_speed`.  The values
+        are cached, so only the first read costs two round-trips per
+        processor.
+        """
+        return [
+            (self.get_processor_speed(i), self.get_processor_description(i))
+            for i in range(self.processor_count)
+        ]
+
+    def get_processor_cpuid_leaves(self, cpu_id, leaves):
+        """Read several CPUID leaves of a host CPU.
+
+        in cpu_id of type int
+            Identifier of the CPU, see :py:func:`get_processor_cpuid_leaf`.
+
+        in leaves of type list
+            (leaf, sub_leaf) pairs to read.
+
+        return leaves of type dict
+            Maps each (leaf, sub_leaf) pair to its (eax, ebx, ecx, edx) values.
+
+        VirtualBox reads one leaf per call.  The values are cached on this
+        object, so only leaves which have not been read before cost a
+        round-trip.
+        """
+        return dict(
+            ((leaf, sub_leaf), self.get_processor_cpuid_leaf(cpu_id, leaf, sub_leaf))
+            for leaf, sub_leaf in leaves
+        )
 
     # Work around a bug where createHostOnlyNetworkInterface returns
     # host_interface and progress in the wrong order
@@ -11,8 +267,19 @@ class IHost(library.IHost):
         progress, host_interface = self._call("createHostOnlyNetworkInterface")
         host_interface = library.IHostNetworkInterface(host_interface)
         progress = IProgress(progress)
+        self._forget_network_interfaces(progress)
         return host_interface, progress
 
     create_host_only_network_interface.__doc__ = (
         library.IHost.create_host_only_network_interface.__doc__
     )
+
+    def remove_host_only_network_interface(self, id_p):
+        check_uuid(id_p)
+        progress = super(IHost, self).remove_host_only_network_interface(id_p)
+        self._forget_network_interfaces(progress)
+        return progress
+
+    remove_host_only_network_interface.__doc__ = (
+        library.IHost.remove_host_only_network_interface.__doc__
+    )
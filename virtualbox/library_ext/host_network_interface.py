@@ -0,0 +1,21 @@
+"""
+Add helper code to the default IHostNetworkInterface class.
+"""
+
+from virtualbox import library
+from virtualbox.library_base import cached_property
+
+
+class IHostNetworkInterface(library.IHostNetworkInterface):
+    __doc__ = library.IHostNetworkInterface.__doc__
+    __slots__ = ()
+
+    # Identity and hardware details do not change for the lifetime of the
+    # interface.  Addresses, DHCP and status do, so those are always read.
+    name = cached_property(library.IHostNetworkInterface.name)
+    short_name = cached_property(library.IHostNetworkInterface.short_name)
+    id_p = cached_property(library.IHostNetworkInterface.id_p)
+    hardware_address = cached_property(library.IHostNetworkInterface.hardware_address)
+    ipv6_supported = cached_property(library.IHostNetworkInterface.ipv6_supported)
+    medium_type = cached_property(library.IHostNetworkInterface.medium_type)
+    interface_type = cached_property(library.IHostNetworkInterface.interface_type)
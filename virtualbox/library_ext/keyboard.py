@@ -267,6 +267,7 @@ class KeyCallbackDecorator(object):
 
 class IKeyboard(library.IKeyboard):
     __doc__ = library.IKeyboard.__doc__
+    __slots__ = ()
 
     SCANCODES = SCANCODES
 
@@ -10,6 +10,7 @@ import shutil
 
 import virtualbox
 from virtualbox import library
+from virtualbox.library_base import check_uuid
 
 try:
     basestring
@@ -20,6 +21,7 @@ except NameError:
 # Extend and fix IMachine :)
 class IMachine(library.IMachine):
     __doc__ = library.IMachine.__doc__
+    __slots__ = ()
 
     def __str__(self):
         return self.name
@@ -203,7 +205,7 @@ class IMachine(library.IMachine):
         if not isinstance(location, basestring):
             raise TypeError("value is not an instance of basestring")
         # see https://github.com/mjdorma/pyvbox/issues/40
-        description = self._call("exportTo", in_p=[appliance, location])
+        description = self._call("exportTo", in_p=(appliance, location))
         return library.IVirtualSystemDescription(description)
 
     export_to.__doc__ = library.IMachine.export_to.__doc__
@@ -218,3 +220,56 @@ class IMachine(library.IMachine):
         return super(IMachine, self).restore_snapshot(snapshot)
 
     restore_snapshot.__doc__ = library.IMachine.restore_snapshot.__doc__
+
+    # Malformed snapshot ids are rejected here instead of by VirtualBox.
+    def delete_snapshot(self, id_p):
+        check_uuid(id_p)
+        return super(IMachine, self).delete_snapshot(id_p)
+
+    delete_snapshot.__doc__ = library.IMachine.delete_snapshot.__doc__
+
+    def delete_snapshot_and_all_children(self, id_p):
+        check_uuid(id_p)
+        return super(IMachine, self).delete_snapshot_and_all_children(id_p)
+
+    delete_snapshot_and_all_children.__doc__ = (
+        library.IMachine.delete_snapshot_and_all_children.__doc__
+    )
+
+    def delete_snapshot_range(self, start_id, end_id):
+        check_uuid(start_id)
+        check_uuid(end_id)
+        return super(IMachine, self).delete_snapshot_range(start_id, end_id)
+
+    delete_snapshot_range.__doc__ = library.IMachine.delete_snapshot_range.__doc__
+
+    def delete_snapshots(self, ids, timeout=-1):
+        """Delete several snapshots of this machine
+
+        Arguments:
+            ids - iterable of snapshot ids or ISnapshot objects
+            timeout - time in ms to wait for each deletion, see
+                      IProgress.wait_for_completion
+
+        VirtualBox has no bulk delete and refuses to start a deletion while
+        another one is running on the same machine, so the snapshots are
+        deleted one after the other.  Like IMachine.delete_snapshot this has
+        to be called on the mutable machine of a locked session.
+
+        Deletion stops early if a snapshot is not deleted within timeout or
+        its deletion fails, as the next one could not be started anyway.
+        The progress of that snapshot is the last one returned, check its
+        completed and result_code.
+
+        Return the list of IProgress objects, one per started deletion
+        """
+        progresses = []
+        for id_p in ids:
+            if isinstance(id_p, library.ISnapshot):
+                id_p = id_p.id_p
+            progress = self.delete_snapshot(id_p)
+            progress.wait_for_completion(timeout)
+            progresses.append(progress)
+            if not progress.completed or progress.result_code != 0:
+                break
+        return progresses
@@ -7,6 +7,7 @@ from virtualbox import library
 
 class IMouse(library.IMouse):
     __doc__ = library.IMouse.__doc__
+    __slots__ = ()
 
     def register_on_guest_mouse(self, callback):
         """Set the callback function to consume on guest mouse events.
@@ -3,10 +3,20 @@ Add helper code to the default IProcess class.
 """
 
 from virtualbox import library
+from virtualbox.library_base import cached_property
 
 
 class IProcess(library.IProcess):
     __doc__ = library.IProcess.__doc__
+    __slots__ = ()
+
+    # What was started does not change after creation.  pid is 0 until
+    # the process has started, status and exit_code change as it runs, so
+    # those are left uncached.
+    arguments = cached_property(library.IProcess.arguments)
+    environment = cached_property(library.IProcess.environment)
+    executable_path = cached_property(library.IProcess.executable_path)
+    name = cached_property(library.IProcess.name)
 
     def wait_for(self, wait_for, timeout_ms=0):
         return super(IProcess, self).wait_for(int(wait_for), timeout_ms)
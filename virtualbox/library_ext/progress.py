@@ -2,15 +2,59 @@
 Add helper code to the default IProgress class.
 """
 
+import time
+
 from virtualbox import library
 
 
+_monotonic = getattr(time, "monotonic", time.time)
+
+
 # Helper function for IProgress to print out a current progress state in __str__
 _progress_template = "(%(o)s/%(oc)s) %(od)s %(p)-3s%% (%(tr)s s remaining)"
 
 
 class IProgress(library.IProgress):
     __doc__ = library.IProgress.__doc__
+    __slots__ = ("_polled",)
+
+    # Number of seconds the attributes in polled_attrs are served from a
+    # local copy.  Polling loops (and __str__) read several of them per tick,
+    # this turns those reads into a single round-trip each per window.
+    # Set to 0 to always go to VirtualBox.
+    poll_ttl = 0.1
+    polled_attrs = frozenset(
+        [
+            "percent",
+            "timeRemaining",
+            "completed",
+            "canceled",
+            "operation",
+            "operationDescription",
+            "operationPercent",
+        ]
+    )
+
+    def _get_attr(self, name):
+        if name not in self.polled_attrs or not self.poll_ttl:
+            return super(IProgress, self)._get_attr(name)
+        now = _monotonic()
+        try:
+            polled = self._polled
+        except AttributeError:
+            polled = self._polled = {}
+        hit = polled.get(name)
+        if hit is not None and now < hit[0]:
+            return hit[1]
+        value = super(IProgress, self)._get_attr(name)
+        polled[name] = (now + self.poll_ttl, value)
+        return value
+
+    def _forget_polled(self):
+        try:
+            self._polled.clear()
+        except AttributeError:
+            pass
 
     def __str__(self):
         return _progress_template % dict(
@@ -23,5 +67,48 @@ class IProgress(library.IProgress):
 
     def wait_for_completion(self, timeout=-1):
         super(IProgress, self).wait_for_completion(timeout)
+        self._forget_polled()
 
     wait_for_completion.__doc__ = library.IProgress.wait_for_completion.__doc__
+
+    def wait_for_operation_completion(self, operation, timeout):
+        super(IProgress, self).wait_for_operation_completion(operation, timeout)
+        self._forget_polled()
+
+    wait_for_operation_completion.__doc__ = (
+        library.IProgress.wait_for_operation_completion.__doc__
+    )
+
+    def cancel(self):
+        super(IProgress, self).cancel()
+        self._forget_polled()
+
+    cancel.__doc__ = library.IProgress.cancel.__doc__
+
+    @staticmethod
+    def wait_for_all(progresses, timeout=-1, interval=0.05):
+        """Wait for several progress objects at once
+
+        Arguments:
+            progresses - iterable of IProgress objects
+            timeout - maximum time in ms to wait, -1 to wait until all of them
+                      have completed
+            interval - seconds to sleep between two polls
+
+        The operations run inside VirtualBox whichever way they are waited
+        for, so this is not faster than calling wait_for_completion on each
+        of them in turn.  It applies one timeout to the whole set and
+        reports which of them are still running when it expires.
+
+        Return the list of progress objects which have not completed yet
+        """
+        pending = list(progresses)
+        deadline = None
+        if timeout >= 0:
+            deadline = _monotonic() + timeout / 1000.0
+        while pending:
+            pending = [p for p in pending if not p.completed]
+            if not pending or (deadline is not None and _monotonic() >= deadline):
+                break
+            time.sleep(interval)
+        return pending
@@ -8,6 +8,7 @@ from virtualbox import library
 # Configure ISession bootstrap to build from vboxapi getSessionObject
 class ISession(library.ISession):
     __doc__ = library.ISession.__doc__
+    __slots__ = ()
 
     def __init__(self, interface=None, manager=None):
         if interface is not None:
@@ -0,0 +1,149 @@
+"""
+Add helper code to the default ISystemProperties class.
+"""
+
+from virtualbox import library
+from virtualbox.library_base import cached_property
+from virtualbox.library_base import InterfaceList
+
+
+class ISystemProperties(library.ISystemProperties):
+    __doc__ = library.ISystemProperties.__doc__
+    __slots__ = ()
+
+    # Limits of the VirtualBox installation, they never change while the
+    # server is running.
+    min_guest_ram = cached_property(library.ISystemProperties.min_guest_ram)
+    max_guest_ram = cached_property(library.ISystemProperties.max_guest_ram)
+    min_guest_vram = cached_property(library.ISystemProperties.min_guest_vram)
+    max_guest_vram = cached_property(library.ISystemProperties.max_guest_vram)
+    min_guest_cpu_count = cached_property(
+        library.ISystemProperties.min_guest_cpu_count
+    )
+    max_guest_cpu_count = cached_property(
+        library.ISystemProperties.max_guest_cpu_count
+    )
+    max_guest_monitors = cached_property(library.ISystemProperties.max_guest_monitors)
+    info_vd_size = cached_property(library.ISystemProperties.info_vd_size)
+    serial_port_count = cached_property(library.ISystemProperties.serial_port_count)
+    parallel_port_count = cached_property(
+        library.ISystemProperties.parallel_port_count
+    )
+    max_boot_position = cached_property(library.ISystemProperties.max_boot_position)
+    raw_mode_supported = cached_property(library.ISystemProperties.raw_mode_supported)
+    default_audio_driver = cached_property(
+        library.ISystemProperties.default_audio_driver
+    )
+
+    # The set of medium formats only changes with the installed backends.
+    @cached_property
+    def medium_formats(self):
+        return InterfaceList(self._get_attr("mediumFormats"), library.IMediumFormat)
+
+    medium_formats.__doc__ = library.ISystemProperties.medium_formats.__doc__
+
+    # The storage bus limits are fixed as well.  GUIs and provisioning
+    # scripts probe them back to back for every bus, so ask for each
+    # (method, arguments) pair only once.
+    def _storage_bus_value(self, method, *args):
+        # Shares the cached_property cache, the tuple keys cannot clash with
+        # the attribute names stored there.
+        try:
+            cache = self._attr_cache
+        except AttributeError:
+            cache = self._attr_cache = {}
+        # Keyed on the raw arguments, so a value of the wrong type misses
+        # and gets the generated TypeError.  Enums hash and compare equal to
+        # their integer value, so StorageBus.sata and 2 share an entry.
+        key = (method,) + args
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable arguments, let the generated type checks reject them.
+            return getattr(super(ISystemProperties, self), method)(*args)
+        value = getattr(super(ISystemProperties, self), method)(*args)
+        cache[key] = value
+        return value
+
+    def get_max_devices_per_port_for_storage_bus(self, bus):
+        return self._storage_bus_value("get_max_devices_per_port_for_storage_bus", bus)
+
+    get_max_devices_per_port_for_storage_bus.__doc__ = (
+        library.ISystemProperties.get_max_devices_per_port_for_storage_bus.__doc__
+    )
+
+    def get_min_port_count_for_storage_bus(self, bus):
+        return self._storage_bus_value("get_min_port_count_for_storage_bus", bus)
+
+    get_min_port_count_for_storage_bus.__doc__ = (
+        library.ISystemProperties.get_min_port_count_for_storage_bus.__doc__
+    )
+
+    def get_max_port_count_for_storage_bus(self, bus):
+        return self._storage_bus_value("get_max_port_count_for_storage_bus", bus)
+
+    get_max_port_count_for_storage_bus.__doc__ = (
+        library.ISystemProperties.get_max_port_count_for_storage_bus.__doc__
+    )
+
+    def get_max_instances_of_storage_bus(self, chipset, bus):
+        return self._storage_bus_value(
+            "get_max_instances_of_storage_bus", chipset, bus
+        )
+
+    get_max_instances_of_storage_bus.__doc__ = (
+        library.ISystemProperties.get_max_instances_of_storage_bus.__doc__
+    )
+
+    def get_device_types_for_storage_bus(self, bus):
+        value = self._storage_bus_value("get_device_types_for_storage_bus", bus)
+        return list(value)
+
+    get_device_types_for_storage_bus.__doc__ = (
+        library.ISystemProperties.get_device_types_for_storage_bus.__doc__
+    )
+
+    def describe_storage_bus(self, bus):
+        """Get the limits of a storage bus in one go.
+
+        in bus of type :class:`StorageBus`
+            The storage bus type to describe.
+
+        return description of type tuple
+            (max_devices_per_port, min_port_count, max_port_count,
+            device_types).
+
+        The values are cached, so describing the same bus again costs no
+        round-trip.
+        """
+        return (
+            self.get_max_devices_per_port_for_storage_bus(bus),
+            self.get_min_port_count_for_storage_bus(bus),
+            self.get_max_port_count_for_storage_bus(bus),
+            self.get_device_types_for_storage_bus(bus),
+        )
+
+    def get_storage_bus_capabilities(self):
+        """Get the storage limits of every supported chipset and bus.
+
+        return capabilities of type dict
+            Maps each (:class:`ChipsetType`, :class:`StorageBus`) pair to a
+            (max_devices_per_port, min_port_count, max_port_count,
+            max_instances) tuple.
+
+        Meant for tools which show the whole capability matrix.  Each limit
+        is cached, so only the first call walks the matrix over COM.
+        """
+        capabilities = {}
+        buses = self.supported_storage_buses
+        for chipset in self.supported_chipset_types:
+            for bus in buses:
+                capabilities[(chipset, bus)] = (
+                    self.get_max_devices_per_port_for_storage_bus(bus),
+                    self.get_min_port_count_for_storage_bus(bus),
+                    self.get_max_port_count_for_storage_bus(bus),
+                    self.get_max_instances_of_storage_bus(chipset, bus),
+                )
+        return capabilities
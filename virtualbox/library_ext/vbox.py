@@ -12,6 +12,7 @@ class IVirtualBox(library.IVirtualBox):
     assert_version = True
 
     __doc__ = library.IVirtualBox.__doc__
+    __slots__ = ()
 
     def __init__(self, interface=None, manager=None):
         if interface is not None:
@@ -14,6 +14,7 @@ except NameError:
 
 class IVirtualSystemDescription(library.IVirtualSystemDescription):
     __doc__ = library.IVirtualSystemDescription.__doc__
+    __slots__ = ()
 
     def set_final_value(self, description_type, value):
         """Set the value for the given description type.
@@ -0,0 +1,27 @@
+"""
+Add helper code to the default IVRDEServerInfo class.
+"""
+
+from virtualbox import library
+
+
+class IVRDEServerInfo(library.IVRDEServerInfo):
+    __doc__ = library.IVRDEServerInfo.__doc__
+    __slots__ = ()
+
+    @property
+    def byte_counters(self):
+        """Get the VRDE traffic counters in one go.
+
+        Monitoring code usually samples all four counters on every tick.
+        The COM API has no bulk getter for them, so they are read back to
+        back here and returned together as a tuple of
+        (bytes_sent, bytes_sent_total, bytes_received, bytes_received_total).
+        """
+        get_attr = self._get_attr
+        return (
+            get_attr("bytesSent"),
+            get_attr("bytesSentTotal"),
+            get_attr("bytesReceived"),
+            get_attr("bytesReceivedTotal"),
+        )